@@ -0,0 +1,312 @@
+"""Throughput and allocation benchmarks for the convective heat-transfer model.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_convective_heat_model --save benchmarks/baseline.json
+    python -m benchmarks.bench_convective_heat_model --compare benchmarks/baseline.json
+
+``--compare`` exits with status 1 and prints a per-benchmark diff when any
+benchmark drops more than ``--threshold`` below its baseline ops/sec.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from functools import partial
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from convective_heat_model import (
+    ConvectionBatchInputs,
+    ConvectionCase,
+    ConvectionInputs,
+    compute_air_properties,
+    compute_case,
+    compute_case_with_gradients,
+    compute_cases_batch,
+    generate_adaptive_velocity_sweep,
+    generate_grid_sweep,
+    generate_velocity_sweep,
+    iter_velocity_sweep,
+    summarize_velocity_sweep,
+)
+
+
+BASELINE_FORMAT_VERSION = 1
+DEFAULT_REGRESSION_THRESHOLD = 0.20
+DEFAULT_MIN_TIME_S = 0.2
+DEFAULT_REPEAT = 5
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    name: str
+    function: Callable[..., object]
+    # Builds the timed call's argument when the benchmark runs, so listing or
+    # filtering the suite never allocates large inputs.
+    setup: Callable[[], object] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    peak_allocated_bytes: int
+    retained_blocks: int
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    baseline_ops_per_sec: float
+    current_ops_per_sec: float
+
+    @property
+    def relative_change(self) -> float:
+        return self.current_ops_per_sec / self.baseline_ops_per_sec - 1.0
+
+
+def _base_inputs(case: ConvectionCase) -> ConvectionInputs:
+    return ConvectionInputs(
+        case=case,
+        velocity_m_per_s=5.0,
+        characteristic_length_m=0.025 if case == ConvectionCase.INTERNAL_TUBE else 0.3,
+        flow_length_m=1.0,
+        area_m2=0.5,
+        surface_temperature_c=80.0,
+        ambient_temperature_c=25.0,
+    )
+
+
+def _mixed_batch(size: int) -> ConvectionBatchInputs:
+    cases = list(ConvectionCase)
+    rng = np.random.default_rng(2024)
+    return ConvectionBatchInputs(
+        case=[cases[index % len(cases)] for index in range(size)],
+        velocities_m_per_s=rng.uniform(0.1, 40.0, size),
+        characteristic_lengths_m=rng.uniform(0.01, 0.5, size),
+        flow_lengths_m=rng.uniform(0.1, 2.0, size),
+        areas_m2=np.full(size, 0.5),
+        surface_temperatures_c=rng.uniform(40.0, 200.0, size),
+        ambient_temperatures_c=np.full(size, 25.0),
+    )
+
+
+def default_benchmarks() -> list[Benchmark]:
+    benchmarks = [
+        Benchmark(f"compute_case[{case.value}]", lambda inputs=_base_inputs(case): compute_case(inputs))
+        for case in ConvectionCase
+    ]
+    benchmarks.extend(
+        Benchmark(
+            f"compute_case_with_gradients[{case.value}]",
+            lambda inputs=_base_inputs(case): compute_case_with_gradients(inputs),
+        )
+        for case in ConvectionCase
+    )
+    benchmarks.append(Benchmark("compute_air_properties", lambda: compute_air_properties(80.0, 25.0)))
+
+    sweep_base = _base_inputs(ConvectionCase.FLAT_PLATE)
+    for points in (200, 10_000, 1_000_000):
+        benchmarks.append(
+            Benchmark(
+                f"generate_velocity_sweep[{points}]",
+                lambda points=points: generate_velocity_sweep(sweep_base, 0.1, 20.0, points),
+            )
+        )
+    benchmarks.append(
+        Benchmark(
+            "iter_velocity_sweep+summary[1000000]",
+            lambda: summarize_velocity_sweep(iter_velocity_sweep(sweep_base, 0.1, 20.0, 1_000_000)),
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            "generate_adaptive_velocity_sweep[200]",
+            lambda: generate_adaptive_velocity_sweep(sweep_base, 0.1, 20.0, max_points=200),
+        )
+    )
+
+    benchmarks.extend(
+        Benchmark(f"compute_cases_batch[{size}]", compute_cases_batch, setup=lambda size=size: _mixed_batch(size))
+        for size in (1_000, 100_000)
+    )
+    grid_axes = {
+        "velocity_m_per_s": np.linspace(0.1, 20.0, 500),
+        "characteristic_length_m": np.linspace(0.05, 1.0, 200),
+    }
+    benchmarks.append(
+        Benchmark(
+            "generate_grid_sweep[100000]",
+            lambda: generate_grid_sweep(sweep_base, grid_axes, max_workers=1),
+        )
+    )
+    return benchmarks
+
+
+def _time_calls(function: Callable[[], object], calls: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _measure_allocations(function: Callable[[], object]) -> tuple[int, int]:
+    # tracemalloc slows calls down considerably, so allocations are measured on
+    # a single separate call rather than during the timed loop. Peak bytes cover
+    # temporaries; retained blocks count what is still alive on return (the
+    # result included), which catches caches that grow per call.
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    retained_blocks = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+    return peak_bytes - start_bytes, retained_blocks
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    *,
+    min_time_s: float = DEFAULT_MIN_TIME_S,
+    repeat: int = DEFAULT_REPEAT,
+) -> BenchmarkResult:
+    function = benchmark.function if benchmark.setup is None else partial(benchmark.function, benchmark.setup())
+    function()
+    calls = 1
+    while (elapsed := _time_calls(function, calls)) < min_time_s:
+        calls = max(calls * 2, int(calls * min_time_s / max(elapsed, 1e-9)))
+    best_elapsed = min([elapsed, *(_time_calls(function, calls) for _ in range(repeat - 1))])
+    peak_allocated_bytes, retained_blocks = _measure_allocations(function)
+    return BenchmarkResult(
+        name=benchmark.name,
+        ops_per_sec=calls / best_elapsed,
+        peak_allocated_bytes=peak_allocated_bytes,
+        retained_blocks=retained_blocks,
+    )
+
+
+def save_baseline(path: Path, results: list[BenchmarkResult]) -> None:
+    payload = {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, BenchmarkResult]:
+    payload: Mapping[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("format_version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported baseline format {payload.get('format_version')!r}")
+    return {entry["name"]: BenchmarkResult(**entry) for entry in payload["results"]}
+
+
+def find_regressions(
+    baseline: Mapping[str, BenchmarkResult],
+    results: list[BenchmarkResult],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[Regression]:
+    regressions: list[Regression] = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is not None and result.ops_per_sec < reference.ops_per_sec * (1.0 - threshold):
+            regressions.append(Regression(result.name, reference.ops_per_sec, result.ops_per_sec))
+    return regressions
+
+
+def format_report(
+    results: list[BenchmarkResult],
+    baseline: Mapping[str, BenchmarkResult] | None = None,
+) -> str:
+    name_width = max([len("benchmark"), *(len(result.name) for result in results)])
+    header = f"{'benchmark':<{name_width}}  {'ops/sec':>14}  {'peak KiB/call':>13}  {'kept blocks':>11}"
+    if baseline is not None:
+        header += f"  {'baseline ops/sec':>16}  {'change':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        line = (
+            f"{result.name:<{name_width}}  {result.ops_per_sec:>14,.1f}  "
+            f"{result.peak_allocated_bytes / 1024:>13,.1f}  {result.retained_blocks:>11,d}"
+        )
+        reference = None if baseline is None else baseline.get(result.name)
+        if reference is not None:
+            change = result.ops_per_sec / reference.ops_per_sec - 1.0
+            line += f"  {reference.ops_per_sec:>16,.1f}  {change:>+8.1%}"
+        elif baseline is not None:
+            line += f"  {'(new)':>16}  {'':>8}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def format_regressions(regressions: list[Regression], threshold: float) -> str:
+    lines = [f"{len(regressions)} benchmark(s) regressed by more than {threshold:.0%}:"]
+    lines.extend(
+        f"  {regression.name}: {regression.baseline_ops_per_sec:,.1f} -> "
+        f"{regression.current_ops_per_sec:,.1f} ops/sec ({regression.relative_change:+.1%})"
+        for regression in regressions
+    )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the convective heat-transfer model hot paths.")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--save", type=Path, help="write the results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="JSON baseline to check for throughput regressions")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="allowed fractional ops/sec drop before a benchmark counts as regressed",
+    )
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME_S, help="seconds per timing run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timing runs per benchmark (best is kept)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    baseline = None if args.compare is None else load_baseline(args.compare)
+    benchmarks = [benchmark for benchmark in default_benchmarks() if args.filter in benchmark.name]
+    results = [run_benchmark(benchmark, min_time_s=args.min_time, repeat=args.repeat) for benchmark in benchmarks]
+
+    print(format_report(results, baseline))
+    if args.save is not None:
+        save_baseline(args.save, results)
+        print(f"Saved baseline to {args.save}")
+    if baseline is not None:
+        regressions = find_regressions(baseline, results, args.threshold)
+        if regressions:
+            print(format_regressions(regressions, args.threshold), file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
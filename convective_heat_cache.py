@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, fields, is_dataclass
+from enum import Enum
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from convective_heat_model import (
+    GRID_SHARD_POINTS,
+    MODEL_VERSION,
+    AirProperties,
+    ConvectionBatchInputs,
+    ConvectionBatchResult,
+    ConvectionCase,
+    ConvectionInputs,
+    ConvectionResult,
+    GridSweepResult,
+    VelocitySweepResult,
+    compute_case,
+    compute_cases_batch,
+    generate_grid_sweep,
+    generate_velocity_sweep,
+    get_air_property_provider,
+    get_correlation,
+)
+
+
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+def _update_digest(digest: Any, value: object) -> None:
+    # Every token is tagged and length-delimited so that distinct argument
+    # structures can never serialize to the same byte stream. Integers hash as
+    # floats so that ``velocity_m_per_s=5`` and ``5.0`` share an entry.
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        digest.update(f"a{array.dtype.str}{array.shape};".encode())
+        digest.update(array.tobytes())
+    elif isinstance(value, Enum):
+        _update_digest(digest, value.value)
+    elif is_dataclass(value) and not isinstance(value, type):
+        digest.update(f"d{type(value).__qualname__};".encode())
+        for field in fields(value):
+            _update_digest(digest, field.name)
+            _update_digest(digest, getattr(value, field.name))
+    elif isinstance(value, (bool, np.bool_)):
+        digest.update(b"b1;" if value else b"b0;")
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        digest.update(f"f{float(value).hex()};".encode())
+    elif isinstance(value, str):
+        encoded = value.encode()
+        digest.update(f"s{len(encoded)};".encode())
+        digest.update(encoded)
+    elif value is None:
+        digest.update(b"n;")
+    elif isinstance(value, Mapping):
+        digest.update(f"m{len(value)};".encode())
+        for key in sorted(value):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"l{len(value)};".encode())
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        raise TypeError(f"cannot derive a cache key from {type(value).__name__}")
+
+
+def _component_token(component: object) -> tuple[object, ...]:
+    # Components are identified by class plus their ``cache_token()``, which
+    # should return every setting that changes results (a table step, say).
+    # Components without one are assumed to have no such settings.
+    cache_token = getattr(component, "cache_token", None)
+    return (
+        f"{type(component).__module__}.{type(component).__qualname__}",
+        tuple(cache_token()) if cache_token is not None else (),
+    )
+
+
+def _model_token() -> tuple[object, ...]:
+    # Results also depend on the installed property provider and correlations,
+    # so swapping or reconfiguring one never serves stale data.
+    return (
+        MODEL_VERSION,
+        _component_token(get_air_property_provider()),
+        tuple(
+            (
+                *_component_token(correlation),
+                correlation.name,
+                correlation.reynolds_range,
+                correlation.prandtl_range,
+                correlation.regime_boundaries,
+            )
+            for correlation in map(get_correlation, ConvectionCase)
+        ),
+    )
+
+
+def cache_key(operation: str, *arguments: object) -> str:
+    digest = hashlib.sha256()
+    _update_digest(digest, (_model_token(), operation, arguments))
+    return digest.hexdigest()
+
+
+def _encode_case_result(result: ConvectionResult) -> bytes:
+    return json.dumps(asdict(result), separators=(",", ":")).encode()
+
+
+def _decode_case_result(payload: bytes) -> ConvectionResult:
+    values = json.loads(payload)
+    return ConvectionResult(air_properties=AirProperties(**values.pop("air_properties")), **values)
+
+
+def _reshape_batch_result(result: ConvectionBatchResult, shape: tuple[int, ...]) -> ConvectionBatchResult:
+    return ConvectionBatchResult(
+        reynolds_numbers=result.reynolds_numbers.reshape(shape),
+        prandtl_numbers=result.prandtl_numbers.reshape(shape),
+        nusselt_numbers=result.nusselt_numbers.reshape(shape),
+        heat_transfer_coefficients_w_per_m2k=result.heat_transfer_coefficients_w_per_m2k.reshape(shape),
+        heat_transfer_rates_w=result.heat_transfer_rates_w.reshape(shape),
+        warning_flags=result.warning_flags.reshape(shape),
+    )
+
+
+class ResultCache:
+    """Content-addressed model results in a SQLite file, evicted least-recently-used past a size bound."""
+
+    def __init__(self, path: str | Path, max_bytes: int = RESULT_CACHE_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(self.path)
+        self._connection.executescript(_CACHE_SCHEMA)
+
+    def __enter__(self) -> ResultCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def clear(self) -> None:
+        with self._connection:
+            self._connection.execute("DELETE FROM results")
+
+    def get(self, key: str) -> bytes | None:
+        row = self._connection.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._connection:
+            self._connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time_ns(), key))
+        return row[0]
+
+    def put(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, payload, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time_ns()),
+            )
+            excess = self._connection.execute("SELECT SUM(size) FROM results").fetchone()[0] - self.max_bytes
+            if excess <= 0:
+                return
+            evicted: list[tuple[str]] = []
+            for old_key, size in self._connection.execute("SELECT key, size FROM results ORDER BY last_used"):
+                evicted.append((old_key,))
+                excess -= size
+                if excess <= 0:
+                    break
+            self._connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def compute_case(self, inputs: ConvectionInputs) -> ConvectionResult:
+        key = cache_key("compute_case", inputs)
+        payload = self.get(key)
+        if payload is not None:
+            return _decode_case_result(payload)
+        result = compute_case(inputs)
+        self.put(key, _encode_case_result(result))
+        return result
+
+    def generate_velocity_sweep(
+        self,
+        base_inputs: ConvectionInputs,
+        v_min: float,
+        v_max: float,
+        points: int,
+    ) -> VelocitySweepResult:
+        key = cache_key("generate_velocity_sweep", base_inputs, v_min, v_max, points)
+        payload = self.get(key)
+        if payload is not None:
+            return VelocitySweepResult.from_buffer(payload)
+        result = generate_velocity_sweep(base_inputs, v_min, v_max, points)
+        self.put(key, result.to_bytes())
+        return result
+
+    def compute_cases_batch(
+        self,
+        batch: ConvectionBatchInputs,
+        *,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> ConvectionBatchResult:
+        key = cache_key("compute_cases_batch", batch, np.dtype(dtype).name)
+        payload = self.get(key)
+        if payload is not None:
+            return _reshape_batch_result(ConvectionBatchResult.from_buffer(payload), batch.velocities_m_per_s.shape)
+        result = compute_cases_batch(batch, dtype=dtype)
+        self.put(key, result.to_bytes())
+        return result
+
+    def generate_grid_sweep(
+        self,
+        base_inputs: ConvectionInputs,
+        axes: Mapping[str, npt.ArrayLike],
+        *,
+        max_workers: int | None = None,
+        shard_points: int = GRID_SHARD_POINTS,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> GridSweepResult:
+        axis_names = tuple(axes)
+        axis_values = tuple(np.asarray(axes[name], dtype=np.float64).ravel() for name in axis_names)
+        key = cache_key("generate_grid_sweep", base_inputs, axis_names, axis_values, np.dtype(dtype).name)
+        payload = self.get(key)
+        if payload is None:
+            result = generate_grid_sweep(
+                base_inputs,
+                dict(zip(axis_names, axis_values)),
+                max_workers=max_workers,
+                shard_points=shard_points,
+                dtype=dtype,
+            )
+            flat = _reshape_batch_result(
+                ConvectionBatchResult(
+                    reynolds_numbers=result.reynolds_numbers,
+                    prandtl_numbers=result.prandtl_numbers,
+                    nusselt_numbers=result.nusselt_numbers,
+                    heat_transfer_coefficients_w_per_m2k=result.heat_transfer_coefficients_w_per_m2k,
+                    heat_transfer_rates_w=result.heat_transfer_rates_w,
+                    warning_flags=result.warning_flags,
+                ),
+                (-1,),
+            )
+            self.put(key, flat.to_bytes())
+            return result
+        columns = _reshape_batch_result(
+            ConvectionBatchResult.from_buffer(payload),
+            tuple(values.size for values in axis_values),
+        )
+        return GridSweepResult(
+            axis_names=axis_names,
+            axis_values=axis_values,
+            reynolds_numbers=columns.reynolds_numbers,
+            prandtl_numbers=columns.prandtl_numbers,
+            nusselt_numbers=columns.nusselt_numbers,
+            heat_transfer_coefficients_w_per_m2k=columns.heat_transfer_coefficients_w_per_m2k,
+            heat_transfer_rates_w=columns.heat_transfer_rates_w,
+            warning_flags=columns.warning_flags,
+        )
+
+
+__all__ = [
+    "ResultCache",
+    "cache_key",
+]
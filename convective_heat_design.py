@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from enum import StrEnum
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from convective_heat_model import (
+    ConvectionBatchInputs,
+    ConvectionCase,
+    ConvectionInputs,
+    ConvectionResult,
+    ConvectionWarning,
+    FloatArray,
+    compute_case,
+    compute_cases_batch,
+    get_air_property_provider,
+    get_correlation,
+)
+
+
+DESIGN_VARIABLES = ("velocity_m_per_s", "characteristic_length_m", "flow_length_m")
+DESIGN_POPULATION_SIZE = 32
+DESIGN_MAX_GENERATIONS = 300
+DESIGN_TOLERANCE = 1.0e-8
+# Differential-evolution controls (DE/rand/1/bin); these defaults are robust
+# for the smooth, low-dimensional objectives this model produces.
+DESIGN_MUTATION = 0.7
+DESIGN_CROSSOVER = 0.9
+_DESIGN_BATCH_FIELDS: dict[str, str] = {
+    "velocity_m_per_s": "velocities_m_per_s",
+    "characteristic_length_m": "characteristic_lengths_m",
+    "flow_length_m": "flow_lengths_m",
+}
+
+
+class DesignObjective(StrEnum):
+    HEAT_TRANSFER_RATE = "heat_transfer_rate"
+    RATE_PER_FAN_POWER = "rate_per_fan_power"
+
+
+@dataclass(frozen=True, slots=True)
+class DesignConstraints:
+    """Feasibility rules; ``forbidden_warnings=~ConvectionWarning.NONE`` rejects any warning."""
+
+    required_regime: str | None = None
+    forbidden_warnings: ConvectionWarning = ConvectionWarning.NONE
+    max_fan_power_w: float | None = None
+
+
+@dataclass(slots=True)
+class DesignOptimum:
+    inputs: ConvectionInputs
+    result: ConvectionResult
+    objective_value: float
+    fan_power_w: float | None
+    feasible: bool
+    generations: int
+    evaluations: int
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _PopulationScore:
+    objective_values: FloatArray
+    violations: FloatArray
+    fan_powers_w: FloatArray | None
+
+
+def _derives_tube_area(base_inputs: ConvectionInputs, names: tuple[str, ...]) -> bool:
+    # A tube's wetted area follows its diameter and length, but only once the
+    # search moves one of them; otherwise the caller's area_m2 stands.
+    return base_inputs.case == ConvectionCase.INTERNAL_TUBE and bool(
+        {"characteristic_length_m", "flow_length_m"} & set(names)
+    )
+
+
+def _candidate_batch(
+    base_inputs: ConvectionInputs,
+    names: tuple[str, ...],
+    values: FloatArray,
+) -> ConvectionBatchInputs:
+    batch = ConvectionBatchInputs.from_base(
+        base_inputs,
+        **{_DESIGN_BATCH_FIELDS[name]: values[:, index] for index, name in enumerate(names)},
+    )
+    if not _derives_tube_area(base_inputs, names):
+        return batch
+    return replace(batch, areas_m2=math.pi * batch.characteristic_lengths_m * batch.flow_lengths_m)
+
+
+def _tube_fan_power_w(batch: ConvectionBatchInputs, reynolds_numbers: FloatArray, fan_efficiency: float) -> FloatArray:
+    if batch.auto_properties:
+        film_temperatures_c = 0.5 * (batch.surface_temperatures_c + batch.ambient_temperatures_c)
+        densities = get_air_property_provider().property_arrays(film_temperatures_c)[0]
+    else:
+        densities = np.full(reynolds_numbers.shape, batch.air_properties.rho_kg_per_m3)
+    # Darcy friction factor: 64/Re when laminar, Petukhov's smooth-tube law
+    # from Re = 3000 (the basis of Gnielinski), blended linearly in between.
+    laminar = 64.0 / reynolds_numbers
+    turbulent = (0.79 * np.log(np.maximum(reynolds_numbers, 3000.0)) - 1.64) ** -2
+    weights = np.clip((reynolds_numbers - 2300.0) / 700.0, 0.0, 1.0)
+    friction_factors = (1.0 - weights) * laminar + weights * turbulent
+    velocities = batch.velocities_m_per_s
+    diameters = batch.characteristic_lengths_m
+    pressure_drops = friction_factors * batch.flow_lengths_m / diameters * 0.5 * densities * velocities**2
+    return pressure_drops * velocities * 0.25 * math.pi * diameters**2 / fan_efficiency
+
+
+def _score_population(
+    base_inputs: ConvectionInputs,
+    names: tuple[str, ...],
+    values: FloatArray,
+    objective: DesignObjective,
+    constraints: DesignConstraints,
+    fan_efficiency: float,
+) -> _PopulationScore:
+    batch = _candidate_batch(base_inputs, names, values)
+    result = compute_cases_batch(batch)
+    rates = np.abs(result.heat_transfer_rates_w)
+    fan_powers = None
+    if objective == DesignObjective.RATE_PER_FAN_POWER or constraints.max_fan_power_w is not None:
+        fan_powers = _tube_fan_power_w(batch, result.reynolds_numbers, fan_efficiency)
+    objective_values = rates if objective == DesignObjective.HEAT_TRANSFER_RATE else rates / fan_powers
+
+    violations = np.zeros(len(result))
+    if constraints.required_regime is not None:
+        regime_names = get_correlation(base_inputs.case).regime_names(result.reynolds_numbers)
+        violations += regime_names != constraints.required_regime
+    if constraints.forbidden_warnings:
+        violations += (result.warning_flags & np.uint32(constraints.forbidden_warnings)) != 0
+    if constraints.max_fan_power_w is not None:
+        violations += np.maximum(fan_powers / constraints.max_fan_power_w - 1.0, 0.0)
+    return _PopulationScore(objective_values, violations, fan_powers)
+
+
+def _improves(challenger: _PopulationScore, incumbent: _PopulationScore) -> npt.NDArray[np.bool_]:
+    # Deb's feasibility rules: a feasible candidate beats an infeasible one,
+    # two infeasible candidates compare by violation and two feasible ones by
+    # objective, so no penalty weight has to be tuned.
+    both_feasible = (challenger.violations == 0.0) & (incumbent.violations == 0.0)
+    return np.where(
+        both_feasible,
+        challenger.objective_values >= incumbent.objective_values,
+        challenger.violations <= incumbent.violations,
+    )
+
+
+def optimize_design(
+    base_inputs: ConvectionInputs,
+    bounds: Mapping[str, tuple[float, float]],
+    *,
+    objective: DesignObjective | str = DesignObjective.HEAT_TRANSFER_RATE,
+    constraints: DesignConstraints = DesignConstraints(),
+    fan_efficiency: float = 1.0,
+    population_size: int = DESIGN_POPULATION_SIZE,
+    max_generations: int = DESIGN_MAX_GENERATIONS,
+    tolerance: float = DESIGN_TOLERANCE,
+    seed: int | np.random.SeedSequence | None = None,
+) -> DesignOptimum:
+    """Maximize ``objective`` over the bounded ``DESIGN_VARIABLES``.
+
+    For internal_tube cases whose bounds include ``characteristic_length_m``
+    or ``flow_length_m``, every candidate's ``area_m2`` is replaced by the
+    wetted area pi * D * L; otherwise ``base_inputs.area_m2`` is kept.
+    """
+    objective = DesignObjective(objective)
+    if not bounds:
+        raise ValueError("design optimization requires at least one bounded variable")
+    unknown_variables = sorted(set(bounds) - set(DESIGN_VARIABLES))
+    if unknown_variables:
+        raise ValueError(f"unsupported design variables: {', '.join(unknown_variables)}")
+    if any(not 0.0 < lower < upper for lower, upper in bounds.values()):
+        raise ValueError("design bounds must satisfy 0 < lower < upper")
+    uses_fan_power = objective == DesignObjective.RATE_PER_FAN_POWER or constraints.max_fan_power_w is not None
+    if uses_fan_power and base_inputs.case != ConvectionCase.INTERNAL_TUBE:
+        raise ValueError("fan power is only modelled for internal_tube cases")
+    if not 0.0 < fan_efficiency <= 1.0:
+        raise ValueError("fan_efficiency must be in (0, 1]")
+    if population_size < 4:
+        raise ValueError("population_size must be at least 4")
+
+    # Search in log space: velocities and lengths span decades and the
+    # correlations are close to power laws in them.
+    names = tuple(bounds)
+    value_lower = np.array([bounds[name][0] for name in names])
+    value_upper = np.array([bounds[name][1] for name in names])
+    lower, upper = np.log(value_lower), np.log(value_upper)
+
+    def to_values(points: FloatArray) -> FloatArray:
+        return np.clip(np.exp(points), value_lower, value_upper)
+
+    rng = np.random.default_rng(seed)
+    population = lower + rng.random((population_size, len(names))) * (upper - lower)
+    score = _score_population(base_inputs, names, to_values(population), objective, constraints, fan_efficiency)
+    evaluations = population_size
+
+    generations = 0
+    for generations in range(1, max_generations + 1):
+        # Each trial mixes three distinct other members, then takes every
+        # coordinate from the mutant with the crossover probability (at
+        # least one, so no trial equals its parent).
+        others = np.argsort(rng.random((population_size, population_size - 1)), axis=1)[:, :3]
+        others += others >= np.arange(population_size)[:, np.newaxis]
+        first, second, third = (population[others[:, column]] for column in range(3))
+        mutants = first + DESIGN_MUTATION * (second - third)
+        crossover = rng.random(population.shape) < DESIGN_CROSSOVER
+        crossover[np.arange(population_size), rng.integers(len(names), size=population_size)] = True
+        trials = np.clip(np.where(crossover, mutants, population), lower, upper)
+
+        trial_score = _score_population(
+            base_inputs, names, to_values(trials), objective, constraints, fan_efficiency
+        )
+        evaluations += population_size
+        accepted = _improves(trial_score, score)
+        population[accepted] = trials[accepted]
+        score = _PopulationScore(
+            objective_values=np.where(accepted, trial_score.objective_values, score.objective_values),
+            violations=np.where(accepted, trial_score.violations, score.violations),
+            fan_powers_w=None
+            if score.fan_powers_w is None
+            else np.where(accepted, trial_score.fan_powers_w, score.fan_powers_w),
+        )
+        if np.all(score.violations == 0.0):
+            spread = np.ptp(score.objective_values)
+            if spread <= tolerance * np.max(np.abs(score.objective_values)):
+                break
+
+    feasible = score.violations == 0.0
+    if np.any(feasible):
+        best = int(np.argmax(np.where(feasible, score.objective_values, -np.inf)))
+    else:
+        best = int(np.argmin(score.violations))
+    best_values = to_values(population[best])
+    best_inputs = replace(base_inputs, **{name: float(value) for name, value in zip(names, best_values)})
+    if _derives_tube_area(base_inputs, names):
+        best_inputs = replace(
+            best_inputs,
+            area_m2=math.pi * best_inputs.characteristic_length_m * best_inputs.flow_length_m,
+        )
+    return DesignOptimum(
+        inputs=best_inputs,
+        result=compute_case(best_inputs),
+        objective_value=float(score.objective_values[best]),
+        fan_power_w=None if score.fan_powers_w is None else float(score.fan_powers_w[best]),
+        feasible=bool(feasible[best]),
+        generations=generations,
+        evaluations=evaluations,
+    )
+
+
+__all__ = [
+    "DesignConstraints",
+    "DesignObjective",
+    "DesignOptimum",
+    "optimize_design",
+]
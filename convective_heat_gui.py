@@ -6,6 +6,8 @@ from __future__ import annotations
 # the relaxation to this GUI file only so the rest of the repo can stay strict.
 # pyright: reportMissingModuleSource=false, reportUnknownVariableType=false, reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownParameterType=false, reportUnknownLambdaType=false
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 import tkinter as tk
 from tkinter import ttk
@@ -18,11 +20,16 @@ from convective_heat_model import (
     ConvectionCase,
     ConvectionInputs,
     ConvectionResult,
+    VelocitySweepResult,
     compute_case,
-    generate_velocity_sweep,
+    generate_adaptive_velocity_sweep,
 )
 
 
+SWEEP_POLL_INTERVAL_MS = 16
+SWEEP_CACHE_SIZE = 32
+
+
 @dataclass(frozen=True, slots=True)
 class SliderWidgets:
     frame: ttk.Frame
@@ -86,6 +93,19 @@ class ConvectiveHeatGUI:
         self.root = root
         self.root.title("Convection Workbench: h e transferência de calor")
         self.pending_update_id: str | None = None
+        # Sweeps run on one worker thread so slider drags never wait on them.
+        # Each request takes a new generation; results from older generations
+        # are dropped, so only the latest inputs are ever drawn.
+        self.sweep_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="convection-sweep")
+        self.sweep_generation = 0
+        self.pending_sweep: Future[VelocitySweepResult] | None = None
+        # The sweep curve does not depend on the current velocity, so sweeps
+        # are cached under the inputs with velocity zeroed and a velocity drag
+        # only moves the markers.
+        self.sweep_cache: OrderedDict[ConvectionInputs, VelocitySweepResult] = OrderedDict()
+        self.sweep_key: ConvectionInputs | None = None
+        self.marker_state: tuple[ConvectionInputs, ConvectionResult] | None = None
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         self.case_var = tk.StringVar(value=ConvectionCase.FLAT_PLATE.value)
         self.auto_properties_var = tk.BooleanVar(value=True)
@@ -382,6 +402,20 @@ class ConvectiveHeatGUI:
             air_properties=manual_properties,
         )
 
+    def close(self) -> None:
+        """Drop queued sweeps and tear down the window."""
+        self.cancel_pending_sweep()
+        self.sweep_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def cancel_pending_sweep(self) -> None:
+        """Invalidate the in-flight sweep so its result is never drawn."""
+        self.sweep_generation += 1
+        if self.pending_sweep is not None:
+            self.pending_sweep.cancel()
+            self.pending_sweep = None
+            self.sweep_key = None
+
     def update_all(self) -> None:
         """Recompute the current state and refresh the plots."""
         self.pending_update_id = None
@@ -389,6 +423,7 @@ class ConvectiveHeatGUI:
             inputs = self.build_inputs()
             result = compute_case(inputs)
         except ValueError as error:
+            self.cancel_pending_sweep()
             self.populate_error_state(str(error))
             return
 
@@ -425,14 +460,69 @@ class ConvectiveHeatGUI:
             self.result_vars["warnings"].set("Dentro das faixas de validade preferidas para o caso atual.")
 
     def update_plots(self, inputs: ConvectionInputs, result: ConvectionResult) -> None:
-        """Update both response plots using the pure sweep helper."""
-        sweep = generate_velocity_sweep(inputs, v_min=0.1, v_max=20.0, points=200)
-        case_title = CASE_METADATA[inputs.case].title
+        """Move the markers and start a background sweep only when the curve changes."""
+        self.marker_state = (inputs, result)
+        sweep_key = inputs.with_velocity(0.0)
+        if sweep_key == self.sweep_key:
+            # The drawn curve is still valid; an in-flight one will place the
+            # markers itself when it lands.
+            if self.pending_sweep is None:
+                self.draw_markers()
+                self.canvas.draw_idle()
+            return
 
-        self.h_line.set_data(sweep.velocities_m_per_s, sweep.heat_transfer_coefficients_w_per_m2k)
+        self.cancel_pending_sweep()
+        self.sweep_key = sweep_key
+        cached_sweep = self.sweep_cache.get(sweep_key)
+        if cached_sweep is not None:
+            self.sweep_cache.move_to_end(sweep_key)
+            self.draw_plots(cached_sweep)
+            return
+        self.pending_sweep = self.sweep_executor.submit(
+            generate_adaptive_velocity_sweep,
+            sweep_key,
+            v_min=0.1,
+            v_max=20.0,
+            max_points=200,
+        )
+        self.root.after(SWEEP_POLL_INTERVAL_MS, self.poll_sweep, self.sweep_generation, self.pending_sweep)
+
+    def poll_sweep(self, generation: int, future: Future[VelocitySweepResult]) -> None:
+        """Hand a finished sweep back to the Tk thread unless newer inputs replaced it."""
+        if generation != self.sweep_generation:
+            return
+        if not future.done():
+            self.root.after(SWEEP_POLL_INTERVAL_MS, self.poll_sweep, generation, future)
+            return
+        self.pending_sweep = None
+        try:
+            sweep = future.result()
+        except ValueError as error:
+            self.sweep_key = None
+            self.populate_error_state(str(error))
+            return
+        if self.sweep_key is not None:
+            self.sweep_cache[self.sweep_key] = sweep
+            if len(self.sweep_cache) > SWEEP_CACHE_SIZE:
+                self.sweep_cache.popitem(last=False)
+        self.draw_plots(sweep)
+
+    def draw_markers(self) -> None:
+        """Place the operating-point markers at the latest computed state."""
+        if self.marker_state is None:
+            return
+        inputs, result = self.marker_state
         self.h_marker.set_offsets(
             [[inputs.velocity_m_per_s, result.heat_transfer_coefficient_w_per_m2k]]
         )
+        self.q_marker.set_offsets([[inputs.velocity_m_per_s, result.heat_transfer_rate_w]])
+
+    def draw_plots(self, sweep: VelocitySweepResult) -> None:
+        """Redraw both response plots from a completed sweep."""
+        case_title = CASE_METADATA[self.current_case()].title
+
+        self.h_line.set_data(sweep.velocities_m_per_s, sweep.heat_transfer_coefficients_w_per_m2k)
+        self.draw_markers()
         self.ax1.relim()
         self.ax1.autoscale_view()
         self.ax1.set_title(f"h vs velocidade — {case_title}")
@@ -442,7 +532,6 @@ class ConvectiveHeatGUI:
         self.ax1.legend(loc="best")
 
         self.q_line.set_data(sweep.velocities_m_per_s, sweep.heat_transfer_rates_w)
-        self.q_marker.set_offsets([[inputs.velocity_m_per_s, result.heat_transfer_rate_w]])
         self.ax2.relim()
         self.ax2.autoscale_view()
         self.ax2.set_title(f"q vs velocidade — {case_title}")
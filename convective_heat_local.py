@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from convective_heat_model import (
+    ConvectionCase,
+    ConvectionInputs,
+    ConvectionWarning,
+    FloatArray,
+    compute_case,
+)
+
+
+LOCAL_PROFILE_POINTS = 200
+FLAT_PLATE_TRANSITION_REYNOLDS = 5.0e5
+# Frössling's laminar front-stagnation series, Nu(θ) = 1.14 Re^0.5 Pr^0.4
+# (1 - (θ/90°)^3), holds up to boundary-layer separation near 80° for
+# subcritical crossflow (roughly 40 < Re < 2e5).
+CYLINDER_SEPARATION_ANGLE_DEG = 80.0
+CYLINDER_PROFILE_REYNOLDS_RANGE = (40.0, 2.0e5)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FlatPlateProfile:
+    positions_m: FloatArray
+    local_reynolds_numbers: FloatArray
+    local_nusselt_numbers: FloatArray
+    local_heat_transfer_coefficients_w_per_m2k: FloatArray
+    local_heat_fluxes_w_per_m2: FloatArray
+    transition_position_m: float
+    warning_flags: int
+
+    @property
+    def turbulent(self) -> npt.NDArray[np.bool_]:
+        return self.positions_m >= self.transition_position_m
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CylinderAngularProfile:
+    angles_deg: FloatArray
+    local_nusselt_numbers: FloatArray
+    local_heat_transfer_coefficients_w_per_m2k: FloatArray
+    local_heat_fluxes_w_per_m2: FloatArray
+    separation_angle_deg: float
+    warning_flags: int
+    # True when the wake recovery had to be clamped at Nu = 0, so the
+    # circumferential mean exceeds the correlation's average Nusselt number.
+    wake_clamped: bool = False
+
+
+def _profile_points(points: npt.ArrayLike | int, span: float, name: str) -> FloatArray:
+    if isinstance(points, (int, np.integer)):
+        if points <= 0:
+            raise ValueError(f"{name} count must be positive")
+        # Cell centres, so an N-point grid never lands on the leading edge.
+        return (np.arange(points) + 0.5) * (span / points)
+    values = np.asarray(points, dtype=np.float64).ravel()
+    if values.size == 0:
+        raise ValueError(f"{name} must not be empty")
+    return values
+
+
+def flat_plate_local_profile(
+    inputs: ConvectionInputs,
+    positions_m: npt.ArrayLike | int = LOCAL_PROFILE_POINTS,
+    *,
+    transition_reynolds_number: float = FLAT_PLATE_TRANSITION_REYNOLDS,
+) -> FlatPlateProfile:
+    if inputs.case != ConvectionCase.FLAT_PLATE:
+        raise ValueError("flat-plate profile requires a flat_plate case")
+    if transition_reynolds_number <= 0.0:
+        raise ValueError("transition_reynolds_number must be positive")
+    plate_length_m = inputs.characteristic_length_m
+    positions = _profile_points(positions_m, plate_length_m, "positions_m")
+    if np.any(positions <= 0.0):
+        raise ValueError("positions_m must be downstream of the leading edge")
+
+    # Properties and warnings come from the plate-average evaluation, so the
+    # profile shares its film temperature with compute_case.
+    average = compute_case(inputs)
+    properties = average.air_properties
+    reynolds_per_m = average.reynolds_number / plate_length_m
+    local_reynolds = reynolds_per_m * positions
+    pr_third = properties.prandtl_number ** (1.0 / 3.0)
+    turbulent = local_reynolds >= transition_reynolds_number
+    local_nusselt = np.where(
+        turbulent,
+        0.0296 * local_reynolds**0.8 * pr_third,
+        0.332 * local_reynolds**0.5 * pr_third,
+    )
+    coefficients = local_nusselt * properties.k_w_per_mk / positions
+    return FlatPlateProfile(
+        positions_m=positions,
+        local_reynolds_numbers=local_reynolds,
+        local_nusselt_numbers=local_nusselt,
+        local_heat_transfer_coefficients_w_per_m2k=coefficients,
+        local_heat_fluxes_w_per_m2=coefficients * (inputs.surface_temperature_c - inputs.ambient_temperature_c),
+        transition_position_m=transition_reynolds_number / reynolds_per_m,
+        warning_flags=average.warning_flags,
+    )
+
+
+def cylinder_angular_profile(
+    inputs: ConvectionInputs,
+    angles_deg: npt.ArrayLike | int = LOCAL_PROFILE_POINTS,
+) -> CylinderAngularProfile:
+    if inputs.case != ConvectionCase.CYLINDER_CROSSFLOW:
+        raise ValueError("angular profile requires a cylinder_crossflow case")
+    angles = _profile_points(angles_deg, 180.0, "angles_deg")
+    if np.any((angles < 0.0) | (angles > 180.0)):
+        raise ValueError("angles_deg must lie between 0 (stagnation) and 180 degrees")
+
+    average = compute_case(inputs)
+    reynolds_number = average.reynolds_number
+    front_scale = 1.14 * reynolds_number**0.5 * average.air_properties.prandtl_number**0.4
+    separation = CYLINDER_SEPARATION_ANGLE_DEG
+    separation_nusselt = front_scale * (1.0 - (separation / 90.0) ** 3)
+
+    # Past separation the wake is modelled as a linear recovery to a rear
+    # stagnation value chosen so that the circumferential mean reproduces the
+    # average Nusselt number of the registered cylinder correlation.
+    front_integral = front_scale * (separation - separation**4 / (4.0 * 90.0**3))
+    wake_span = 180.0 - separation
+    rear_nusselt = 2.0 * (180.0 * average.nusselt_number - front_integral) / wake_span - separation_nusselt
+    wake_clamped = rear_nusselt < 0.0
+    rear_nusselt = max(rear_nusselt, 0.0)
+    warning_flags = average.warning_flags
+    reynolds_min, reynolds_max = CYLINDER_PROFILE_REYNOLDS_RANGE
+    if not reynolds_min <= reynolds_number <= reynolds_max:
+        warning_flags |= ConvectionWarning.CORRELATION_REYNOLDS_RANGE.value
+
+    local_nusselt = np.where(
+        angles <= separation,
+        front_scale * (1.0 - (angles / 90.0) ** 3),
+        separation_nusselt + (rear_nusselt - separation_nusselt) * (angles - separation) / wake_span,
+    )
+    coefficients = local_nusselt * average.air_properties.k_w_per_mk / inputs.characteristic_length_m
+    return CylinderAngularProfile(
+        angles_deg=angles,
+        local_nusselt_numbers=local_nusselt,
+        local_heat_transfer_coefficients_w_per_m2k=coefficients,
+        local_heat_fluxes_w_per_m2=coefficients * (inputs.surface_temperature_c - inputs.ambient_temperature_c),
+        separation_angle_deg=separation,
+        warning_flags=warning_flags,
+        wake_clamped=wake_clamped,
+    )
+
+
+__all__ = [
+    "CylinderAngularProfile",
+    "FlatPlateProfile",
+    "cylinder_angular_profile",
+    "flat_plate_local_profile",
+]
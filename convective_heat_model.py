@@ -1,8 +1,36 @@
 from __future__ import annotations
 
+import argparse
+import atexit
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+import contextlib
+import csv
 from dataclasses import dataclass, field, replace
-from enum import StrEnum
+from enum import IntFlag, StrEnum
+from functools import lru_cache
+import heapq
+import io
+import itertools
+import json
 import math
+from multiprocessing.shared_memory import SharedMemory
+import os
+from pathlib import Path
+import struct
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Protocol
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+FloatArray = npt.NDArray[np.float64]
+WarningMaskArray = npt.NDArray[np.uint32]
 
 ATM_PRESSURE_PA = 101_325.0
 AIR_GAS_CONSTANT_J_PER_KG_K = 287.058
@@ -10,6 +38,38 @@ SUTHERLAND_CONSTANT_K = 110.4
 SUTHERLAND_FACTOR = 1.458e-6
 AUTO_PROPERTY_MIN_TEMP_C = -20.0
 AUTO_PROPERTY_MAX_TEMP_C = 200.0
+# Bump whenever a correlation, property law or result field changes meaning;
+# persisted result caches key on it.
+MODEL_VERSION = 1
+GRADIENT_VARIABLES = (
+    "velocity_m_per_s",
+    "characteristic_length_m",
+    "flow_length_m",
+    "area_m2",
+    "surface_temperature_c",
+    "ambient_temperature_c",
+)
+GRID_SHARD_POINTS = 262_144
+SWEEP_BLOCK_POINTS = 65_536
+CLI_CHUNK_ROWS = 50_000
+PROPERTY_CACHE_SIZE = 4096
+PROPERTY_TABLE_STEP_C = 1.0
+# Four-point cubic interpolation on the default 1 °C grid reproduces the exact
+# viscosity and conductivity laws to better than this relative error anywhere in
+# the automatic-property range (the analytic bound is 3/128 · h⁴ · max|f⁗|/f).
+PROPERTY_TABLE_RELATIVE_ERROR_BOUND = 1.0e-10
+# compute_cases_batch(dtype=np.float32) is held to this relative error of the
+# float64 path for Re, Pr, Nu, h and q over randomized cases of every built-in
+# correlation. Points within rounding of a regime or range boundary may
+# report different warning bits.
+FLOAT32_RELATIVE_ERROR_BOUND = 1.0e-5
+INVERSE_SOLVER_RTOL = 1.0e-10
+ADAPTIVE_SWEEP_TOLERANCE = 1.0e-3
+ADAPTIVE_SWEEP_MIN_INTERVAL_FRACTION = 1.0e-4
+INVERSE_SOLVER_MAX_ITERATIONS = 100
+# Setting this to 1 records compute_case stage timings for the whole process
+# and prints the report to stderr on exit.
+PROFILE_ENV_VAR = "CONVECTIVE_HEAT_PROFILE"
 
 
 class ConvectionCase(StrEnum):
@@ -19,6 +79,77 @@ class ConvectionCase(StrEnum):
     INTERNAL_TUBE = "internal_tube"
 
 
+class ConvectionWarning(IntFlag):
+    NONE = 0
+    AUTO_PROPERTIES_OUT_OF_RANGE = 1 << 0
+    FLAT_PLATE_PRANDTL_RANGE = 1 << 1
+    FLAT_PLATE_REYNOLDS_RANGE = 1 << 2
+    CHURCHILL_BERNSTEIN_RANGE = 1 << 3
+    WHITAKER_REYNOLDS_RANGE = 1 << 4
+    WHITAKER_PRANDTL_RANGE = 1 << 5
+    SPHERE_MANUAL_VISCOSITY_RATIO = 1 << 6
+    INTERNAL_TRANSITION = 1 << 7
+    GNIELINSKI_PRANDTL_RANGE = 1 << 8
+    GNIELINSKI_REYNOLDS_RANGE = 1 << 9
+    SHORT_TUBE = 1 << 10
+    CORRELATION_REYNOLDS_RANGE = 1 << 11
+    CORRELATION_PRANDTL_RANGE = 1 << 12
+
+
+_WARNING_MESSAGES: dict[ConvectionWarning, str] = {
+    ConvectionWarning.AUTO_PROPERTIES_OUT_OF_RANGE: (
+        "Automatic air-property model is being used outside its preferred temperature range."
+    ),
+    ConvectionWarning.FLAT_PLATE_PRANDTL_RANGE: "Flat-plate correlation is outside its recommended Prandtl-number range.",
+    ConvectionWarning.FLAT_PLATE_REYNOLDS_RANGE: (
+        "Flat-plate turbulent correlation is being used beyond its preferred Reynolds-number range."
+    ),
+    ConvectionWarning.CHURCHILL_BERNSTEIN_RANGE: (
+        "Churchill-Bernstein is outside its recommended Re·Pr applicability range."
+    ),
+    ConvectionWarning.WHITAKER_REYNOLDS_RANGE: (
+        "Whitaker sphere correlation is outside its recommended Reynolds-number range."
+    ),
+    ConvectionWarning.WHITAKER_PRANDTL_RANGE: (
+        "Whitaker sphere correlation is outside its recommended Prandtl-number range."
+    ),
+    ConvectionWarning.SPHERE_MANUAL_VISCOSITY_RATIO: (
+        "Manual property mode disables the free-stream / surface viscosity correction for the sphere correlation."
+    ),
+    ConvectionWarning.INTERNAL_TRANSITION: (
+        "Internal-flow result is in the transition range and should be treated as a low-confidence estimate."
+    ),
+    ConvectionWarning.GNIELINSKI_PRANDTL_RANGE: (
+        "Gnielinski correlation is outside its recommended Prandtl-number range."
+    ),
+    ConvectionWarning.GNIELINSKI_REYNOLDS_RANGE: (
+        "Gnielinski correlation is outside its recommended Reynolds-number range."
+    ),
+    ConvectionWarning.SHORT_TUBE: "Internal-flow turbulent estimate assumes a sufficiently long tube (L/D > 10).",
+    ConvectionWarning.CORRELATION_REYNOLDS_RANGE: "Selected correlation is outside its declared Reynolds-number range.",
+    ConvectionWarning.CORRELATION_PRANDTL_RANGE: "Selected correlation is outside its declared Prandtl-number range.",
+}
+
+
+def warning_messages(flags: int) -> list[str]:
+    return [message for flag, message in _WARNING_MESSAGES.items() if flags & flag]
+
+
+# Serialized results are a 16-byte header (magic, format version, column count,
+# row count) followed by contiguous little-endian columns (float values, then
+# any uint32 warning masks), so a file can be memory-mapped and viewed through
+# ``from_buffer`` without parsing. The magic also fixes the float width.
+_RESULT_HEADER = struct.Struct("<4sHHQ")
+_RESULT_FORMAT_VERSION = 1
+_VELOCITY_SWEEP_LAYOUTS: dict[bytes, tuple[str, ...]] = {
+    b"CHVS": ("<f8", "<f8", "<f8"),
+}
+_BATCH_RESULT_LAYOUTS: dict[bytes, tuple[str, ...]] = {
+    b"CHBR": ("<f8", "<f8", "<f8", "<f8", "<f8", "<u4"),
+    b"CHB4": ("<f4", "<f4", "<f4", "<f4", "<f4", "<u4"),
+}
+
+
 @dataclass(frozen=True, slots=True)
 class AirProperties:
     rho_kg_per_m3: float
@@ -61,26 +192,313 @@ class ConvectionResult:
     nusselt_number: float
     heat_transfer_coefficient_w_per_m2k: float
     heat_transfer_rate_w: float
-    warnings: list[str] = field(default_factory=list)
+    warning_flags: int = 0
     correlation_name: str = ""
     regime_name: str = ""
 
+    @property
+    def warnings(self) -> list[str]:
+        return warning_messages(self.warning_flags)
 
-@dataclass(frozen=True, slots=True)
+
+@dataclass(frozen=True, slots=True, eq=False)
 class VelocitySweepResult:
-    velocities_m_per_s: list[float]
-    heat_transfer_coefficients_w_per_m2k: list[float]
-    heat_transfer_rates_w: list[float]
+    velocities_m_per_s: FloatArray
+    heat_transfer_coefficients_w_per_m2k: FloatArray
+    heat_transfer_rates_w: FloatArray
+
+    def to_bytes(self) -> bytes:
+        return _pack_columns(
+            _VELOCITY_SWEEP_LAYOUTS,
+            (self.velocities_m_per_s, self.heat_transfer_coefficients_w_per_m2k, self.heat_transfer_rates_w),
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer) -> VelocitySweepResult:
+        velocities, coefficients, rates = _unpack_columns(buffer, _VELOCITY_SWEEP_LAYOUTS)
+        return cls(
+            velocities_m_per_s=velocities,
+            heat_transfer_coefficients_w_per_m2k=coefficients,
+            heat_transfer_rates_w=rates,
+        )
 
 
 @dataclass(frozen=True, slots=True)
-class _CorrelationOutcome:
+class VelocitySweepSummary:
+    points: int
+    min_heat_transfer_coefficient_w_per_m2k: float
+    max_heat_transfer_coefficient_w_per_m2k: float
+    velocity_at_max_heat_transfer_coefficient_m_per_s: float
+    min_heat_transfer_rate_w: float
+    max_heat_transfer_rate_w: float
+    velocity_at_max_heat_transfer_rate_m_per_s: float
+
+
+@dataclass(slots=True)
+class InverseSolution:
+    value: float
+    result: ConvectionResult
+    evaluations: int
+    inside_discontinuity: bool = False
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ConvectionBatchInputs:
+    case: ConvectionCase | Sequence[ConvectionCase]
+    velocities_m_per_s: FloatArray
+    characteristic_lengths_m: FloatArray
+    flow_lengths_m: FloatArray
+    areas_m2: FloatArray
+    surface_temperatures_c: FloatArray
+    ambient_temperatures_c: FloatArray
+    auto_properties: bool = True
+    air_properties: AirProperties | None = None
+    air_property_scale_factors: FloatArray | None = None
+
+    @classmethod
+    def from_base(
+        cls,
+        base_inputs: ConvectionInputs,
+        *,
+        velocities_m_per_s: npt.ArrayLike | None = None,
+        characteristic_lengths_m: npt.ArrayLike | None = None,
+        flow_lengths_m: npt.ArrayLike | None = None,
+        areas_m2: npt.ArrayLike | None = None,
+        surface_temperatures_c: npt.ArrayLike | None = None,
+        ambient_temperatures_c: npt.ArrayLike | None = None,
+    ) -> ConvectionBatchInputs:
+        columns = np.broadcast_arrays(
+            _float_column(velocities_m_per_s, base_inputs.velocity_m_per_s),
+            _float_column(characteristic_lengths_m, base_inputs.characteristic_length_m),
+            _float_column(flow_lengths_m, base_inputs.flow_length_m),
+            _float_column(areas_m2, base_inputs.area_m2),
+            _float_column(surface_temperatures_c, base_inputs.surface_temperature_c),
+            _float_column(ambient_temperatures_c, base_inputs.ambient_temperature_c),
+        )
+        return cls(
+            case=base_inputs.case,
+            velocities_m_per_s=columns[0],
+            characteristic_lengths_m=columns[1],
+            flow_lengths_m=columns[2],
+            areas_m2=columns[3],
+            surface_temperatures_c=columns[4],
+            ambient_temperatures_c=columns[5],
+            auto_properties=base_inputs.auto_properties,
+            air_properties=base_inputs.air_properties,
+        )
+
+    @classmethod
+    def from_inputs(cls, inputs: Iterable[ConvectionInputs]) -> ConvectionBatchInputs:
+        rows = list(inputs)
+        if not rows:
+            raise ValueError("batch inputs must contain at least one case")
+        first = rows[0]
+        if any(
+            row.auto_properties != first.auto_properties or row.air_properties != first.air_properties
+            for row in rows
+        ):
+            raise ValueError("batch inputs must share one property mode")
+        return cls(
+            case=[row.case for row in rows],
+            velocities_m_per_s=np.array([row.velocity_m_per_s for row in rows], dtype=np.float64),
+            characteristic_lengths_m=np.array([row.characteristic_length_m for row in rows], dtype=np.float64),
+            flow_lengths_m=np.array([row.flow_length_m for row in rows], dtype=np.float64),
+            areas_m2=np.array([row.area_m2 for row in rows], dtype=np.float64),
+            surface_temperatures_c=np.array([row.surface_temperature_c for row in rows], dtype=np.float64),
+            ambient_temperatures_c=np.array([row.ambient_temperature_c for row in rows], dtype=np.float64),
+            auto_properties=first.auto_properties,
+            air_properties=first.air_properties,
+        )
+
+    def __len__(self) -> int:
+        return int(self.velocities_m_per_s.size)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ConvectionBatchResult:
+    reynolds_numbers: FloatArray
+    prandtl_numbers: FloatArray
+    nusselt_numbers: FloatArray
+    heat_transfer_coefficients_w_per_m2k: FloatArray
+    heat_transfer_rates_w: FloatArray
+    warning_flags: WarningMaskArray
+
+    def __len__(self) -> int:
+        return int(self.reynolds_numbers.size)
+
+    def warnings_at(self, index: int) -> list[str]:
+        return warning_messages(int(self.warning_flags.flat[index]))
+
+    def to_bytes(self) -> bytes:
+        return _pack_columns(
+            _BATCH_RESULT_LAYOUTS,
+            (
+                self.reynolds_numbers,
+                self.prandtl_numbers,
+                self.nusselt_numbers,
+                self.heat_transfer_coefficients_w_per_m2k,
+                self.heat_transfer_rates_w,
+                self.warning_flags,
+            ),
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer) -> ConvectionBatchResult:
+        reynolds, prandtl, nusselt, coefficients, rates, flags = _unpack_columns(buffer, _BATCH_RESULT_LAYOUTS)
+        return cls(
+            reynolds_numbers=reynolds,
+            prandtl_numbers=prandtl,
+            nusselt_numbers=nusselt,
+            heat_transfer_coefficients_w_per_m2k=coefficients,
+            heat_transfer_rates_w=rates,
+            warning_flags=flags,
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class GridSweepResult:
+    axis_names: tuple[str, ...]
+    axis_values: tuple[FloatArray, ...]
+    reynolds_numbers: FloatArray
+    prandtl_numbers: FloatArray
+    nusselt_numbers: FloatArray
+    heat_transfer_coefficients_w_per_m2k: FloatArray
+    heat_transfer_rates_w: FloatArray
+    warning_flags: WarningMaskArray
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(values.size for values in self.axis_values)
+
+
+@dataclass(frozen=True, slots=True)
+class _GridShard:
+    base_inputs: ConvectionInputs
+    axis_names: tuple[str, ...]
+    axis_values: tuple[FloatArray, ...]
+    start: int
+    stop: int
+    dtype: str = "float64"
+    # Name of the parent's shared output block; workers write into it in place.
+    shared_outputs: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CorrelationOutcome:
     nusselt_number: float
-    warnings: list[str]
+    warning_flags: int
     correlation_name: str
     regime_name: str
 
 
+class DualNumber:
+    """Forward-mode dual number: a value plus its gradient with respect to seeded inputs."""
+
+    __slots__ = ("value", "gradient")
+
+    def __init__(self, value: float, gradient: tuple[float, ...]) -> None:
+        self.value = value
+        self.gradient = gradient
+
+    @classmethod
+    def variable(cls, value: float, index: int, size: int) -> DualNumber:
+        return cls(value, tuple(1.0 if position == index else 0.0 for position in range(size)))
+
+    def _chain(self, value: float, derivative: float) -> DualNumber:
+        return DualNumber(value, tuple([derivative * partial for partial in self.gradient]))
+
+    def __add__(self, other: DualNumber | float) -> DualNumber:
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value + other.value, tuple([a + b for a, b in zip(self.gradient, other.gradient)]))
+        return DualNumber(self.value + other, self.gradient)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: DualNumber | float) -> DualNumber:
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value - other.value, tuple([a - b for a, b in zip(self.gradient, other.gradient)]))
+        return DualNumber(self.value - other, self.gradient)
+
+    def __rsub__(self, other: float) -> DualNumber:
+        return self._chain(other - self.value, -1.0)
+
+    def __neg__(self) -> DualNumber:
+        return self._chain(-self.value, -1.0)
+
+    def __mul__(self, other: DualNumber | float) -> DualNumber:
+        if isinstance(other, DualNumber):
+            return DualNumber(
+                self.value * other.value,
+                tuple([other.value * a + self.value * b for a, b in zip(self.gradient, other.gradient)]),
+            )
+        return self._chain(self.value * other, other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: DualNumber | float) -> DualNumber:
+        if isinstance(other, DualNumber):
+            quotient = self.value / other.value
+            return DualNumber(
+                quotient,
+                tuple([(a - quotient * b) / other.value for a, b in zip(self.gradient, other.gradient)]),
+            )
+        return self._chain(self.value / other, 1.0 / other)
+
+    def __rtruediv__(self, other: float) -> DualNumber:
+        quotient = other / self.value
+        return self._chain(quotient, -quotient / self.value)
+
+    def __pow__(self, exponent: DualNumber | float) -> DualNumber:
+        if isinstance(exponent, DualNumber):
+            return (exponent * self.log()).exp()
+        power = self.value**exponent
+        return self._chain(power, exponent * power / self.value)
+
+    def __rpow__(self, base: float) -> DualNumber:
+        power = base**self.value
+        return self._chain(power, power * math.log(base))
+
+    def log(self) -> DualNumber:
+        return self._chain(math.log(self.value), 1.0 / self.value)
+
+    def exp(self) -> DualNumber:
+        power = math.exp(self.value)
+        return self._chain(power, power)
+
+    def __lt__(self, other: DualNumber | float) -> bool:
+        return self.value < _dual_value(other)
+
+    def __le__(self, other: DualNumber | float) -> bool:
+        return self.value <= _dual_value(other)
+
+    def __gt__(self, other: DualNumber | float) -> bool:
+        return self.value > _dual_value(other)
+
+    def __ge__(self, other: DualNumber | float) -> bool:
+        return self.value >= _dual_value(other)
+
+    def __repr__(self) -> str:
+        return f"DualNumber({self.value!r}, {self.gradient!r})"
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ConvectionGradients:
+    result: ConvectionResult
+    variables: tuple[str, ...]
+    heat_transfer_coefficient_gradient: FloatArray
+    heat_transfer_rate_gradient: FloatArray
+
+    @property
+    def jacobian(self) -> FloatArray:
+        return np.stack((self.heat_transfer_coefficient_gradient, self.heat_transfer_rate_gradient))
+
+    def heat_transfer_coefficient_derivative(self, variable: str) -> float:
+        return float(self.heat_transfer_coefficient_gradient[self.variables.index(variable)])
+
+    def heat_transfer_rate_derivative(self, variable: str) -> float:
+        return float(self.heat_transfer_rate_gradient[self.variables.index(variable)])
+
+
 def _film_temperature_c(surface_temperature_c: float, ambient_temperature_c: float) -> float:
     return 0.5 * (surface_temperature_c + ambient_temperature_c)
 
@@ -105,7 +523,10 @@ def _specific_heat_air_j_per_kgk(temperature_c: float) -> float:
 
 
 def compute_air_properties(surface_temperature_c: float, ambient_temperature_c: float) -> AirProperties:
-    film_temperature_c = _film_temperature_c(surface_temperature_c, ambient_temperature_c)
+    return _air_properties_at_film_temperature(_film_temperature_c(surface_temperature_c, ambient_temperature_c))
+
+
+def _air_properties_at_film_temperature(film_temperature_c: float) -> AirProperties:
     film_temperature_k = _temperature_k(film_temperature_c)
     rho_kg_per_m3 = ATM_PRESSURE_PA / (AIR_GAS_CONSTANT_J_PER_KG_K * film_temperature_k)
     mu_pa_s = _dynamic_viscosity_air_pa_s(film_temperature_c)
@@ -121,6 +542,173 @@ def compute_air_properties(surface_temperature_c: float, ambient_temperature_c:
     )
 
 
+def _dynamic_viscosity_air_array(temperature_c: FloatArray) -> FloatArray:
+    temperature_k = temperature_c + 273.15
+    return SUTHERLAND_FACTOR * temperature_k**1.5 / (temperature_k + SUTHERLAND_CONSTANT_K)
+
+
+def _thermal_conductivity_air_array(temperature_c: FloatArray) -> FloatArray:
+    return 0.0241 * ((temperature_c + 273.15) / 273.15) ** 0.9
+
+
+def _air_property_arrays_from_transport(
+    film_temperature_c: FloatArray,
+    mu_pa_s: FloatArray,
+    k_w_per_mk: FloatArray,
+) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    film_temperature_k = film_temperature_c + 273.15
+    rho_kg_per_m3 = ATM_PRESSURE_PA / (AIR_GAS_CONSTANT_J_PER_KG_K * film_temperature_k)
+    cp_j_per_kgk = 1006.0 + 0.1 * (film_temperature_k - 300.0)
+    return rho_kg_per_m3, mu_pa_s, k_w_per_mk, cp_j_per_kgk
+
+
+def _cubic_interval_coefficients(nodes: FloatArray) -> FloatArray:
+    # Power-basis coefficients of the four-point Lagrange cubic through
+    # nodes[i - 1 .. i + 2], evaluated on [nodes[i], nodes[i + 1]] with t in [0, 1].
+    before, start, end, after = nodes[:-3], nodes[1:-2], nodes[2:-1], nodes[3:]
+    return np.stack(
+        (
+            start,
+            -before / 3.0 - start / 2.0 + end - after / 6.0,
+            before / 2.0 - start + end / 2.0,
+            (after - before) / 6.0 + (start - end) / 2.0,
+        ),
+        axis=1,
+    )
+
+
+class AirPropertyProvider(Protocol):
+    def properties_at(self, film_temperature_c: float) -> AirProperties: ...
+    def dynamic_viscosity_pa_s(self, temperature_c: float) -> float: ...
+    def property_arrays(
+        self,
+        film_temperature_c: FloatArray,
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]: ...
+    def dynamic_viscosity_array(self, temperature_c: FloatArray) -> FloatArray: ...
+
+
+class CachedAirPropertyProvider:
+    """Exact property laws behind an LRU cache keyed on temperature."""
+
+    def __init__(self, maxsize: int = PROPERTY_CACHE_SIZE) -> None:
+        self._properties_at = lru_cache(maxsize=maxsize)(_air_properties_at_film_temperature)
+        self._dynamic_viscosity = lru_cache(maxsize=maxsize)(_dynamic_viscosity_air_pa_s)
+
+    def properties_at(self, film_temperature_c: float) -> AirProperties:
+        return self._properties_at(film_temperature_c)
+
+    def dynamic_viscosity_pa_s(self, temperature_c: float) -> float:
+        return self._dynamic_viscosity(temperature_c)
+
+    def property_arrays(
+        self,
+        film_temperature_c: FloatArray,
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        return _air_property_arrays_from_transport(
+            film_temperature_c,
+            _dynamic_viscosity_air_array(film_temperature_c),
+            _thermal_conductivity_air_array(film_temperature_c),
+        )
+
+    def dynamic_viscosity_array(self, temperature_c: FloatArray) -> FloatArray:
+        return _dynamic_viscosity_air_array(temperature_c)
+
+    def cache_token(self) -> tuple[object, ...]:
+        # The LRU size changes speed, never values.
+        return ()
+
+    def cache_clear(self) -> None:
+        self._properties_at.cache_clear()
+        self._dynamic_viscosity.cache_clear()
+
+
+class TabulatedAirPropertyProvider:
+    """Cubic interpolation in a precomputed viscosity/conductivity table.
+
+    The table spans ``AUTO_PROPERTY_MIN_TEMP_C``..``AUTO_PROPERTY_MAX_TEMP_C``;
+    temperatures outside it fall back to the exact laws. With the default step
+    the relative interpolation error stays below
+    ``PROPERTY_TABLE_RELATIVE_ERROR_BOUND``.
+    """
+
+    def __init__(self, step_c: float = PROPERTY_TABLE_STEP_C) -> None:
+        if step_c <= 0.0:
+            raise ValueError("table step must be positive")
+        self.step_c = step_c
+        self.interval_count = max(1, math.ceil((AUTO_PROPERTY_MAX_TEMP_C - AUTO_PROPERTY_MIN_TEMP_C) / step_c))
+        self.max_temperature_c = AUTO_PROPERTY_MIN_TEMP_C + self.interval_count * step_c
+        node_temperatures_c = AUTO_PROPERTY_MIN_TEMP_C + step_c * np.arange(-1, self.interval_count + 2)
+        self._mu_coefficients = _cubic_interval_coefficients(_dynamic_viscosity_air_array(node_temperatures_c))
+        self._k_coefficients = _cubic_interval_coefficients(_thermal_conductivity_air_array(node_temperatures_c))
+
+    def _interpolate(self, coefficients: FloatArray, temperature_c: FloatArray) -> FloatArray:
+        position = (temperature_c - AUTO_PROPERTY_MIN_TEMP_C) / self.step_c
+        interval = np.clip(position.astype(np.intp), 0, self.interval_count - 1)
+        t = position - interval
+        c0, c1, c2, c3 = np.moveaxis(coefficients[interval], -1, 0)
+        return c0 + t * (c1 + t * (c2 + t * c3))
+
+    def _lookup(
+        self,
+        coefficients: FloatArray,
+        temperature_c: FloatArray,
+        exact: Callable[[FloatArray], FloatArray],
+    ) -> FloatArray:
+        inside = (temperature_c >= AUTO_PROPERTY_MIN_TEMP_C) & (temperature_c <= self.max_temperature_c)
+        if np.all(inside):
+            return self._interpolate(coefficients, temperature_c)
+        values = exact(temperature_c)
+        values[inside] = self._interpolate(coefficients, temperature_c[inside])
+        return values
+
+    def properties_at(self, film_temperature_c: float) -> AirProperties:
+        rho, mu, k, cp = self.property_arrays(np.array([film_temperature_c]))
+        return AirProperties(
+            rho_kg_per_m3=float(rho[0]),
+            mu_pa_s=float(mu[0]),
+            k_w_per_mk=float(k[0]),
+            cp_j_per_kgk=float(cp[0]),
+            film_temperature_c=film_temperature_c,
+            source_label="tabulated automatic air properties",
+        )
+
+    def dynamic_viscosity_pa_s(self, temperature_c: float) -> float:
+        return float(self.dynamic_viscosity_array(np.array([temperature_c]))[0])
+
+    def property_arrays(
+        self,
+        film_temperature_c: FloatArray,
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        return _air_property_arrays_from_transport(
+            film_temperature_c,
+            self._lookup(self._mu_coefficients, film_temperature_c, _dynamic_viscosity_air_array),
+            self._lookup(self._k_coefficients, film_temperature_c, _thermal_conductivity_air_array),
+        )
+
+    def dynamic_viscosity_array(self, temperature_c: FloatArray) -> FloatArray:
+        return self._lookup(self._mu_coefficients, temperature_c, _dynamic_viscosity_air_array)
+
+    def cache_token(self) -> tuple[object, ...]:
+        return (self.step_c, AUTO_PROPERTY_MIN_TEMP_C, self.max_temperature_c)
+
+
+_air_property_provider: AirPropertyProvider = CachedAirPropertyProvider()
+# lru_cache(maxsize=0) never hashes its arguments, so this provider evaluates
+# the exact property laws on DualNumber temperatures for the gradient path.
+_EXACT_AIR_PROPERTY_PROVIDER = CachedAirPropertyProvider(maxsize=0)
+
+
+def get_air_property_provider() -> AirPropertyProvider:
+    return _air_property_provider
+
+
+def set_air_property_provider(provider: AirPropertyProvider) -> AirPropertyProvider:
+    global _air_property_provider
+    previous = _air_property_provider
+    _air_property_provider = provider
+    return previous
+
+
 def _validate_air_properties(properties: AirProperties) -> None:
     if properties.rho_kg_per_m3 <= 0.0:
         raise ValueError("density must be positive")
@@ -133,24 +721,24 @@ def _validate_air_properties(properties: AirProperties) -> None:
 
 
 
-def _resolve_air_properties(inputs: ConvectionInputs) -> tuple[AirProperties, list[str]]:
+def _resolve_air_properties(
+    inputs: ConvectionInputs,
+    provider: AirPropertyProvider,
+) -> tuple[AirProperties, int]:
     if inputs.auto_properties:
-        properties = compute_air_properties(
-            surface_temperature_c=inputs.surface_temperature_c,
-            ambient_temperature_c=inputs.ambient_temperature_c,
+        properties = provider.properties_at(
+            _film_temperature_c(inputs.surface_temperature_c, inputs.ambient_temperature_c)
         )
-        warnings: list[str] = []
+        warning_flags = 0
         if not AUTO_PROPERTY_MIN_TEMP_C <= properties.film_temperature_c <= AUTO_PROPERTY_MAX_TEMP_C:
-            warnings.append(
-                "Automatic air-property model is being used outside its preferred temperature range."
-            )
-        return properties, warnings
+            warning_flags |= ConvectionWarning.AUTO_PROPERTIES_OUT_OF_RANGE.value
+        return properties, warning_flags
 
     if inputs.air_properties is None:
         raise ValueError("manual property mode requires AirProperties")
 
     _validate_air_properties(inputs.air_properties)
-    return inputs.air_properties, []
+    return inputs.air_properties, 0
 
 
 
@@ -159,10 +747,10 @@ def _reynolds_number(properties: AirProperties, velocity_m_per_s: float, charact
 
 
 
-def _flat_plate_outcome(reynolds_number: float, prandtl_number: float) -> _CorrelationOutcome:
-    warnings: list[str] = []
+def _flat_plate_outcome(reynolds_number: float, prandtl_number: float) -> CorrelationOutcome:
+    warning_flags = 0
     if not 0.6 <= prandtl_number <= 60.0:
-        warnings.append("Flat-plate correlation is outside its recommended Prandtl-number range.")
+        warning_flags |= ConvectionWarning.FLAT_PLATE_PRANDTL_RANGE.value
 
     if reynolds_number < 5.0e5:
         nusselt_number = 0.664 * reynolds_number**0.5 * prandtl_number ** (1.0 / 3.0)
@@ -173,30 +761,30 @@ def _flat_plate_outcome(reynolds_number: float, prandtl_number: float) -> _Corre
         correlation_name = "Average turbulent flat-plate correlation with leading-edge correction"
         regime_name = "turbulent / transitional"
         if reynolds_number > 1.0e7:
-            warnings.append("Flat-plate turbulent correlation is being used beyond its preferred Reynolds-number range.")
+            warning_flags |= ConvectionWarning.FLAT_PLATE_REYNOLDS_RANGE.value
 
-    return _CorrelationOutcome(
+    return CorrelationOutcome(
         nusselt_number=nusselt_number,
-        warnings=warnings,
+        warning_flags=warning_flags,
         correlation_name=correlation_name,
         regime_name=regime_name,
     )
 
 
 
-def _cylinder_crossflow_outcome(reynolds_number: float, prandtl_number: float) -> _CorrelationOutcome:
-    warnings: list[str] = []
+def _cylinder_crossflow_outcome(reynolds_number: float, prandtl_number: float) -> CorrelationOutcome:
+    warning_flags = 0
     if reynolds_number * prandtl_number <= 0.2:
-        warnings.append("Churchill-Bernstein is outside its recommended Re·Pr applicability range.")
+        warning_flags |= ConvectionWarning.CHURCHILL_BERNSTEIN_RANGE.value
 
     numerator = 0.62 * reynolds_number**0.5 * prandtl_number ** (1.0 / 3.0)
     denominator = (1.0 + (0.4 / prandtl_number) ** (2.0 / 3.0)) ** 0.25
     correction = (1.0 + (reynolds_number / 282_000.0) ** (5.0 / 8.0)) ** (4.0 / 5.0)
     nusselt_number = 0.3 + numerator / denominator * correction
 
-    return _CorrelationOutcome(
+    return CorrelationOutcome(
         nusselt_number=nusselt_number,
-        warnings=warnings,
+        warning_flags=warning_flags,
         correlation_name="Churchill-Bernstein cylinder crossflow correlation",
         regime_name="crossflow",
     )
@@ -207,22 +795,21 @@ def _sphere_crossflow_outcome(
     reynolds_number: float,
     prandtl_number: float,
     inputs: ConvectionInputs,
-) -> _CorrelationOutcome:
-    warnings: list[str] = []
+    provider: AirPropertyProvider,
+) -> CorrelationOutcome:
+    warning_flags = 0
     if not 3.5 <= reynolds_number <= 7.6e4:
-        warnings.append("Whitaker sphere correlation is outside its recommended Reynolds-number range.")
+        warning_flags |= ConvectionWarning.WHITAKER_REYNOLDS_RANGE.value
     if not 0.71 <= prandtl_number <= 380.0:
-        warnings.append("Whitaker sphere correlation is outside its recommended Prandtl-number range.")
+        warning_flags |= ConvectionWarning.WHITAKER_PRANDTL_RANGE.value
 
     if inputs.auto_properties:
-        mu_inf = _dynamic_viscosity_air_pa_s(inputs.ambient_temperature_c)
-        mu_surface = _dynamic_viscosity_air_pa_s(inputs.surface_temperature_c)
+        mu_inf = provider.dynamic_viscosity_pa_s(inputs.ambient_temperature_c)
+        mu_surface = provider.dynamic_viscosity_pa_s(inputs.surface_temperature_c)
         viscosity_ratio = mu_inf / mu_surface
     else:
         viscosity_ratio = 1.0
-        warnings.append(
-            "Manual property mode disables the free-stream / surface viscosity correction for the sphere correlation."
-        )
+        warning_flags |= ConvectionWarning.SPHERE_MANUAL_VISCOSITY_RATIO.value
 
     nusselt_number = (
         2.0
@@ -230,15 +817,25 @@ def _sphere_crossflow_outcome(
         * prandtl_number**0.4
         * viscosity_ratio**0.25
     )
-    return _CorrelationOutcome(
+    return CorrelationOutcome(
         nusselt_number=nusselt_number,
-        warnings=warnings,
+        warning_flags=warning_flags,
         correlation_name="Whitaker sphere crossflow correlation",
         regime_name="crossflow",
     )
 
 
 
+def _dual_value(value: DualNumber | float) -> float:
+    return value.value if isinstance(value, DualNumber) else value
+
+
+
+def _log(value: DualNumber | float) -> DualNumber | float:
+    return value.log() if isinstance(value, DualNumber) else math.log(value)
+
+
+
 def _hausen_laminar_nusselt(reynolds_number: float, prandtl_number: float, diameter_m: float, length_m: float) -> float:
     graetz_number = reynolds_number * prandtl_number * diameter_m / length_m
     return 3.66 + (0.0668 * graetz_number) / (1.0 + 0.04 * graetz_number ** (2.0 / 3.0))
@@ -246,7 +843,7 @@ def _hausen_laminar_nusselt(reynolds_number: float, prandtl_number: float, diame
 
 
 def _gnielinski_turbulent_nusselt(reynolds_number: float, prandtl_number: float) -> float:
-    friction_factor = (0.79 * math.log(reynolds_number) - 1.64) ** -2
+    friction_factor = (0.79 * _log(reynolds_number) - 1.64) ** -2
     numerator = (friction_factor / 8.0) * (reynolds_number - 1000.0) * prandtl_number
     denominator = 1.0 + 12.7 * (friction_factor / 8.0) ** 0.5 * (prandtl_number ** (2.0 / 3.0) - 1.0)
     return numerator / denominator
@@ -258,8 +855,8 @@ def _internal_tube_outcome(
     prandtl_number: float,
     diameter_m: float,
     length_m: float,
-) -> _CorrelationOutcome:
-    warnings: list[str] = []
+) -> CorrelationOutcome:
+    warning_flags = 0
     laminar_nusselt = _hausen_laminar_nusselt(reynolds_number, prandtl_number, diameter_m, length_m)
 
     if reynolds_number < 2300.0:
@@ -272,7 +869,7 @@ def _internal_tube_outcome(
         nusselt_number = (1.0 - transition_weight) * laminar_nusselt + transition_weight * turbulent_reference_nusselt
         correlation_name = "Transition interpolation between laminar Hausen and turbulent Gnielinski estimates"
         regime_name = "transition"
-        warnings.append("Internal-flow result is in the transition range and should be treated as a low-confidence estimate.")
+        warning_flags |= ConvectionWarning.INTERNAL_TRANSITION.value
     else:
         nusselt_number = _gnielinski_turbulent_nusselt(reynolds_number, prandtl_number)
         correlation_name = "Gnielinski turbulent internal-flow correlation"
@@ -280,41 +877,355 @@ def _internal_tube_outcome(
 
     if regime_name != "laminar":
         if not 0.5 <= prandtl_number <= 2000.0:
-            warnings.append("Gnielinski correlation is outside its recommended Prandtl-number range.")
+            warning_flags |= ConvectionWarning.GNIELINSKI_PRANDTL_RANGE.value
         if not 3000.0 <= reynolds_number <= 5.0e6 and regime_name == "turbulent":
-            warnings.append("Gnielinski correlation is outside its recommended Reynolds-number range.")
+            warning_flags |= ConvectionWarning.GNIELINSKI_REYNOLDS_RANGE.value
         if length_m / diameter_m < 10.0:
-            warnings.append("Internal-flow turbulent estimate assumes a sufficiently long tube (L/D > 10).")
+            warning_flags |= ConvectionWarning.SHORT_TUBE.value
 
-    return _CorrelationOutcome(
+    return CorrelationOutcome(
         nusselt_number=nusselt_number,
-        warnings=warnings,
+        warning_flags=warning_flags,
         correlation_name=correlation_name,
         regime_name=regime_name,
     )
 
 
 
-def _correlation_outcome(
-    inputs: ConvectionInputs,
-    reynolds_number: float,
-    prandtl_number: float,
-) -> _CorrelationOutcome:
-    if inputs.case == ConvectionCase.FLAT_PLATE:
+class ConvectionCorrelation(Protocol):
+    name: str
+    reynolds_range: tuple[float, float]
+    prandtl_range: tuple[float, float]
+    regime_boundaries: tuple[float, ...]
+
+    def outcome(
+        self,
+        reynolds_number: float,
+        prandtl_number: float,
+        inputs: ConvectionInputs,
+        provider: AirPropertyProvider,
+    ) -> CorrelationOutcome: ...
+    def nusselt_array(
+        self,
+        reynolds_numbers: FloatArray,
+        prandtl_numbers: FloatArray,
+        batch: ConvectionBatchInputs,
+        provider: AirPropertyProvider,
+    ) -> tuple[FloatArray, WarningMaskArray]: ...
+    def regime_names(self, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]: ...
+
+
+
+class FlatPlateCorrelation:
+    """Average laminar / turbulent flat-plate correlation with leading-edge correction."""
+
+    name = "Average flat-plate correlation"
+    reynolds_range = (0.0, 1.0e7)
+    prandtl_range = (0.6, 60.0)
+    regime_boundaries = (5.0e5,)
+
+    def outcome(
+        self,
+        reynolds_number: float,
+        prandtl_number: float,
+        inputs: ConvectionInputs,
+        provider: AirPropertyProvider,
+    ) -> CorrelationOutcome:
         return _flat_plate_outcome(reynolds_number, prandtl_number)
-    if inputs.case == ConvectionCase.CYLINDER_CROSSFLOW:
+
+    def nusselt_array(
+        self,
+        reynolds_numbers: FloatArray,
+        prandtl_numbers: FloatArray,
+        batch: ConvectionBatchInputs,
+        provider: AirPropertyProvider,
+    ) -> tuple[FloatArray, WarningMaskArray]:
+        return _flat_plate_nusselt_array(reynolds_numbers, prandtl_numbers)
+
+    def regime_names(self, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]:
+        return np.where(reynolds_numbers < 5.0e5, "laminar", "turbulent / transitional").astype(object)
+
+
+
+class ChurchillBernsteinCorrelation:
+    """Churchill-Bernstein correlation for a cylinder in crossflow."""
+
+    name = "Churchill-Bernstein cylinder crossflow correlation"
+    reynolds_range = (0.0, math.inf)
+    prandtl_range = (0.0, math.inf)
+    regime_boundaries = ()
+
+    def outcome(
+        self,
+        reynolds_number: float,
+        prandtl_number: float,
+        inputs: ConvectionInputs,
+        provider: AirPropertyProvider,
+    ) -> CorrelationOutcome:
         return _cylinder_crossflow_outcome(reynolds_number, prandtl_number)
-    if inputs.case == ConvectionCase.SPHERE_CROSSFLOW:
-        return _sphere_crossflow_outcome(reynolds_number, prandtl_number, inputs)
-    return _internal_tube_outcome(
-        reynolds_number,
-        prandtl_number,
-        inputs.characteristic_length_m,
-        inputs.flow_length_m,
+
+    def nusselt_array(
+        self,
+        reynolds_numbers: FloatArray,
+        prandtl_numbers: FloatArray,
+        batch: ConvectionBatchInputs,
+        provider: AirPropertyProvider,
+    ) -> tuple[FloatArray, WarningMaskArray]:
+        return _cylinder_crossflow_nusselt_array(reynolds_numbers, prandtl_numbers)
+
+    def regime_names(self, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]:
+        return np.full(reynolds_numbers.shape, "crossflow", dtype=object)
+
+
+
+class WhitakerSphereCorrelation:
+    """Whitaker correlation for a sphere, with the free-stream / surface viscosity ratio."""
+
+    name = "Whitaker sphere crossflow correlation"
+    reynolds_range = (3.5, 7.6e4)
+    prandtl_range = (0.71, 380.0)
+    regime_boundaries = ()
+
+    def outcome(
+        self,
+        reynolds_number: float,
+        prandtl_number: float,
+        inputs: ConvectionInputs,
+        provider: AirPropertyProvider,
+    ) -> CorrelationOutcome:
+        return _sphere_crossflow_outcome(reynolds_number, prandtl_number, inputs, provider)
+
+    def nusselt_array(
+        self,
+        reynolds_numbers: FloatArray,
+        prandtl_numbers: FloatArray,
+        batch: ConvectionBatchInputs,
+        provider: AirPropertyProvider,
+    ) -> tuple[FloatArray, WarningMaskArray]:
+        if batch.auto_properties:
+            viscosity_ratios = provider.dynamic_viscosity_array(
+                batch.ambient_temperatures_c
+            ) / provider.dynamic_viscosity_array(batch.surface_temperatures_c)
+            return _sphere_crossflow_nusselt_array(reynolds_numbers, prandtl_numbers, viscosity_ratios)
+        nusselt_numbers, warning_flags = _sphere_crossflow_nusselt_array(
+            reynolds_numbers,
+            prandtl_numbers,
+            np.ones_like(reynolds_numbers),
+        )
+        return nusselt_numbers, warning_flags | np.uint32(ConvectionWarning.SPHERE_MANUAL_VISCOSITY_RATIO)
+
+    def regime_names(self, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]:
+        return np.full(reynolds_numbers.shape, "crossflow", dtype=object)
+
+
+
+class HausenGnielinskiCorrelation:
+    """Hausen laminar / Gnielinski turbulent internal flow with a blended transition band."""
+
+    name = "Hausen / Gnielinski internal-flow correlation"
+    reynolds_range = (0.0, 5.0e6)
+    prandtl_range = (0.5, 2000.0)
+    regime_boundaries = (2300.0, 3000.0)
+
+    def outcome(
+        self,
+        reynolds_number: float,
+        prandtl_number: float,
+        inputs: ConvectionInputs,
+        provider: AirPropertyProvider,
+    ) -> CorrelationOutcome:
+        return _internal_tube_outcome(
+            reynolds_number,
+            prandtl_number,
+            inputs.characteristic_length_m,
+            inputs.flow_length_m,
+        )
+
+    def nusselt_array(
+        self,
+        reynolds_numbers: FloatArray,
+        prandtl_numbers: FloatArray,
+        batch: ConvectionBatchInputs,
+        provider: AirPropertyProvider,
+    ) -> tuple[FloatArray, WarningMaskArray]:
+        return _internal_tube_nusselt_array(
+            reynolds_numbers,
+            prandtl_numbers,
+            batch.characteristic_lengths_m,
+            batch.flow_lengths_m,
+        )
+
+    def regime_names(self, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]:
+        return np.select(
+            [reynolds_numbers < 2300.0, reynolds_numbers < 3000.0],
+            ["laminar", "transition"],
+            "turbulent",
+        ).astype(object)
+
+
+
+class DittusBoelterCorrelation:
+    """Dittus-Boelter fully developed turbulent tube flow (n = 0.4 heating the air, 0.3 cooling it)."""
+
+    name = "Dittus-Boelter turbulent internal-flow correlation"
+    reynolds_range = (1.0e4, math.inf)
+    prandtl_range = (0.6, 160.0)
+    regime_boundaries = ()
+
+    def outcome(
+        self,
+        reynolds_number: float,
+        prandtl_number: float,
+        inputs: ConvectionInputs,
+        provider: AirPropertyProvider,
+    ) -> CorrelationOutcome:
+        exponent = 0.4 if inputs.surface_temperature_c >= inputs.ambient_temperature_c else 0.3
+        warning_flags = applicability_warning_flags(self, reynolds_number, prandtl_number)
+        if inputs.flow_length_m / inputs.characteristic_length_m < 10.0:
+            warning_flags |= ConvectionWarning.SHORT_TUBE.value
+        return CorrelationOutcome(
+            nusselt_number=0.023 * reynolds_number**0.8 * prandtl_number**exponent,
+            warning_flags=warning_flags,
+            correlation_name=self.name,
+            regime_name="turbulent",
+        )
+
+    def nusselt_array(
+        self,
+        reynolds_numbers: FloatArray,
+        prandtl_numbers: FloatArray,
+        batch: ConvectionBatchInputs,
+        provider: AirPropertyProvider,
+    ) -> tuple[FloatArray, WarningMaskArray]:
+        exponents = np.where(batch.surface_temperatures_c >= batch.ambient_temperatures_c, 0.4, 0.3)
+        warning_flags = applicability_warning_mask(self, reynolds_numbers, prandtl_numbers) | _warning_mask(
+            batch.flow_lengths_m / batch.characteristic_lengths_m < 10.0,
+            ConvectionWarning.SHORT_TUBE,
+        )
+        return 0.023 * reynolds_numbers**0.8 * prandtl_numbers**exponents, warning_flags
+
+    def regime_names(self, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]:
+        return np.full(reynolds_numbers.shape, "turbulent", dtype=object)
+
+
+
+class ZukauskasCylinderCorrelation:
+    """Zukauskas cylinder crossflow with Re-banded constants and the (Pr / Pr_s)^0.25 correction."""
+
+    name = "Zukauskas cylinder crossflow correlation"
+    reynolds_range = (1.0, 1.0e6)
+    prandtl_range = (0.7, 500.0)
+    regime_boundaries = (40.0, 1000.0, 2.0e5)
+    _COEFFICIENTS = ((0.75, 0.4), (0.51, 0.5), (0.26, 0.6), (0.076, 0.7))
+
+    def outcome(
+        self,
+        reynolds_number: float,
+        prandtl_number: float,
+        inputs: ConvectionInputs,
+        provider: AirPropertyProvider,
+    ) -> CorrelationOutcome:
+        band = sum(reynolds_number >= boundary for boundary in self.regime_boundaries)
+        constant, reynolds_exponent = self._COEFFICIENTS[band]
+        prandtl_exponent = 0.37 if prandtl_number <= 10.0 else 0.36
+        surface_prandtl = (
+            provider.properties_at(inputs.surface_temperature_c).prandtl_number
+            if inputs.auto_properties
+            else prandtl_number
+        )
+        return CorrelationOutcome(
+            nusselt_number=constant
+            * reynolds_number**reynolds_exponent
+            * prandtl_number**prandtl_exponent
+            * (prandtl_number / surface_prandtl) ** 0.25,
+            warning_flags=applicability_warning_flags(self, reynolds_number, prandtl_number),
+            correlation_name=self.name,
+            regime_name="crossflow",
+        )
+
+    def nusselt_array(
+        self,
+        reynolds_numbers: FloatArray,
+        prandtl_numbers: FloatArray,
+        batch: ConvectionBatchInputs,
+        provider: AirPropertyProvider,
+    ) -> tuple[FloatArray, WarningMaskArray]:
+        bands = np.searchsorted(np.array(self.regime_boundaries), reynolds_numbers, side="right")
+        coefficients = np.array(self._COEFFICIENTS)
+        prandtl_exponents = np.where(prandtl_numbers <= 10.0, 0.37, 0.36)
+        if batch.auto_properties:
+            _, surface_mu, surface_k, surface_cp = provider.property_arrays(batch.surface_temperatures_c)
+            surface_prandtl = surface_cp * surface_mu / surface_k
+        else:
+            surface_prandtl = prandtl_numbers
+        nusselt_numbers = (
+            coefficients[bands, 0]
+            * reynolds_numbers ** coefficients[bands, 1]
+            * prandtl_numbers**prandtl_exponents
+            * (prandtl_numbers / surface_prandtl) ** 0.25
+        )
+        return nusselt_numbers, applicability_warning_mask(self, reynolds_numbers, prandtl_numbers)
+
+    def regime_names(self, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]:
+        return np.full(reynolds_numbers.shape, "crossflow", dtype=object)
+
+
+
+def applicability_warning_flags(
+    correlation: ConvectionCorrelation,
+    reynolds_number: float,
+    prandtl_number: float,
+) -> int:
+    warning_flags = 0
+    if not correlation.reynolds_range[0] <= reynolds_number <= correlation.reynolds_range[1]:
+        warning_flags |= ConvectionWarning.CORRELATION_REYNOLDS_RANGE.value
+    if not correlation.prandtl_range[0] <= prandtl_number <= correlation.prandtl_range[1]:
+        warning_flags |= ConvectionWarning.CORRELATION_PRANDTL_RANGE.value
+    return warning_flags
+
+
+
+def applicability_warning_mask(
+    correlation: ConvectionCorrelation,
+    reynolds_numbers: FloatArray,
+    prandtl_numbers: FloatArray,
+) -> WarningMaskArray:
+    reynolds_min, reynolds_max = correlation.reynolds_range
+    prandtl_min, prandtl_max = correlation.prandtl_range
+    return _warning_mask(
+        (reynolds_numbers < reynolds_min) | (reynolds_numbers > reynolds_max),
+        ConvectionWarning.CORRELATION_REYNOLDS_RANGE,
+    ) | _warning_mask(
+        (prandtl_numbers < prandtl_min) | (prandtl_numbers > prandtl_max),
+        ConvectionWarning.CORRELATION_PRANDTL_RANGE,
     )
 
 
 
+_correlations: dict[ConvectionCase, ConvectionCorrelation] = {
+    ConvectionCase.FLAT_PLATE: FlatPlateCorrelation(),
+    ConvectionCase.CYLINDER_CROSSFLOW: ChurchillBernsteinCorrelation(),
+    ConvectionCase.SPHERE_CROSSFLOW: WhitakerSphereCorrelation(),
+    ConvectionCase.INTERNAL_TUBE: HausenGnielinskiCorrelation(),
+}
+
+
+
+def get_correlation(case: ConvectionCase) -> ConvectionCorrelation:
+    return _correlations[ConvectionCase(case)]
+
+
+
+def register_correlation(case: ConvectionCase, correlation: ConvectionCorrelation) -> ConvectionCorrelation:
+    # Worker processes started with fork inherit the registry; under spawn,
+    # register custom correlations at import time of the worker's modules.
+    case = ConvectionCase(case)
+    previous = _correlations[case]
+    _correlations[case] = correlation
+    return previous
+
+
+
 def _validate_inputs(inputs: ConvectionInputs) -> None:
     if inputs.velocity_m_per_s <= 0.0:
         raise ValueError("velocity must be positive")
@@ -327,16 +1238,158 @@ def _validate_inputs(inputs: ConvectionInputs) -> None:
 
 
 
+@dataclass(frozen=True, slots=True)
+class StageTiming:
+    calls: int
+    total_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+
+class StageProfiler:
+    """Call counts and cumulative wall-clock nanoseconds per ``compute_case`` stage."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, int] = {}
+        self._total_ns: dict[str, int] = {}
+
+    def record(self, stage: str, elapsed_ns: int) -> None:
+        self._calls[stage] = self._calls.get(stage, 0) + 1
+        self._total_ns[stage] = self._total_ns.get(stage, 0) + elapsed_ns
+
+    def reset(self) -> None:
+        self._calls.clear()
+        self._total_ns.clear()
+
+    def snapshot(self) -> dict[str, StageTiming]:
+        return {stage: StageTiming(calls, self._total_ns[stage]) for stage, calls in self._calls.items()}
+
+    def report(self) -> str:
+        return format_stage_report(self.snapshot())
+
+
+
+def format_stage_report(snapshot: Mapping[str, StageTiming]) -> str:
+    if not snapshot:
+        return "No compute_case stages recorded."
+    stages = sorted(snapshot.items(), key=lambda item: item[1].total_ns, reverse=True)
+    grand_total_ns = sum(timing.total_ns for _, timing in stages) or 1
+    name_width = max(len("stage"), *(len(stage) for stage, _ in stages))
+    header = f"{'stage':<{name_width}}  {'calls':>10}  {'total ms':>10}  {'mean us':>9}  {'share':>6}"
+    lines = [header, "-" * len(header)]
+    lines.extend(
+        f"{stage:<{name_width}}  {timing.calls:>10,d}  {timing.total_ns / 1e6:>10,.3f}  "
+        f"{timing.mean_ns / 1e3:>9,.3f}  {timing.total_ns / grand_total_ns:>6.1%}"
+        for stage, timing in stages
+    )
+    return "\n".join(lines)
+
+
+
+_stage_profiler: StageProfiler | None = None
+
+
+
+def get_stage_profiler() -> StageProfiler | None:
+    return _stage_profiler
+
+
+
+@contextlib.contextmanager
+def profile_stages(profiler: StageProfiler | None = None) -> Iterator[StageProfiler]:
+    global _stage_profiler
+    previous = _stage_profiler
+    _stage_profiler = StageProfiler() if profiler is None else profiler
+    try:
+        yield _stage_profiler
+    finally:
+        _stage_profiler = previous
+
+
+
+def _report_stage_profile_at_exit(profiler: StageProfiler) -> None:
+    print(profiler.report(), file=sys.stderr)
+
+
+
+if os.environ.get(PROFILE_ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off"):
+    _stage_profiler = StageProfiler()
+    atexit.register(_report_stage_profile_at_exit, _stage_profiler)
+
+
+
 def compute_case(inputs: ConvectionInputs) -> ConvectionResult:
+    if _stage_profiler is not None:
+        return _evaluate_case_profiled(inputs, _air_property_provider, _stage_profiler)
+    return _evaluate_case(inputs, _air_property_provider)
+
+
+
+def _evaluate_case(inputs: ConvectionInputs, provider: AirPropertyProvider) -> ConvectionResult:
+    _validate_inputs(inputs)
+    properties, property_warning_flags = _resolve_air_properties(inputs, provider)
+    reynolds_number = _reynolds_number(
+        properties,
+        inputs.velocity_m_per_s,
+        inputs.characteristic_length_m,
+    )
+    outcome = _case_correlation_outcome(inputs, properties, reynolds_number, provider)
+    return _case_result(inputs, properties, property_warning_flags, reynolds_number, outcome)
+
+
+
+def _evaluate_case_profiled(
+    inputs: ConvectionInputs,
+    provider: AirPropertyProvider,
+    profiler: StageProfiler,
+) -> ConvectionResult:
+    # Calls the same stage helpers as _evaluate_case with a clock read between
+    # each; kept separate so the unprofiled path pays nothing for the timers.
+    clock = time.perf_counter_ns
+    start = clock()
     _validate_inputs(inputs)
-    properties, property_warnings = _resolve_air_properties(inputs)
+    after_validation = clock()
+    properties, property_warning_flags = _resolve_air_properties(inputs, provider)
+    after_properties = clock()
     reynolds_number = _reynolds_number(
         properties,
         inputs.velocity_m_per_s,
         inputs.characteristic_length_m,
     )
-    prandtl_number = properties.prandtl_number
-    outcome = _correlation_outcome(inputs, reynolds_number, prandtl_number)
+    after_reynolds = clock()
+    outcome = _case_correlation_outcome(inputs, properties, reynolds_number, provider)
+    after_correlation = clock()
+    result = _case_result(inputs, properties, property_warning_flags, reynolds_number, outcome)
+    end = clock()
+    profiler.record("validate_inputs", after_validation - start)
+    profiler.record("resolve_air_properties", after_properties - after_validation)
+    profiler.record("reynolds_number", after_reynolds - after_properties)
+    profiler.record(f"correlation_outcome[{inputs.case.value}]", after_correlation - after_reynolds)
+    profiler.record("result_construction", end - after_correlation)
+    return result
+
+
+
+def _case_correlation_outcome(
+    inputs: ConvectionInputs,
+    properties: AirProperties,
+    reynolds_number: float,
+    provider: AirPropertyProvider,
+) -> CorrelationOutcome:
+    return _correlations[inputs.case].outcome(reynolds_number, properties.prandtl_number, inputs, provider)
+
+
+
+def _case_result(
+    inputs: ConvectionInputs,
+    properties: AirProperties,
+    property_warning_flags: int,
+    reynolds_number: float,
+    outcome: CorrelationOutcome,
+) -> ConvectionResult:
     heat_transfer_coefficient = outcome.nusselt_number * properties.k_w_per_mk / inputs.characteristic_length_m
     heat_transfer_rate = heat_transfer_coefficient * inputs.area_m2 * (
         inputs.surface_temperature_c - inputs.ambient_temperature_c
@@ -344,53 +1397,1392 @@ def compute_case(inputs: ConvectionInputs) -> ConvectionResult:
     return ConvectionResult(
         air_properties=properties,
         reynolds_number=reynolds_number,
-        prandtl_number=prandtl_number,
+        prandtl_number=properties.prandtl_number,
         nusselt_number=outcome.nusselt_number,
         heat_transfer_coefficient_w_per_m2k=heat_transfer_coefficient,
         heat_transfer_rate_w=heat_transfer_rate,
-        warnings=property_warnings + outcome.warnings,
+        warning_flags=property_warning_flags | outcome.warning_flags,
         correlation_name=outcome.correlation_name,
         regime_name=outcome.regime_name,
     )
 
 
 
+def compute_case_with_gradients(
+    inputs: ConvectionInputs,
+    variables: Sequence[str] = GRADIENT_VARIABLES,
+) -> ConvectionGradients:
+    unknown_variables = sorted(set(variables) - set(GRADIENT_VARIABLES))
+    if unknown_variables:
+        raise ValueError(f"unsupported gradient variables: {', '.join(unknown_variables)}")
+    variables = tuple(variables)
+    seeded_inputs = replace(
+        inputs,
+        **{
+            name: DualNumber.variable(getattr(inputs, name), index, len(variables))
+            for index, name in enumerate(variables)
+        },
+    )
+    dual_result = _evaluate_case(seeded_inputs, _EXACT_AIR_PROPERTY_PROVIDER)
+    properties = dual_result.air_properties
+    result = ConvectionResult(
+        air_properties=AirProperties(
+            rho_kg_per_m3=_dual_value(properties.rho_kg_per_m3),
+            mu_pa_s=_dual_value(properties.mu_pa_s),
+            k_w_per_mk=_dual_value(properties.k_w_per_mk),
+            cp_j_per_kgk=_dual_value(properties.cp_j_per_kgk),
+            film_temperature_c=_dual_value(properties.film_temperature_c),
+            source_label=properties.source_label,
+        ),
+        reynolds_number=_dual_value(dual_result.reynolds_number),
+        prandtl_number=_dual_value(dual_result.prandtl_number),
+        nusselt_number=_dual_value(dual_result.nusselt_number),
+        heat_transfer_coefficient_w_per_m2k=_dual_value(dual_result.heat_transfer_coefficient_w_per_m2k),
+        heat_transfer_rate_w=_dual_value(dual_result.heat_transfer_rate_w),
+        warning_flags=dual_result.warning_flags,
+        correlation_name=dual_result.correlation_name,
+        regime_name=dual_result.regime_name,
+    )
+    return ConvectionGradients(
+        result=result,
+        variables=variables,
+        heat_transfer_coefficient_gradient=_dual_gradient(dual_result.heat_transfer_coefficient_w_per_m2k, variables),
+        heat_transfer_rate_gradient=_dual_gradient(dual_result.heat_transfer_rate_w, variables),
+    )
+
+
+
+def _dual_gradient(value: DualNumber | float, variables: tuple[str, ...]) -> FloatArray:
+    if isinstance(value, DualNumber):
+        return np.array(value.gradient, dtype=np.float64)
+    return np.zeros(len(variables), dtype=np.float64)
+
+
+
 def generate_velocity_sweep(
     base_inputs: ConvectionInputs,
     v_min: float,
     v_max: float,
     points: int,
 ) -> VelocitySweepResult:
+    blocks = list(iter_velocity_sweep(base_inputs, v_min, v_max, points))
+    return VelocitySweepResult(
+        velocities_m_per_s=np.concatenate([block.velocities_m_per_s for block in blocks]),
+        heat_transfer_coefficients_w_per_m2k=np.concatenate(
+            [block.heat_transfer_coefficients_w_per_m2k for block in blocks]
+        ),
+        heat_transfer_rates_w=np.concatenate([block.heat_transfer_rates_w for block in blocks]),
+    )
+
+
+
+def iter_velocity_sweep(
+    base_inputs: ConvectionInputs,
+    v_min: float,
+    v_max: float,
+    points: int,
+    *,
+    block_size: int = SWEEP_BLOCK_POINTS,
+) -> Iterator[VelocitySweepResult]:
     if points <= 1:
         raise ValueError("points must be greater than 1")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    _validate_sweep_limits(v_min, v_max)
+    # Only the swept velocities are evaluated, so the base velocity is not checked.
+    _validate_inputs(base_inputs.with_velocity(v_min))
+    return _velocity_sweep_blocks(base_inputs, v_min, (v_max - v_min) / (points - 1), points, block_size)
+
+
+
+def _velocity_sweep_blocks(
+    base_inputs: ConvectionInputs,
+    v_min: float,
+    step: float,
+    points: int,
+    block_size: int,
+) -> Iterator[VelocitySweepResult]:
+    for start in range(0, points, block_size):
+        velocities = v_min + step * np.arange(start, min(start + block_size, points), dtype=np.float64)
+        batch = compute_cases_batch(ConvectionBatchInputs.from_base(base_inputs, velocities_m_per_s=velocities))
+        yield VelocitySweepResult(
+            velocities_m_per_s=velocities,
+            heat_transfer_coefficients_w_per_m2k=batch.heat_transfer_coefficients_w_per_m2k,
+            heat_transfer_rates_w=batch.heat_transfer_rates_w,
+        )
+
+
+
+def summarize_velocity_sweep(blocks: Iterable[VelocitySweepResult]) -> VelocitySweepSummary:
+    points = 0
+    min_h = min_q = math.inf
+    max_h = max_q = -math.inf
+    velocity_at_max_h = velocity_at_max_q = math.nan
+    for block in blocks:
+        if block.velocities_m_per_s.size == 0:
+            continue
+        points += block.velocities_m_per_s.size
+        h_index = int(np.argmax(block.heat_transfer_coefficients_w_per_m2k))
+        q_index = int(np.argmax(block.heat_transfer_rates_w))
+        min_h = min(min_h, float(np.min(block.heat_transfer_coefficients_w_per_m2k)))
+        min_q = min(min_q, float(np.min(block.heat_transfer_rates_w)))
+        if block.heat_transfer_coefficients_w_per_m2k[h_index] > max_h:
+            max_h = float(block.heat_transfer_coefficients_w_per_m2k[h_index])
+            velocity_at_max_h = float(block.velocities_m_per_s[h_index])
+        if block.heat_transfer_rates_w[q_index] > max_q:
+            max_q = float(block.heat_transfer_rates_w[q_index])
+            velocity_at_max_q = float(block.velocities_m_per_s[q_index])
+    if points == 0:
+        raise ValueError("sweep summary requires at least one point")
+
+    return VelocitySweepSummary(
+        points=points,
+        min_heat_transfer_coefficient_w_per_m2k=min_h,
+        max_heat_transfer_coefficient_w_per_m2k=max_h,
+        velocity_at_max_heat_transfer_coefficient_m_per_s=velocity_at_max_h,
+        min_heat_transfer_rate_w=min_q,
+        max_heat_transfer_rate_w=max_q,
+        velocity_at_max_heat_transfer_rate_m_per_s=velocity_at_max_q,
+    )
+
+
+
+def _validate_sweep_limits(v_min: float, v_max: float) -> None:
     if v_min <= 0.0 or v_max <= 0.0:
         raise ValueError("velocity sweep limits must be positive")
     if v_max <= v_min:
         raise ValueError("v_max must be greater than v_min")
 
-    step = (v_max - v_min) / (points - 1)
-    velocities = [v_min + step * index for index in range(points)]
-    heat_transfer_coefficients: list[float] = []
-    heat_transfer_rates: list[float] = []
-    for velocity in velocities:
-        result = compute_case(base_inputs.with_velocity(velocity))
-        heat_transfer_coefficients.append(result.heat_transfer_coefficient_w_per_m2k)
-        heat_transfer_rates.append(result.heat_transfer_rate_w)
 
+
+def generate_adaptive_velocity_sweep(
+    base_inputs: ConvectionInputs,
+    v_min: float,
+    v_max: float,
+    *,
+    initial_points: int = 9,
+    max_points: int = 200,
+    tolerance: float = ADAPTIVE_SWEEP_TOLERANCE,
+) -> VelocitySweepResult:
+    if initial_points <= 1:
+        raise ValueError("initial_points must be greater than 1")
+    if max_points < initial_points:
+        raise ValueError("max_points must be at least initial_points")
+    _validate_sweep_limits(v_min, v_max)
+
+    samples: dict[float, ConvectionResult] = {}
+
+    def evaluate(velocity: float) -> ConvectionResult:
+        samples[velocity] = compute_case(base_inputs.with_velocity(velocity))
+        return samples[velocity]
+
+    step = (v_max - v_min) / (initial_points - 1)
+    coarse = [evaluate(v_min + step * index) for index in range(initial_points)]
+    h_scale = max(abs(result.heat_transfer_coefficient_w_per_m2k) for result in coarse) or 1.0
+    min_width = (v_max - v_min) * ADAPTIVE_SWEEP_MIN_INTERVAL_FRACTION
+
+    # Each queued interval already has its midpoint evaluated; the priority is
+    # the midpoint's deviation from the chord, i.e. a scaled curvature estimate.
+    # Intervals that straddle a regime change are refined first.
+    queue: list[tuple[float, float, float]] = []
+
+    def enqueue(start: float, stop: float) -> None:
+        if stop - start < min_width or len(samples) >= max_points:
+            return
+        midpoint = 0.5 * (start + stop)
+        start_result, stop_result = samples[start], samples[stop]
+        midpoint_result = evaluate(midpoint)
+        chord = 0.5 * (
+            start_result.heat_transfer_coefficient_w_per_m2k + stop_result.heat_transfer_coefficient_w_per_m2k
+        )
+        error = abs(midpoint_result.heat_transfer_coefficient_w_per_m2k - chord) / h_scale
+        if start_result.regime_name != stop_result.regime_name:
+            error = math.inf
+        if error > tolerance:
+            heapq.heappush(queue, (-error, start, stop))
+
+    velocities = sorted(samples)
+    for start, stop in zip(velocities, velocities[1:]):
+        enqueue(start, stop)
+    while queue and len(samples) < max_points:
+        _, start, stop = heapq.heappop(queue)
+        midpoint = 0.5 * (start + stop)
+        enqueue(start, midpoint)
+        enqueue(midpoint, stop)
+
+    velocities = sorted(samples)
     return VelocitySweepResult(
-        velocities_m_per_s=velocities,
-        heat_transfer_coefficients_w_per_m2k=heat_transfer_coefficients,
-        heat_transfer_rates_w=heat_transfer_rates,
+        velocities_m_per_s=np.array(velocities, dtype=np.float64),
+        heat_transfer_coefficients_w_per_m2k=np.array(
+            [samples[v].heat_transfer_coefficient_w_per_m2k for v in velocities],
+            dtype=np.float64,
+        ),
+        heat_transfer_rates_w=np.array([samples[v].heat_transfer_rate_w for v in velocities], dtype=np.float64),
+    )
+
+
+
+def _brent_root(
+    function: Callable[[float], float],
+    lower: float,
+    upper: float,
+    f_lower: float,
+    f_upper: float,
+    rtol: float,
+    max_iterations: int,
+) -> float:
+    a, b, fa, fb = lower, upper, f_lower, f_upper
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(max_iterations):
+        if (fb > 0.0) == (fc > 0.0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tolerance = 2.0 * sys.float_info.epsilon * abs(b) + 0.5 * rtol * abs(b)
+        midpoint_step = 0.5 * (c - b)
+        if abs(midpoint_step) <= tolerance or fb == 0.0:
+            return b
+        if abs(e) >= tolerance and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * midpoint_step * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * midpoint_step * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * midpoint_step * q - abs(tolerance * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = midpoint_step
+        else:
+            d = e = midpoint_step
+        a, fa = b, fb
+        b += d if abs(d) > tolerance else math.copysign(tolerance, midpoint_step)
+        fb = function(b)
+    raise ValueError("inverse solver did not converge")
+
+
+
+def _solve_inverse(
+    base_inputs: ConvectionInputs,
+    field_name: str,
+    target_h: float | None,
+    target_q: float | None,
+    lower: float,
+    upper: float,
+    rtol: float,
+    max_iterations: int,
+) -> InverseSolution:
+    if (target_h is None) == (target_q is None):
+        raise ValueError("exactly one of target_h or target_q must be given")
+    if lower <= 0.0 or upper <= lower:
+        raise ValueError("search interval must be positive and increasing")
+
+    results: dict[float, ConvectionResult] = {}
+
+    def evaluate(value: float) -> ConvectionResult:
+        if value not in results:
+            results[value] = compute_case(replace(base_inputs, **{field_name: value}))
+        return results[value]
+
+    def residual(value: float) -> float:
+        result = evaluate(value)
+        if target_h is not None:
+            return result.heat_transfer_coefficient_w_per_m2k - target_h
+        return result.heat_transfer_rate_w - (target_q or 0.0)
+
+    # Re is proportional to both velocity and characteristic length, so every
+    # regime boundary maps to one point of the search interval.
+    reynolds_per_unit = evaluate(lower).reynolds_number / lower
+    boundaries = [
+        reynolds_boundary / reynolds_per_unit
+        for reynolds_boundary in _correlations[base_inputs.case].regime_boundaries
+        if lower < reynolds_boundary / reynolds_per_unit < upper
+    ]
+    segments = list(zip([lower, *boundaries], [*boundaries, upper]))
+    side_offset = 1.0e-9
+
+    for index, (start, stop) in enumerate(segments):
+        inner_start = start if index == 0 else start * (1.0 + side_offset)
+        inner_stop = stop if index == len(segments) - 1 else stop * (1.0 - side_offset)
+        f_start = residual(inner_start)
+        f_stop = residual(inner_stop)
+        if f_start == 0.0:
+            return InverseSolution(inner_start, evaluate(inner_start), len(results))
+        if (f_start > 0.0) != (f_stop > 0.0):
+            root = _brent_root(residual, inner_start, inner_stop, f_start, f_stop, rtol, max_iterations)
+            return InverseSolution(root, evaluate(root), len(results))
+        if index < len(segments) - 1:
+            f_after = residual(stop * (1.0 + side_offset))
+            if (f_stop > 0.0) != (f_after > 0.0):
+                return InverseSolution(stop, evaluate(stop), len(results), inside_discontinuity=True)
+
+    raise ValueError("target is not reachable within the search interval")
+
+
+
+def solve_for_velocity(
+    base_inputs: ConvectionInputs,
+    *,
+    target_h: float | None = None,
+    target_q: float | None = None,
+    v_min: float = 1.0e-3,
+    v_max: float = 100.0,
+    rtol: float = INVERSE_SOLVER_RTOL,
+    max_iterations: int = INVERSE_SOLVER_MAX_ITERATIONS,
+) -> InverseSolution:
+    return _solve_inverse(base_inputs, "velocity_m_per_s", target_h, target_q, v_min, v_max, rtol, max_iterations)
+
+
+
+def solve_for_characteristic_length(
+    base_inputs: ConvectionInputs,
+    *,
+    target_h: float | None = None,
+    target_q: float | None = None,
+    length_min: float = 1.0e-4,
+    length_max: float = 10.0,
+    rtol: float = INVERSE_SOLVER_RTOL,
+    max_iterations: int = INVERSE_SOLVER_MAX_ITERATIONS,
+) -> InverseSolution:
+    return _solve_inverse(
+        base_inputs,
+        "characteristic_length_m",
+        target_h,
+        target_q,
+        length_min,
+        length_max,
+        rtol,
+        max_iterations,
+    )
+
+
+
+def _pack_columns(layouts: Mapping[bytes, Sequence[str]], columns: Sequence[npt.NDArray[Any]]) -> bytes:
+    row_count = columns[0].size
+    if any(column.size != row_count for column in columns):
+        raise ValueError("result columns must have equal length")
+    # The first layout whose float width matches the leading column names the
+    # format; the others are cast to it, so the header always describes the body.
+    float_width = np.dtype(columns[0].dtype).itemsize
+    magic, dtypes = next(
+        ((magic, dtypes) for magic, dtypes in layouts.items() if np.dtype(dtypes[0]).itemsize == float_width),
+        next(iter(layouts.items())),
+    )
+    header = _RESULT_HEADER.pack(magic, _RESULT_FORMAT_VERSION, len(columns), row_count)
+    return header + b"".join(
+        np.ascontiguousarray(column, dtype=dtype).tobytes() for column, dtype in zip(columns, dtypes)
+    )
+
+
+
+def _unpack_columns(buffer: Buffer, layouts: Mapping[bytes, Sequence[str]]) -> tuple[npt.NDArray[Any], ...]:
+    view = memoryview(buffer).cast("B")
+    if view.nbytes < _RESULT_HEADER.size:
+        raise ValueError("buffer is too small to hold a result header")
+    found_magic, version, found_columns, row_count = _RESULT_HEADER.unpack_from(view)
+    dtypes = layouts.get(found_magic)
+    if dtypes is None or version != _RESULT_FORMAT_VERSION or found_columns != len(dtypes):
+        raise ValueError("buffer does not hold a compatible serialized result")
+    itemsizes = [np.dtype(dtype).itemsize for dtype in dtypes]
+    if view.nbytes != _RESULT_HEADER.size + sum(itemsizes) * row_count:
+        raise ValueError("buffer size does not match its result header")
+    columns: list[npt.NDArray[Any]] = []
+    offset = _RESULT_HEADER.size
+    for dtype, itemsize in zip(dtypes, itemsizes):
+        columns.append(np.frombuffer(view, dtype=dtype, count=row_count, offset=offset))
+        offset += itemsize * row_count
+    return tuple(columns)
+
+
+
+def _float_column(values: npt.ArrayLike | None, default: float) -> FloatArray:
+    if values is None:
+        return np.atleast_1d(np.asarray(default, dtype=np.float64))
+    return np.atleast_1d(np.asarray(values, dtype=np.float64))
+
+
+
+def _validate_batch_inputs(batch: ConvectionBatchInputs) -> None:
+    if np.any(batch.velocities_m_per_s <= 0.0):
+        raise ValueError("velocity must be positive")
+    if np.any(batch.characteristic_lengths_m <= 0.0):
+        raise ValueError("characteristic length must be positive")
+    if np.any(batch.flow_lengths_m <= 0.0):
+        raise ValueError("flow length must be positive")
+    if np.any(batch.areas_m2 <= 0.0):
+        raise ValueError("area must be positive")
+    if batch.air_property_scale_factors is not None:
+        if batch.air_property_scale_factors.shape != (4, *batch.velocities_m_per_s.shape):
+            raise ValueError("air property scale factors must have shape (4, *batch shape)")
+        if not np.all(batch.air_property_scale_factors > 0.0):
+            raise ValueError("air property scale factors must be positive")
+
+
+
+def _air_property_arrays(
+    batch: ConvectionBatchInputs,
+    provider: AirPropertyProvider,
+) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    properties = _unscaled_air_property_arrays(batch, provider)
+    if batch.air_property_scale_factors is None:
+        return properties
+    rho_kg_per_m3, mu_pa_s, k_w_per_mk, cp_j_per_kgk = (
+        values * factors for values, factors in zip(properties, batch.air_property_scale_factors)
+    )
+    return rho_kg_per_m3, mu_pa_s, k_w_per_mk, cp_j_per_kgk
+
+
+
+def _unscaled_air_property_arrays(
+    batch: ConvectionBatchInputs,
+    provider: AirPropertyProvider,
+) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    if not batch.auto_properties:
+        if batch.air_properties is None:
+            raise ValueError("manual property mode requires AirProperties")
+        _validate_air_properties(batch.air_properties)
+        shape = batch.velocities_m_per_s.shape
+        return (
+            np.full(shape, batch.air_properties.rho_kg_per_m3),
+            np.full(shape, batch.air_properties.mu_pa_s),
+            np.full(shape, batch.air_properties.k_w_per_mk),
+            np.full(shape, batch.air_properties.cp_j_per_kgk),
+        )
+
+    film_temperature_c = 0.5 * (batch.surface_temperatures_c + batch.ambient_temperatures_c)
+    return provider.property_arrays(film_temperature_c)
+
+
+
+def _warning_mask(condition: npt.NDArray[np.bool_], flag: ConvectionWarning) -> WarningMaskArray:
+    return condition.astype(np.uint32) * np.uint32(flag)
+
+
+
+def _flat_plate_nusselt_array(
+    reynolds_numbers: FloatArray,
+    prandtl_numbers: FloatArray,
+) -> tuple[FloatArray, WarningMaskArray]:
+    nusselt_numbers = np.empty_like(reynolds_numbers)
+    laminar = reynolds_numbers < 5.0e5
+    turbulent = ~laminar
+    pr_third = prandtl_numbers ** (1.0 / 3.0)
+    nusselt_numbers[laminar] = 0.664 * reynolds_numbers[laminar] ** 0.5 * pr_third[laminar]
+    nusselt_numbers[turbulent] = (0.037 * reynolds_numbers[turbulent] ** 0.8 - 871.0) * pr_third[turbulent]
+    warning_flags = _warning_mask(
+        (prandtl_numbers < 0.6) | (prandtl_numbers > 60.0),
+        ConvectionWarning.FLAT_PLATE_PRANDTL_RANGE,
+    ) | _warning_mask(reynolds_numbers > 1.0e7, ConvectionWarning.FLAT_PLATE_REYNOLDS_RANGE)
+    return nusselt_numbers, warning_flags
+
+
+
+def _cylinder_crossflow_nusselt_array(
+    reynolds_numbers: FloatArray,
+    prandtl_numbers: FloatArray,
+) -> tuple[FloatArray, WarningMaskArray]:
+    numerator = 0.62 * reynolds_numbers**0.5 * prandtl_numbers ** (1.0 / 3.0)
+    denominator = (1.0 + (0.4 / prandtl_numbers) ** (2.0 / 3.0)) ** 0.25
+    correction = (1.0 + (reynolds_numbers / 282_000.0) ** (5.0 / 8.0)) ** (4.0 / 5.0)
+    warning_flags = _warning_mask(
+        reynolds_numbers * prandtl_numbers <= 0.2,
+        ConvectionWarning.CHURCHILL_BERNSTEIN_RANGE,
+    )
+    return 0.3 + numerator / denominator * correction, warning_flags
+
+
+
+def _sphere_crossflow_nusselt_array(
+    reynolds_numbers: FloatArray,
+    prandtl_numbers: FloatArray,
+    viscosity_ratios: FloatArray,
+) -> tuple[FloatArray, WarningMaskArray]:
+    nusselt_numbers = (
+        2.0
+        + (0.4 * reynolds_numbers**0.5 + 0.06 * reynolds_numbers ** (2.0 / 3.0))
+        * prandtl_numbers**0.4
+        * viscosity_ratios**0.25
+    )
+    warning_flags = _warning_mask(
+        (reynolds_numbers < 3.5) | (reynolds_numbers > 7.6e4),
+        ConvectionWarning.WHITAKER_REYNOLDS_RANGE,
+    ) | _warning_mask((prandtl_numbers < 0.71) | (prandtl_numbers > 380.0), ConvectionWarning.WHITAKER_PRANDTL_RANGE)
+    return nusselt_numbers, warning_flags
+
+
+
+def _gnielinski_turbulent_nusselt_array(reynolds_numbers: FloatArray, prandtl_numbers: FloatArray) -> FloatArray:
+    friction_factor = (0.79 * np.log(reynolds_numbers) - 1.64) ** -2
+    numerator = (friction_factor / 8.0) * (reynolds_numbers - 1000.0) * prandtl_numbers
+    denominator = 1.0 + 12.7 * (friction_factor / 8.0) ** 0.5 * (prandtl_numbers ** (2.0 / 3.0) - 1.0)
+    return numerator / denominator
+
+
+
+def _internal_tube_nusselt_array(
+    reynolds_numbers: FloatArray,
+    prandtl_numbers: FloatArray,
+    diameters_m: FloatArray,
+    lengths_m: FloatArray,
+) -> tuple[FloatArray, WarningMaskArray]:
+    nusselt_numbers = np.empty_like(reynolds_numbers)
+    laminar = reynolds_numbers < 2300.0
+    turbulent = reynolds_numbers >= 3000.0
+    transition = ~(laminar | turbulent)
+    needs_hausen = ~turbulent
+
+    graetz_numbers = (
+        reynolds_numbers[needs_hausen] * prandtl_numbers[needs_hausen] * diameters_m[needs_hausen] / lengths_m[needs_hausen]
+    )
+    hausen_nusselt = np.empty_like(reynolds_numbers)
+    hausen_nusselt[needs_hausen] = 3.66 + (0.0668 * graetz_numbers) / (1.0 + 0.04 * graetz_numbers ** (2.0 / 3.0))
+
+    nusselt_numbers[laminar] = hausen_nusselt[laminar]
+    nusselt_numbers[turbulent] = _gnielinski_turbulent_nusselt_array(
+        reynolds_numbers[turbulent],
+        prandtl_numbers[turbulent],
+    )
+    transition_weight = (reynolds_numbers[transition] - 2300.0) / 700.0
+    turbulent_reference_nusselt = _gnielinski_turbulent_nusselt_array(
+        np.full(transition_weight.shape, 3000.0),
+        prandtl_numbers[transition],
+    )
+    nusselt_numbers[transition] = (
+        (1.0 - transition_weight) * hausen_nusselt[transition] + transition_weight * turbulent_reference_nusselt
+    )
+
+    warning_flags = (
+        _warning_mask(transition, ConvectionWarning.INTERNAL_TRANSITION)
+        | _warning_mask(
+            ~laminar & ((prandtl_numbers < 0.5) | (prandtl_numbers > 2000.0)),
+            ConvectionWarning.GNIELINSKI_PRANDTL_RANGE,
+        )
+        | _warning_mask(turbulent & (reynolds_numbers > 5.0e6), ConvectionWarning.GNIELINSKI_REYNOLDS_RANGE)
+        | _warning_mask(~laminar & (lengths_m / diameters_m < 10.0), ConvectionWarning.SHORT_TUBE)
+    )
+    return nusselt_numbers, warning_flags
+
+
+
+def _property_warning_mask(batch: ConvectionBatchInputs) -> WarningMaskArray:
+    if not batch.auto_properties:
+        return np.zeros(batch.velocities_m_per_s.shape, dtype=np.uint32)
+    film_temperature_c = 0.5 * (batch.surface_temperatures_c + batch.ambient_temperatures_c)
+    return _warning_mask(
+        (film_temperature_c < AUTO_PROPERTY_MIN_TEMP_C) | (film_temperature_c > AUTO_PROPERTY_MAX_TEMP_C),
+        ConvectionWarning.AUTO_PROPERTIES_OUT_OF_RANGE,
+    )
+
+
+
+def _case_groups(batch: ConvectionBatchInputs) -> list[tuple[ConvectionCase, npt.NDArray[np.bool_] | None]]:
+    if isinstance(batch.case, ConvectionCase):
+        return [(batch.case, None)]
+    case_values = np.asarray(batch.case, dtype=str).reshape(batch.velocities_m_per_s.shape)
+    groups: list[tuple[ConvectionCase, npt.NDArray[np.bool_] | None]] = []
+    for case in ConvectionCase:
+        mask = case_values == case.value
+        if np.any(mask):
+            groups.append((case, mask))
+    return groups
+
+
+
+def batch_subset(
+    batch: ConvectionBatchInputs,
+    case: ConvectionCase | None,
+    mask: npt.NDArray[np.bool_],
+) -> ConvectionBatchInputs:
+    # case=None keeps the batch's own case, subsetting it when it is per row.
+    if case is None:
+        case = batch.case if isinstance(batch.case, str) else [row for row, keep in zip(batch.case, mask) if keep]
+    return replace(
+        batch,
+        case=case,
+        velocities_m_per_s=batch.velocities_m_per_s[mask],
+        characteristic_lengths_m=batch.characteristic_lengths_m[mask],
+        flow_lengths_m=batch.flow_lengths_m[mask],
+        areas_m2=batch.areas_m2[mask],
+        surface_temperatures_c=batch.surface_temperatures_c[mask],
+        ambient_temperatures_c=batch.ambient_temperatures_c[mask],
+        air_property_scale_factors=None
+        if batch.air_property_scale_factors is None
+        else batch.air_property_scale_factors[:, mask],
+    )
+
+
+
+def _result_dtype(dtype: npt.DTypeLike) -> np.dtype[Any]:
+    resolved = np.dtype(dtype)
+    if resolved not in (np.dtype(np.float64), np.dtype(np.float32)):
+        raise ValueError("dtype must be float64 or float32")
+    return resolved
+
+
+
+def _cast_batch(batch: ConvectionBatchInputs, dtype: np.dtype[Any]) -> ConvectionBatchInputs:
+    return replace(
+        batch,
+        velocities_m_per_s=batch.velocities_m_per_s.astype(dtype, copy=False),
+        characteristic_lengths_m=batch.characteristic_lengths_m.astype(dtype, copy=False),
+        flow_lengths_m=batch.flow_lengths_m.astype(dtype, copy=False),
+        areas_m2=batch.areas_m2.astype(dtype, copy=False),
+        surface_temperatures_c=batch.surface_temperatures_c.astype(dtype, copy=False),
+        ambient_temperatures_c=batch.ambient_temperatures_c.astype(dtype, copy=False),
     )
 
 
+
+def compute_cases_batch(
+    batch: ConvectionBatchInputs,
+    *,
+    dtype: npt.DTypeLike = np.float64,
+) -> ConvectionBatchResult:
+    _validate_batch_inputs(batch)
+    dtype = _result_dtype(dtype)
+    provider = _air_property_provider
+    # The wall-to-air difference is taken before any narrowing so that nearly
+    # isothermal points do not lose q to cancellation.
+    temperature_differences_c = (batch.surface_temperatures_c - batch.ambient_temperatures_c).astype(
+        dtype, copy=False
+    )
+    if dtype != np.float64:
+        # Single precision: inputs, properties and correlation arithmetic stay
+        # in float32 (see FLOAT32_RELATIVE_ERROR_BOUND for the accuracy cost).
+        batch = _cast_batch(batch, dtype)
+        rho_kg_per_m3, mu_pa_s, k_w_per_mk, cp_j_per_kgk = (
+            values.astype(dtype, copy=False) for values in _air_property_arrays(batch, provider)
+        )
+    else:
+        rho_kg_per_m3, mu_pa_s, k_w_per_mk, cp_j_per_kgk = _air_property_arrays(batch, provider)
+    reynolds_numbers = rho_kg_per_m3 * batch.velocities_m_per_s * batch.characteristic_lengths_m / mu_pa_s
+    prandtl_numbers = cp_j_per_kgk * mu_pa_s / k_w_per_mk
+
+    nusselt_numbers, warning_flags = _nusselt_arrays(batch, reynolds_numbers, prandtl_numbers, provider)
+    warning_flags |= _property_warning_mask(batch)
+    heat_transfer_coefficients = nusselt_numbers * k_w_per_mk / batch.characteristic_lengths_m
+    heat_transfer_rates = heat_transfer_coefficients * batch.areas_m2 * temperature_differences_c
+    return ConvectionBatchResult(
+        reynolds_numbers=reynolds_numbers,
+        prandtl_numbers=prandtl_numbers,
+        nusselt_numbers=nusselt_numbers.astype(dtype, copy=False),
+        heat_transfer_coefficients_w_per_m2k=heat_transfer_coefficients.astype(dtype, copy=False),
+        heat_transfer_rates_w=heat_transfer_rates.astype(dtype, copy=False),
+        warning_flags=warning_flags,
+    )
+
+
+
+def _nusselt_arrays(
+    batch: ConvectionBatchInputs,
+    reynolds_numbers: FloatArray,
+    prandtl_numbers: FloatArray,
+    provider: AirPropertyProvider,
+) -> tuple[FloatArray, WarningMaskArray]:
+    warning_flags = np.zeros(reynolds_numbers.shape, dtype=np.uint32)
+    nusselt_numbers = np.empty_like(reynolds_numbers)
+    for case, mask in _case_groups(batch):
+        correlation = _correlations[case]
+        if mask is None:
+            nusselt_numbers, group_flags = correlation.nusselt_array(reynolds_numbers, prandtl_numbers, batch, provider)
+            warning_flags |= group_flags
+        else:
+            group_nusselt, group_flags = correlation.nusselt_array(
+                reynolds_numbers[mask],
+                prandtl_numbers[mask],
+                batch_subset(batch, case, mask),
+                provider,
+            )
+            nusselt_numbers[mask] = group_nusselt
+            warning_flags[mask] |= group_flags
+    return nusselt_numbers, warning_flags
+
+
+
+class IncrementalEvaluator:
+    """Re-evaluates changed inputs, reusing the property and correlation stages whose inputs are unchanged."""
+
+    def __init__(self) -> None:
+        self.property_evaluations = 0
+        self.correlation_evaluations = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self._inputs: ConvectionInputs | None = None
+        self._provider: AirPropertyProvider | None = None
+        self._correlation: ConvectionCorrelation | None = None
+        self._batch: ConvectionBatchInputs | None = None
+        self._batch_provider: AirPropertyProvider | None = None
+        self._batch_correlations: dict[ConvectionCase, ConvectionCorrelation] = {}
+
+    def evaluate(self, inputs: ConvectionInputs) -> ConvectionResult:
+        _validate_inputs(inputs)
+        provider = _air_property_provider
+        previous = self._inputs
+        properties_stale = (
+            previous is None
+            or self._provider is not provider
+            or inputs.auto_properties != previous.auto_properties
+            or inputs.air_properties != previous.air_properties
+            or inputs.surface_temperature_c != previous.surface_temperature_c
+            or inputs.ambient_temperature_c != previous.ambient_temperature_c
+        )
+        if properties_stale:
+            self._properties, self._property_warning_flags = _resolve_air_properties(inputs, provider)
+            self._provider = provider
+            self.property_evaluations += 1
+
+        # Correlations may read any geometric or temperature input, so only an
+        # area change (which enters q alone) keeps the correlation stage.
+        correlation = _correlations[inputs.case]
+        if (
+            properties_stale
+            or correlation is not self._correlation
+            or inputs.case != previous.case
+            or inputs.velocity_m_per_s != previous.velocity_m_per_s
+            or inputs.characteristic_length_m != previous.characteristic_length_m
+            or inputs.flow_length_m != previous.flow_length_m
+        ):
+            self._reynolds_number = _reynolds_number(
+                self._properties,
+                inputs.velocity_m_per_s,
+                inputs.characteristic_length_m,
+            )
+            self._outcome = correlation.outcome(
+                self._reynolds_number,
+                self._properties.prandtl_number,
+                inputs,
+                provider,
+            )
+            self._heat_transfer_coefficient = (
+                self._outcome.nusselt_number * self._properties.k_w_per_mk / inputs.characteristic_length_m
+            )
+            self._correlation = correlation
+            self.correlation_evaluations += 1
+        self._inputs = inputs
+
+        return ConvectionResult(
+            air_properties=self._properties,
+            reynolds_number=self._reynolds_number,
+            prandtl_number=self._properties.prandtl_number,
+            nusselt_number=self._outcome.nusselt_number,
+            heat_transfer_coefficient_w_per_m2k=self._heat_transfer_coefficient,
+            heat_transfer_rate_w=self._heat_transfer_coefficient
+            * inputs.area_m2
+            * (inputs.surface_temperature_c - inputs.ambient_temperature_c),
+            warning_flags=self._property_warning_flags | self._outcome.warning_flags,
+            correlation_name=self._outcome.correlation_name,
+            regime_name=self._outcome.regime_name,
+        )
+
+    def evaluate_batch(self, batch: ConvectionBatchInputs) -> ConvectionBatchResult:
+        _validate_batch_inputs(batch)
+        provider = _air_property_provider
+        previous = self._batch
+        properties_stale = (
+            previous is None
+            or self._batch_provider is not provider
+            or batch.velocities_m_per_s.shape != previous.velocities_m_per_s.shape
+            or batch.auto_properties != previous.auto_properties
+            or batch.air_properties != previous.air_properties
+            or not _same_optional_array(batch.air_property_scale_factors, previous.air_property_scale_factors)
+            or not np.array_equal(batch.surface_temperatures_c, previous.surface_temperatures_c)
+            or not np.array_equal(batch.ambient_temperatures_c, previous.ambient_temperatures_c)
+        )
+        if properties_stale:
+            self._property_arrays = _air_property_arrays(batch, provider)
+            self._property_warning_mask = _property_warning_mask(batch)
+            self._batch_provider = provider
+            self.property_evaluations += 1
+
+        if (
+            properties_stale
+            or self._batch_correlations != _correlations
+            or not _same_cases(batch.case, previous.case)
+            or not np.array_equal(batch.velocities_m_per_s, previous.velocities_m_per_s)
+            or not np.array_equal(batch.characteristic_lengths_m, previous.characteristic_lengths_m)
+            or not np.array_equal(batch.flow_lengths_m, previous.flow_lengths_m)
+        ):
+            rho_kg_per_m3, mu_pa_s, k_w_per_mk, cp_j_per_kgk = self._property_arrays
+            self._reynolds_numbers = rho_kg_per_m3 * batch.velocities_m_per_s * batch.characteristic_lengths_m / mu_pa_s
+            self._prandtl_numbers = cp_j_per_kgk * mu_pa_s / k_w_per_mk
+            self._nusselt_numbers, correlation_flags = _nusselt_arrays(
+                batch, self._reynolds_numbers, self._prandtl_numbers, provider
+            )
+            self._warning_flags = self._property_warning_mask | correlation_flags
+            self._heat_transfer_coefficients = self._nusselt_numbers * k_w_per_mk / batch.characteristic_lengths_m
+            # These arrays are handed out again by later calls, so callers get
+            # them read-only rather than as copies.
+            for values in (
+                self._reynolds_numbers,
+                self._prandtl_numbers,
+                self._nusselt_numbers,
+                self._heat_transfer_coefficients,
+                self._warning_flags,
+            ):
+                values.flags.writeable = False
+            self._batch_correlations = dict(_correlations)
+            self.correlation_evaluations += 1
+        # Callers may refill the same arrays in place between calls, so the
+        # comparison baseline has to be a copy.
+        self._batch = replace(
+            batch,
+            case=batch.case if isinstance(batch.case, ConvectionCase) else list(batch.case),
+            velocities_m_per_s=batch.velocities_m_per_s.copy(),
+            characteristic_lengths_m=batch.characteristic_lengths_m.copy(),
+            flow_lengths_m=batch.flow_lengths_m.copy(),
+            surface_temperatures_c=batch.surface_temperatures_c.copy(),
+            ambient_temperatures_c=batch.ambient_temperatures_c.copy(),
+            air_property_scale_factors=None
+            if batch.air_property_scale_factors is None
+            else batch.air_property_scale_factors.copy(),
+        )
+
+        return ConvectionBatchResult(
+            reynolds_numbers=self._reynolds_numbers,
+            prandtl_numbers=self._prandtl_numbers,
+            nusselt_numbers=self._nusselt_numbers,
+            heat_transfer_coefficients_w_per_m2k=self._heat_transfer_coefficients,
+            heat_transfer_rates_w=self._heat_transfer_coefficients
+            * batch.areas_m2
+            * (batch.surface_temperatures_c - batch.ambient_temperatures_c),
+            warning_flags=self._warning_flags,
+        )
+
+
+
+def _same_optional_array(first: FloatArray | None, second: FloatArray | None) -> bool:
+    if first is None or second is None:
+        return first is second
+    return np.array_equal(first, second)
+
+
+
+def _same_cases(
+    first: ConvectionCase | Sequence[ConvectionCase],
+    second: ConvectionCase | Sequence[ConvectionCase],
+) -> bool:
+    if isinstance(first, ConvectionCase) or isinstance(second, ConvectionCase):
+        return first == second
+    return np.array_equal(np.asarray(first, dtype=str), np.asarray(second, dtype=str))
+
+
+
+_GRID_AXIS_BATCH_FIELDS: dict[str, str] = {
+    "velocity_m_per_s": "velocities_m_per_s",
+    "characteristic_length_m": "characteristic_lengths_m",
+    "flow_length_m": "flow_lengths_m",
+    "area_m2": "areas_m2",
+    "surface_temperature_c": "surface_temperatures_c",
+    "ambient_temperature_c": "ambient_temperatures_c",
+}
+
+
+
+def _evaluate_grid_shard(shard: _GridShard) -> tuple[int, int, tuple[npt.NDArray[Any], ...]]:
+    shape = tuple(values.size for values in shard.axis_values)
+    indices = np.unravel_index(np.arange(shard.start, shard.stop), shape)
+    columns = {
+        _GRID_AXIS_BATCH_FIELDS[name]: values[axis_indices]
+        for name, values, axis_indices in zip(shard.axis_names, shard.axis_values, indices)
+    }
+    result = compute_cases_batch(ConvectionBatchInputs.from_base(shard.base_inputs, **columns), dtype=shard.dtype)
+    shard_result = (
+        shard.start,
+        shard.stop,
+        (
+            result.reynolds_numbers,
+            result.prandtl_numbers,
+            result.nusselt_numbers,
+            result.heat_transfer_coefficients_w_per_m2k,
+            result.heat_transfer_rates_w,
+            result.warning_flags,
+        ),
+    )
+    if shard.shared_outputs is None:
+        return shard_result
+    shared = _attach_shared_memory(shard.shared_outputs)
+    try:
+        _store_grid_shards(_grid_output_views(shared.buf, math.prod(shape), shard.dtype), [shard_result])
+    finally:
+        shared.close()
+    return shard.start, shard.stop, ()
+
+
+
+def _grid_output_nbytes(total_points: int, dtype: np.dtype[Any]) -> int:
+    return total_points * (5 * dtype.itemsize + np.dtype(np.uint32).itemsize)
+
+
+
+def _grid_output_views(buffer: Buffer, total_points: int, dtype: npt.DTypeLike) -> tuple[npt.NDArray[Any], ...]:
+    # Five float columns followed by the uint32 warning column; every float
+    # itemsize is a multiple of four, so each column stays aligned.
+    dtype = np.dtype(dtype)
+    float_bytes = 5 * total_points * dtype.itemsize
+    floats = np.frombuffer(buffer, dtype=dtype, count=5 * total_points)
+    return (
+        *np.split(floats, 5),
+        np.frombuffer(buffer, dtype=np.uint32, count=total_points, offset=float_bytes),
+    )
+
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    # The parent owns and unlinks the block. Pool workers share its resource
+    # tracker, where re-registering a name is a no-op before Python 3.13;
+    # later versions count registrations, so workers opt out of tracking.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+
+def _store_grid_shards(
+    outputs: tuple[npt.NDArray[Any], ...],
+    shard_results: Iterable[tuple[int, int, tuple[npt.NDArray[Any], ...]]],
+) -> None:
+    for start, stop, columns in shard_results:
+        for output, column in zip(outputs, columns):
+            output[start:stop] = column
+
+
+
+def generate_grid_sweep(
+    base_inputs: ConvectionInputs,
+    axes: Mapping[str, npt.ArrayLike],
+    *,
+    max_workers: int | None = None,
+    shard_points: int = GRID_SHARD_POINTS,
+    dtype: npt.DTypeLike = np.float64,
+) -> GridSweepResult:
+    dtype = _result_dtype(dtype)
+    if not axes:
+        raise ValueError("grid sweep requires at least one axis")
+    if shard_points <= 0:
+        raise ValueError("shard_points must be positive")
+    unknown_axes = sorted(set(axes) - set(_GRID_AXIS_BATCH_FIELDS))
+    if unknown_axes:
+        raise ValueError(f"unsupported grid axes: {', '.join(unknown_axes)}")
+
+    axis_names = tuple(axes)
+    axis_values = tuple(np.asarray(axes[name], dtype=np.float64).ravel() for name in axis_names)
+    if any(values.size == 0 for values in axis_values):
+        raise ValueError("grid axes must not be empty")
+
+    shape = tuple(values.size for values in axis_values)
+    total_points = math.prod(shape)
+    shards = [
+        _GridShard(base_inputs, axis_names, axis_values, start, min(start + shard_points, total_points), dtype.name)
+        for start in range(0, total_points, shard_points)
+    ]
+
+    if len(shards) == 1 or max_workers == 1:
+        outputs = (
+            *(np.empty(total_points, dtype=dtype) for _ in range(5)),
+            np.empty(total_points, dtype=np.uint32),
+        )
+        _store_grid_shards(outputs, map(_evaluate_grid_shard, shards))
+    else:
+        # Workers write their slices straight into one shared block instead of
+        # pickling columns back. The columns are copied out once at the end so
+        # the block can be closed and unlinked before returning.
+        shared = SharedMemory(create=True, size=_grid_output_nbytes(total_points, dtype))
+        try:
+            shards = [replace(shard, shared_outputs=shared.name) for shard in shards]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for _ in executor.map(_evaluate_grid_shard, shards):
+                    pass
+            outputs = tuple(view.copy() for view in _grid_output_views(shared.buf, total_points, dtype))
+        finally:
+            shared.close()
+            shared.unlink()
+
+    return GridSweepResult(
+        axis_names=axis_names,
+        axis_values=axis_values,
+        reynolds_numbers=outputs[0].reshape(shape),
+        prandtl_numbers=outputs[1].reshape(shape),
+        nusselt_numbers=outputs[2].reshape(shape),
+        heat_transfer_coefficients_w_per_m2k=outputs[3].reshape(shape),
+        heat_transfer_rates_w=outputs[4].reshape(shape),
+        warning_flags=outputs[5].reshape(shape),
+    )
+
+
+
+def batch_regime_names(batch: ConvectionBatchInputs, reynolds_numbers: FloatArray) -> npt.NDArray[np.object_]:
+    regime_names = np.empty(reynolds_numbers.shape, dtype=object)
+    for case, mask in _case_groups(batch):
+        group_reynolds = reynolds_numbers if mask is None else reynolds_numbers[mask]
+        group_names = _correlations[case].regime_names(group_reynolds)
+        if mask is None:
+            regime_names[...] = group_names
+        else:
+            regime_names[mask] = group_names
+    return regime_names
+
+
+
+_CLI_INPUT_FIELDS = (
+    "velocity_m_per_s",
+    "characteristic_length_m",
+    "flow_length_m",
+    "area_m2",
+    "surface_temperature_c",
+    "ambient_temperature_c",
+)
+_CLI_MANUAL_PROPERTY_FIELDS = ("rho_kg_per_m3", "mu_pa_s", "k_w_per_mk", "cp_j_per_kgk")
+_CLI_OUTPUT_FIELDS = (
+    "reynolds_number",
+    "prandtl_number",
+    "nusselt_number",
+    "heat_transfer_coefficient_w_per_m2k",
+    "heat_transfer_rate_w",
+    "regime",
+    "warning_flags",
+    "warnings",
+)
+_CLI_TRUE_VALUES = frozenset({"", "1", "true", "yes", "y", "on"})
+_CLI_FALSE_VALUES = frozenset({"0", "false", "no", "n", "off"})
+
+
+@dataclass(frozen=True, slots=True)
+class _CliTask:
+    first_row_number: int
+    input_header: list[str] | None
+    records: list[list[str]] | list[str]
+    output_fields: list[str] | None
+
+
+@dataclass(slots=True)
+class _CliRows:
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    cases: list[ConvectionCase] = field(default_factory=list)
+    values: list[tuple[float, float, float, float, float, float]] = field(default_factory=list)
+    manual_properties: list[tuple[float, ...] | None] = field(default_factory=list)
+
+
+
+def _is_jsonl_path(path: Path) -> bool:
+    return path.suffix.lower() in {".jsonl", ".ndjson"}
+
+
+
+def _cli_float(row: Mapping[str, Any], name: str) -> float:
+    value = row.get(name)
+    if value is None or value == "":
+        raise ValueError(f"missing {name}")
+    return float(value)
+
+
+
+def _cli_auto_properties(row: Mapping[str, Any]) -> bool:
+    raw_auto = row.get("auto_properties", True)
+    if not isinstance(raw_auto, str):
+        return bool(raw_auto)
+    normalized = raw_auto.strip().lower()
+    if normalized in _CLI_TRUE_VALUES:
+        return True
+    if normalized in _CLI_FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid auto_properties value {raw_auto!r}")
+
+
+
+def _append_cli_row(parsed: _CliRows, row: dict[str, Any]) -> None:
+    case = ConvectionCase(str(row.get("case", "")).strip())
+    velocity = _cli_float(row, "velocity_m_per_s")
+    length = _cli_float(row, "characteristic_length_m")
+    flow_length = length if row.get("flow_length_m") in (None, "") else _cli_float(row, "flow_length_m")
+    area = _cli_float(row, "area_m2")
+    surface_temperature = _cli_float(row, "surface_temperature_c")
+    ambient_temperature = _cli_float(row, "ambient_temperature_c")
+    if velocity <= 0.0:
+        raise ValueError("velocity must be positive")
+    if length <= 0.0:
+        raise ValueError("characteristic length must be positive")
+    if flow_length <= 0.0:
+        raise ValueError("flow length must be positive")
+    if area <= 0.0:
+        raise ValueError("area must be positive")
+
+    manual_properties: tuple[float, ...] | None = None
+    if not _cli_auto_properties(row):
+        manual_properties = tuple(_cli_float(row, name) for name in _CLI_MANUAL_PROPERTY_FIELDS)
+        if min(manual_properties) <= 0.0:
+            raise ValueError("manual air properties must be positive")
+
+    parsed.rows.append(row)
+    parsed.cases.append(case)
+    parsed.values.append((velocity, length, flow_length, area, surface_temperature, ambient_temperature))
+    parsed.manual_properties.append(manual_properties)
+
+
+
+def _parse_cli_task(task: _CliTask) -> _CliRows:
+    parsed = _CliRows()
+    for offset, record in enumerate(task.records):
+        try:
+            row: dict[str, Any] = (
+                json.loads(record) if isinstance(record, str) else dict(zip(task.input_header or (), record))
+            )
+            _append_cli_row(parsed, row)
+        except ValueError as error:
+            raise ValueError(f"row {task.first_row_number + offset}: {error}") from error
+    return parsed
+
+
+
+def _cli_batches(parsed: _CliRows) -> list[tuple[npt.NDArray[np.intp], ConvectionBatchInputs]]:
+    # ConvectionBatchInputs shares one property mode, so rows are grouped by
+    # their manual property values (None for automatic properties).
+    groups: dict[tuple[float, ...] | None, list[int]] = {}
+    for index, manual_properties in enumerate(parsed.manual_properties):
+        groups.setdefault(manual_properties, []).append(index)
+
+    values = np.array(parsed.values, dtype=np.float64)
+    batches: list[tuple[npt.NDArray[np.intp], ConvectionBatchInputs]] = []
+    for manual_properties, index_list in groups.items():
+        indices = np.asarray(index_list, dtype=np.intp)
+        columns = values[indices]
+        air_properties: AirProperties | None = None
+        if manual_properties is not None:
+            rho, mu, k, cp = manual_properties
+            air_properties = AirProperties(
+                rho_kg_per_m3=rho,
+                mu_pa_s=mu,
+                k_w_per_mk=k,
+                cp_j_per_kgk=cp,
+                film_temperature_c=float(np.mean(0.5 * (columns[:, 4] + columns[:, 5]))),
+                source_label="manual override",
+            )
+        batch = ConvectionBatchInputs(
+            case=[parsed.cases[index] for index in index_list],
+            velocities_m_per_s=columns[:, 0],
+            characteristic_lengths_m=columns[:, 1],
+            flow_lengths_m=columns[:, 2],
+            areas_m2=columns[:, 3],
+            surface_temperatures_c=columns[:, 4],
+            ambient_temperatures_c=columns[:, 5],
+            auto_properties=manual_properties is None,
+            air_properties=air_properties,
+        )
+        batches.append((indices, batch))
+    return batches
+
+
+
+@lru_cache(maxsize=None)
+def _warning_flag_names(flags: int) -> str:
+    return "|".join(str(flag.name) for flag in ConvectionWarning if flag and flags & flag)
+
+
+
+def _process_cli_task(task: _CliTask) -> str:
+    parsed = _parse_cli_task(task)
+    row_count = len(parsed.rows)
+    columns = tuple(np.empty(row_count, dtype=np.float64) for _ in range(5))
+    regime_names = np.empty(row_count, dtype=object)
+    warning_flags = np.empty(row_count, dtype=np.uint32)
+    for indices, batch in _cli_batches(parsed):
+        result = compute_cases_batch(batch)
+        for column, values in zip(
+            columns,
+            (
+                result.reynolds_numbers,
+                result.prandtl_numbers,
+                result.nusselt_numbers,
+                result.heat_transfer_coefficients_w_per_m2k,
+                result.heat_transfer_rates_w,
+            ),
+        ):
+            column[indices] = values
+        regime_names[indices] = batch_regime_names(batch, result.reynolds_numbers)
+        warning_flags[indices] = result.warning_flags
+
+    flag_values = warning_flags.tolist()
+    output_columns = (
+        *(column.tolist() for column in columns),
+        regime_names.tolist(),
+        flag_values,
+        [_warning_flag_names(flags) for flags in flag_values],
+    )
+    buffer = io.StringIO()
+    if task.output_fields is None:
+        for row, outputs in zip(parsed.rows, zip(*output_columns)):
+            row.update(zip(_CLI_OUTPUT_FIELDS, outputs))
+            buffer.write(json.dumps(row) + "\n")
+    else:
+        input_fields = task.output_fields
+        csv.writer(buffer).writerows(
+            [row.get(name, "") for name in input_fields] + list(outputs)
+            for row, outputs in zip(parsed.rows, zip(*output_columns))
+        )
+    return buffer.getvalue()
+
+
+
+def _iter_cli_tasks(path: Path, output_path: Path, chunk_rows: int) -> Iterator[_CliTask]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        input_header: list[str] | None = None
+        records: Iterator[list[str]] | Iterator[str]
+        if _is_jsonl_path(path):
+            records = (line for line in handle if line.strip())
+        else:
+            csv_records = csv.reader(handle)
+            input_header = next(csv_records, [])
+            records = csv_records
+
+        first_row_number = 1
+        output_fields: list[str] | None = None
+        while chunk := list(itertools.islice(records, chunk_rows)):
+            if not _is_jsonl_path(output_path) and output_fields is None:
+                first_fields = input_header if input_header is not None else list(json.loads(str(chunk[0])))
+                output_fields = [name for name in first_fields if name not in _CLI_OUTPUT_FIELDS]
+            yield _CliTask(first_row_number, input_header, chunk, output_fields)
+            first_row_number += len(chunk)
+
+
+
+def run_batch_file(
+    input_path: Path,
+    output_path: Path,
+    *,
+    chunk_rows: int = CLI_CHUNK_ROWS,
+    max_workers: int | None = None,
+) -> int:
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    worker_count = max_workers or os.cpu_count() or 1
+    row_total = 0
+    with output_path.open("w", encoding="utf-8", newline="") as output:
+
+        def write(task: _CliTask, text: str) -> None:
+            nonlocal row_total
+            if row_total == 0 and task.output_fields is not None:
+                csv.writer(output).writerow([*task.output_fields, *_CLI_OUTPUT_FIELDS])
+            output.write(text)
+            row_total += len(task.records)
+
+        tasks = _iter_cli_tasks(input_path, output_path, chunk_rows)
+        if worker_count == 1:
+            for task in tasks:
+                write(task, _process_cli_task(task))
+            return row_total
+
+        # Workers parse, evaluate and format whole chunks. Futures are drained
+        # first-in first-out, so the output keeps the input order while at most
+        # two chunks per worker are in flight.
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            pending: deque[tuple[_CliTask, Future[str]]] = deque()
+            for task in tasks:
+                pending.append((task, executor.submit(_process_cli_task, task)))
+                if len(pending) >= 2 * worker_count:
+                    write(*_resolve_cli_future(pending.popleft()))
+            while pending:
+                write(*_resolve_cli_future(pending.popleft()))
+    return row_total
+
+
+
+def _resolve_cli_future(entry: tuple[_CliTask, Future[str]]) -> tuple[_CliTask, str]:
+    task, future = entry
+    return task, future.result()
+
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convective heat-transfer model command line tools.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    batch_parser = subcommands.add_parser(
+        "batch",
+        help="Evaluate convection cases from a CSV or JSONL file.",
+    )
+    batch_parser.add_argument("input", type=Path, help="CSV or .jsonl file with ConvectionInputs columns")
+    batch_parser.add_argument("output", type=Path, help="CSV or .jsonl file to write results to")
+    batch_parser.add_argument("--chunk-rows", type=int, default=CLI_CHUNK_ROWS, help="rows per worker chunk")
+    batch_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    return parser.parse_args(argv)
+
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        row_total = run_batch_file(args.input, args.output, chunk_rows=args.chunk_rows, max_workers=args.workers)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    print(f"Wrote {row_total} rows to {args.output}")
+    return 0
+
+
 __all__ = [
     "AirProperties",
+    "AirPropertyProvider",
+    "CachedAirPropertyProvider",
+    "ConvectionBatchInputs",
+    "ChurchillBernsteinCorrelation",
+    "ConvectionBatchResult",
     "ConvectionCase",
+    "ConvectionCorrelation",
+    "ConvectionGradients",
     "ConvectionInputs",
     "ConvectionResult",
+    "ConvectionWarning",
+    "CorrelationOutcome",
+    "DittusBoelterCorrelation",
+    "DualNumber",
+    "FlatPlateCorrelation",
+    "GridSweepResult",
+    "HausenGnielinskiCorrelation",
+    "IncrementalEvaluator",
+    "InverseSolution",
+    "StageProfiler",
+    "StageTiming",
+    "TabulatedAirPropertyProvider",
     "VelocitySweepResult",
+    "VelocitySweepSummary",
+    "WhitakerSphereCorrelation",
+    "ZukauskasCylinderCorrelation",
+    "applicability_warning_flags",
+    "applicability_warning_mask",
+    "batch_regime_names",
+    "batch_subset",
     "compute_air_properties",
     "compute_case",
+    "compute_case_with_gradients",
+    "compute_cases_batch",
+    "format_stage_report",
+    "generate_adaptive_velocity_sweep",
+    "generate_grid_sweep",
     "generate_velocity_sweep",
+    "get_air_property_provider",
+    "get_correlation",
+    "get_stage_profiler",
+    "iter_velocity_sweep",
+    "main",
+    "profile_stages",
+    "register_correlation",
+    "run_batch_file",
+    "set_air_property_provider",
+    "solve_for_characteristic_length",
+    "solve_for_velocity",
+    "summarize_velocity_sweep",
+    "warning_messages",
 ]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from http import HTTPStatus
+import json
+import math
+import sys
+import traceback
+from typing import Any
+
+from convective_heat_model import (
+    AirProperties,
+    ConvectionBatchInputs,
+    ConvectionCase,
+    ConvectionInputs,
+    batch_regime_names,
+    compute_cases_batch,
+    generate_velocity_sweep,
+    get_air_property_provider,
+    get_correlation,
+    warning_messages,
+)
+
+
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+# Requests arriving within this window of the first queued one share a batch.
+SERVICE_BATCH_WINDOW_S = 0.002
+SERVICE_MAX_BATCH_SIZE = 4096
+SERVICE_CACHE_SIZE = 4096
+SERVICE_MAX_SWEEP_POINTS = 1_000_000
+SERVICE_MAX_BODY_BYTES = 16 * 1024 * 1024
+_LOCAL_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+_INPUT_FIELDS = (
+    "velocity_m_per_s",
+    "characteristic_length_m",
+    "area_m2",
+    "surface_temperature_c",
+    "ambient_temperature_c",
+)
+_MANUAL_PROPERTY_FIELDS = ("rho_kg_per_m3", "mu_pa_s", "k_w_per_mk", "cp_j_per_kgk")
+
+
+class _HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(slots=True)
+class ServiceStats:
+    requests: int = 0
+    cache_hits: int = 0
+    batches: int = 0
+    batched_cases: int = 0
+
+
+def _json_float(payload: Mapping[str, Any], name: str) -> float:
+    value = payload.get(name)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{name} must be a finite number")
+    return float(value)
+
+
+def inputs_from_json(payload: object) -> ConvectionInputs:
+    if not isinstance(payload, Mapping):
+        raise ValueError("case inputs must be a JSON object")
+    values = {name: _json_float(payload, name) for name in _INPUT_FIELDS}
+    flow_length = values["characteristic_length_m"]
+    if payload.get("flow_length_m") is not None:
+        flow_length = _json_float(payload, "flow_length_m")
+    auto_properties = payload.get("auto_properties", True)
+    if not isinstance(auto_properties, bool):
+        raise ValueError("auto_properties must be true or false")
+    air_properties = None
+    if not auto_properties:
+        air_properties = AirProperties(
+            *(_json_float(payload, name) for name in _MANUAL_PROPERTY_FIELDS),
+            film_temperature_c=0.5 * (values["surface_temperature_c"] + values["ambient_temperature_c"]),
+            source_label="manual override",
+        )
+    inputs = ConvectionInputs(
+        case=ConvectionCase(str(payload.get("case", ""))),
+        flow_length_m=flow_length,
+        auto_properties=auto_properties,
+        air_properties=air_properties,
+        **values,
+    )
+    if min(inputs.velocity_m_per_s, inputs.characteristic_length_m, inputs.flow_length_m, inputs.area_m2) <= 0.0:
+        raise ValueError("velocity, lengths and area must be positive")
+    if air_properties is not None and min(
+        air_properties.rho_kg_per_m3, air_properties.mu_pa_s, air_properties.k_w_per_mk, air_properties.cp_j_per_kgk
+    ) <= 0.0:
+        raise ValueError("manual air properties must be positive")
+    return inputs
+
+
+def _evaluate_inputs(rows: Sequence[ConvectionInputs]) -> list[dict[str, Any]]:
+    # One vectorized call per property mode; ConvectionBatchInputs cannot mix them.
+    groups: dict[tuple[bool, AirProperties | None], list[int]] = {}
+    for index, inputs in enumerate(rows):
+        groups.setdefault((inputs.auto_properties, inputs.air_properties), []).append(index)
+
+    responses: list[dict[str, Any]] = [{} for _ in rows]
+    for indices in groups.values():
+        group_rows = [rows[index] for index in indices]
+        batch = ConvectionBatchInputs.from_inputs(group_rows)
+        result = compute_cases_batch(batch)
+        regime_names = batch_regime_names(batch, result.reynolds_numbers)
+        for position, (index, flags) in enumerate(zip(indices, result.warning_flags.tolist())):
+            responses[index] = {
+                "reynolds_number": float(result.reynolds_numbers[position]),
+                "prandtl_number": float(result.prandtl_numbers[position]),
+                "nusselt_number": float(result.nusselt_numbers[position]),
+                "heat_transfer_coefficient_w_per_m2k": float(result.heat_transfer_coefficients_w_per_m2k[position]),
+                "heat_transfer_rate_w": float(result.heat_transfer_rates_w[position]),
+                "regime": str(regime_names[position]),
+                "warning_flags": flags,
+                "warnings": warning_messages(flags),
+            }
+    return responses
+
+
+class ConvectionService:
+    """Localhost JSON endpoints that coalesce concurrent single-case requests into batches."""
+
+    def __init__(
+        self,
+        *,
+        batch_window_s: float = SERVICE_BATCH_WINDOW_S,
+        max_batch_size: int = SERVICE_MAX_BATCH_SIZE,
+        cache_size: int = SERVICE_CACHE_SIZE,
+    ) -> None:
+        if batch_window_s < 0.0:
+            raise ValueError("batch_window_s must not be negative")
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        self.batch_window_s = batch_window_s
+        self.max_batch_size = max_batch_size
+        self.cache_size = cache_size
+        self.stats = ServiceStats()
+        self._cache: OrderedDict[ConvectionInputs, dict[str, Any]] = OrderedDict()
+        self._cache_model: tuple[object, ...] = ()
+        self._pending: dict[ConvectionInputs, asyncio.Future[dict[str, Any]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def _check_cache_model(self) -> None:
+        # Cached responses are only valid for the provider and correlations
+        # that produced them.
+        model = (get_air_property_provider(), *map(get_correlation, ConvectionCase))
+        if len(model) != len(self._cache_model) or any(a is not b for a, b in zip(model, self._cache_model)):
+            self._cache.clear()
+            self._cache_model = model
+
+    async def evaluate(self, inputs: ConvectionInputs) -> dict[str, Any]:
+        self.stats.requests += 1
+        self._check_cache_model()
+        cached = self._cache.get(inputs)
+        if cached is not None:
+            self._cache.move_to_end(inputs)
+            self.stats.cache_hits += 1
+            return cached
+        future = self._pending.get(inputs)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[inputs] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window_s, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self.stats.batches += 1
+        self.stats.batched_cases += len(pending)
+        rows = list(pending)
+        try:
+            responses = _evaluate_inputs(rows)
+        except Exception:
+            # Retry one by one so a single bad case only fails its own request.
+            for inputs, future in pending.items():
+                try:
+                    future.set_result(_evaluate_inputs([inputs])[0])
+                except Exception as error:
+                    future.set_exception(error)
+            return
+        for inputs, response in zip(rows, responses):
+            pending[inputs].set_result(response)
+            if self.cache_size > 0:
+                self._cache[inputs] = response
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _sweep(self, payload: object) -> dict[str, Any]:
+        if not isinstance(payload, Mapping):
+            raise ValueError("sweep request must be a JSON object")
+        inputs = inputs_from_json(payload.get("inputs"))
+        v_min = _json_float(payload, "v_min")
+        v_max = _json_float(payload, "v_max")
+        points = payload.get("points")
+        if not isinstance(points, int) or isinstance(points, bool) or not 1 < points <= SERVICE_MAX_SWEEP_POINTS:
+            raise ValueError(f"points must be an integer between 2 and {SERVICE_MAX_SWEEP_POINTS}")
+        # Sweeps can take long enough to stall other clients, so they run off
+        # the event loop.
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, generate_velocity_sweep, inputs, v_min, v_max, points
+        )
+        return {
+            "velocities_m_per_s": result.velocities_m_per_s.tolist(),
+            "heat_transfer_coefficients_w_per_m2k": result.heat_transfer_coefficients_w_per_m2k.tolist(),
+            "heat_transfer_rates_w": result.heat_transfer_rates_w.tolist(),
+        }
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> object:
+        if path == "/health":
+            if method != "GET":
+                raise _HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "use GET")
+            return {"status": "ok"}
+        if path not in ("/case", "/sweep"):
+            raise _HttpError(HTTPStatus.NOT_FOUND, f"unknown endpoint {path}")
+        if method != "POST":
+            raise _HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+        try:
+            payload = json.loads(body)
+            if path == "/sweep":
+                return await self._sweep(payload)
+            if isinstance(payload, list):
+                # An explicit batch is already vectorized; only singles are coalesced.
+                rows = [inputs_from_json(item) for item in payload]
+                self.stats.requests += 1
+                return _evaluate_inputs(rows) if rows else []
+            return await self.evaluate(inputs_from_json(payload))
+        except ValueError as error:
+            raise _HttpError(HTTPStatus.BAD_REQUEST, str(error)) from error
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                keep_alive = True
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                    headers: dict[str, str] = {}
+                    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                    length = int(headers.get("content-length", "0"))
+                    if not 0 <= length <= SERVICE_MAX_BODY_BYTES:
+                        raise _HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+                    body = await reader.readexactly(length)
+                    status, response = HTTPStatus.OK, await self._dispatch(method, path.split("?", 1)[0], body)
+                except _HttpError as error:
+                    status, response = error.status, {"error": str(error)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except ValueError:
+                    status, response, keep_alive = HTTPStatus.BAD_REQUEST, {"error": "malformed request"}, False
+                except Exception:
+                    # Anything else is a server fault; answer it rather than
+                    # dropping the connection, and keep the traceback.
+                    traceback.print_exc(file=sys.stderr)
+                    status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal server error"}
+                encoded = json.dumps(response).encode()
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(encoded)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + encoded
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> asyncio.Server:
+        if host not in _LOCAL_HOSTS:
+            raise ValueError("the convection service only binds to localhost")
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+async def _serve(host: str, port: int, service: ConvectionService) -> None:
+    server = await service.start(host, port)
+    addresses = ", ".join(f"{socket.getsockname()[0]}:{socket.getsockname()[1]}" for socket in server.sockets)
+    print(f"Serving convection model on {addresses}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the convection model as localhost JSON endpoints.")
+    parser.add_argument("--host", default=SERVICE_HOST, choices=sorted(_LOCAL_HOSTS))
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument(
+        "--batch-window-ms",
+        type=float,
+        default=SERVICE_BATCH_WINDOW_S * 1000.0,
+        help="how long the first queued case waits for others to join its batch",
+    )
+    parser.add_argument("--cache-size", type=int, default=SERVICE_CACHE_SIZE, help="cached single-case responses")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    service = ConvectionService(batch_window_s=args.batch_window_ms / 1000.0, cache_size=args.cache_size)
+    try:
+        asyncio.run(_serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+__all__ = [
+    "ConvectionService",
+    "ServiceStats",
+    "inputs_from_json",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
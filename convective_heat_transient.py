@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from convective_heat_model import (
+    ConvectionBatchInputs,
+    ConvectionInputs,
+    FloatArray,
+    batch_subset,
+    compute_cases_batch,
+)
+
+
+COOLING_RTOL = 1.0e-6
+COOLING_ATOL_K = 1.0e-6
+COOLING_MAX_STEPS = 100_000
+# Film-temperature drift (K) below which a part keeps its last heat-transfer
+# coefficient; half a kelvin of surface drift moves h by well under 0.1 % in air.
+FILM_TEMPERATURE_REUSE_TOLERANCE_C = 0.25
+INITIAL_STEP_TIME_CONSTANT_FRACTION = 0.01
+
+# Dormand-Prince 5(4) tableau. The cooling law is autonomous, so the stage
+# times are not needed; the last stage is evaluated at the accepted point and
+# reused as the first stage of the next step.
+_DOPRI_A = (
+    (),
+    (1.0 / 5.0,),
+    (3.0 / 40.0, 9.0 / 40.0),
+    (44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0),
+    (19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0),
+    (9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0),
+)
+_DOPRI_B = (35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0)
+_DOPRI_ERROR = (
+    71.0 / 57600.0,
+    0.0,
+    -71.0 / 16695.0,
+    71.0 / 1920.0,
+    -17253.0 / 339200.0,
+    22.0 / 525.0,
+    -1.0 / 40.0,
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CoolingResult:
+    times_s: FloatArray
+    surface_temperatures_c: FloatArray
+    heat_transfer_coefficients_w_per_m2k: FloatArray
+    heat_transfer_rates_w: FloatArray
+    rejected_steps: int
+    derivative_evaluations: int
+    correlation_evaluations: int
+
+    @property
+    def final_temperatures_c(self) -> FloatArray:
+        return self.surface_temperatures_c[-1]
+
+
+class _CoefficientCache:
+    def __init__(self, batch: ConvectionBatchInputs, tolerance_c: float) -> None:
+        self.batch = batch
+        self.tolerance_c = tolerance_c
+        self.film_temperatures_c = np.full(len(batch), np.nan)
+        self.coefficients_w_per_m2k = np.empty(len(batch))
+        self.evaluations = 0
+
+    def coefficients(self, surface_temperatures_c: FloatArray) -> FloatArray:
+        film_temperatures_c = 0.5 * (surface_temperatures_c + self.batch.ambient_temperatures_c)
+        stale = ~(np.abs(film_temperatures_c - self.film_temperatures_c) <= self.tolerance_c)
+        if not np.any(stale):
+            return self.coefficients_w_per_m2k
+        stale_batch = replace(self.batch, surface_temperatures_c=surface_temperatures_c)
+        if not np.all(stale):
+            stale_batch = batch_subset(stale_batch, None, stale)
+        self.coefficients_w_per_m2k[stale] = compute_cases_batch(stale_batch).heat_transfer_coefficients_w_per_m2k
+        self.film_temperatures_c[stale] = film_temperatures_c[stale]
+        self.evaluations += int(np.count_nonzero(stale))
+        return self.coefficients_w_per_m2k
+
+
+def _part_column(values: npt.ArrayLike, part_count: int, name: str) -> FloatArray:
+    column = np.broadcast_to(np.asarray(values, dtype=np.float64), (part_count,)).copy()
+    if not np.all(column > 0.0):
+        raise ValueError(f"{name} must be positive")
+    return column
+
+
+def simulate_cooling(
+    inputs: ConvectionInputs | Sequence[ConvectionInputs],
+    mass_kg: npt.ArrayLike,
+    cp_solid_j_per_kgk: npt.ArrayLike,
+    t_end_s: float,
+    *,
+    rtol: float = COOLING_RTOL,
+    atol_k: float = COOLING_ATOL_K,
+    max_step_s: float = math.inf,
+    film_temperature_tolerance_c: float = FILM_TEMPERATURE_REUSE_TOLERANCE_C,
+    max_steps: int = COOLING_MAX_STEPS,
+) -> CoolingResult:
+    parts = [inputs] if isinstance(inputs, ConvectionInputs) else list(inputs)
+    batch = ConvectionBatchInputs.from_inputs(parts)
+    if t_end_s <= 0.0:
+        raise ValueError("t_end_s must be positive")
+    if rtol <= 0.0 or atol_k <= 0.0:
+        raise ValueError("tolerances must be positive")
+    if film_temperature_tolerance_c < 0.0:
+        raise ValueError("film_temperature_tolerance_c must not be negative")
+    heat_capacities_j_per_k = _part_column(mass_kg, len(batch), "mass_kg") * _part_column(
+        cp_solid_j_per_kgk, len(batch), "cp_solid_j_per_kgk"
+    )
+
+    cache = _CoefficientCache(batch, film_temperature_tolerance_c)
+    ambient_temperatures_c = batch.ambient_temperatures_c
+    areas_m2 = batch.areas_m2
+    derivative_evaluations = 0
+
+    def temperature_rates(surface_temperatures_c: FloatArray) -> FloatArray:
+        nonlocal derivative_evaluations
+        derivative_evaluations += 1
+        coefficients = cache.coefficients(surface_temperatures_c)
+        heat_transfer_rates_w = coefficients * areas_m2 * (surface_temperatures_c - ambient_temperatures_c)
+        return -heat_transfer_rates_w / heat_capacities_j_per_k
+
+    temperatures = batch.surface_temperatures_c.copy()
+    rates = temperature_rates(temperatures)
+    times = [0.0]
+    temperature_history = [temperatures]
+    coefficient_history = [cache.coefficients_w_per_m2k.copy()]
+
+    # Start from a small fraction of the fastest lumped time constant m cp / (h A).
+    time_constants_s = heat_capacities_j_per_k / (cache.coefficients_w_per_m2k * areas_m2)
+    step_s = min(t_end_s, max_step_s, INITIAL_STEP_TIME_CONSTANT_FRACTION * float(np.min(time_constants_s)))
+    time_s = 0.0
+    rejected_steps = 0
+    while time_s < t_end_s:
+        if len(times) > max_steps:
+            raise RuntimeError(f"cooling simulation exceeded {max_steps} steps before t_end_s")
+        step_s = min(step_s, t_end_s - time_s)
+        if step_s <= 1e-12 * t_end_s:
+            raise RuntimeError(f"cooling simulation step size underflow at t={time_s:g} s")
+        stages = [rates]
+        for coefficients in _DOPRI_A[1:]:
+            stage_temperatures = temperatures + step_s * sum(
+                weight * stage for weight, stage in zip(coefficients, stages)
+            )
+            stages.append(temperature_rates(stage_temperatures))
+        new_temperatures = temperatures + step_s * sum(weight * stage for weight, stage in zip(_DOPRI_B, stages))
+        new_rates = temperature_rates(new_temperatures)
+        stages.append(new_rates)
+
+        error = step_s * sum(weight * stage for weight, stage in zip(_DOPRI_ERROR, stages))
+        scale = atol_k + rtol * np.maximum(np.abs(temperatures), np.abs(new_temperatures))
+        error_norm = float(np.sqrt(np.mean((error / scale) ** 2)))
+        if error_norm <= 1.0:
+            time_s = t_end_s if t_end_s - (time_s + step_s) <= 1e-12 * t_end_s else time_s + step_s
+            temperatures, rates = new_temperatures, new_rates
+            times.append(time_s)
+            temperature_history.append(temperatures)
+            coefficient_history.append(cache.coefficients_w_per_m2k.copy())
+        else:
+            rejected_steps += 1
+        growth = 10.0 if error_norm == 0.0 else min(10.0, max(0.2, 0.9 * error_norm**-0.2))
+        step_s = min(max_step_s, step_s * (growth if error_norm <= 1.0 else min(1.0, growth)))
+
+    surface_temperatures = np.stack(temperature_history)
+    coefficients = np.stack(coefficient_history)
+    return CoolingResult(
+        times_s=np.array(times),
+        surface_temperatures_c=surface_temperatures,
+        heat_transfer_coefficients_w_per_m2k=coefficients,
+        heat_transfer_rates_w=coefficients * areas_m2 * (surface_temperatures - ambient_temperatures_c),
+        rejected_steps=rejected_steps,
+        derivative_evaluations=derivative_evaluations,
+        correlation_evaluations=cache.evaluations,
+    )
+
+
+__all__ = [
+    "CoolingResult",
+    "simulate_cooling",
+]
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from convective_heat_model import (
+    AUTO_PROPERTY_MAX_TEMP_C,
+    AUTO_PROPERTY_MIN_TEMP_C,
+    ConvectionBatchInputs,
+    ConvectionCase,
+    ConvectionInputs,
+    ConvectionWarning,
+    FloatArray,
+    WarningMaskArray,
+    get_air_property_provider,
+    get_correlation,
+)
+
+
+TUBE_MARCH_SEGMENTS = 200
+TUBE_MARCH_BLOCK_CELLS = 262_144
+TUBE_MARCH_TOLERANCE_K = 1.0e-6
+TUBE_MARCH_MAX_ITERATIONS = 50
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TubeMarchResult:
+    segment_lengths_m: FloatArray
+    mass_flow_rates_kg_per_s: FloatArray
+    bulk_temperatures_c: FloatArray
+    reynolds_numbers: FloatArray
+    nusselt_numbers: FloatArray
+    heat_transfer_coefficients_w_per_m2k: FloatArray
+    segment_heat_transfer_rates_w: FloatArray
+    warning_flags: WarningMaskArray
+    iterations: int
+
+    @property
+    def outlet_temperatures_c(self) -> FloatArray:
+        return self.bulk_temperatures_c[:, -1]
+
+    @property
+    def heat_transfer_rates_w(self) -> FloatArray:
+        return self.segment_heat_transfer_rates_w.sum(axis=1)
+
+
+def _tube_property_arrays(
+    batch: ConvectionBatchInputs,
+    bulk_temperatures_c: FloatArray,
+) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    if batch.auto_properties:
+        return get_air_property_provider().property_arrays(bulk_temperatures_c)
+    if batch.air_properties is None:
+        raise ValueError("manual property mode requires AirProperties")
+    properties = batch.air_properties
+    return (
+        np.full(bulk_temperatures_c.shape, properties.rho_kg_per_m3),
+        np.full(bulk_temperatures_c.shape, properties.mu_pa_s),
+        np.full(bulk_temperatures_c.shape, properties.k_w_per_mk),
+        np.full(bulk_temperatures_c.shape, properties.cp_j_per_kgk),
+    )
+
+
+def _mean_nusselt_times_length(
+    batch: ConvectionBatchInputs,
+    reynolds_numbers: FloatArray,
+    prandtl_numbers: FloatArray,
+    diameters_m: FloatArray,
+    positions_m: FloatArray,
+    bulk_temperatures_c: FloatArray,
+    wall_temperatures_c: FloatArray,
+) -> tuple[FloatArray, WarningMaskArray]:
+    # The registered tube correlation gives the mean Nusselt number over the
+    # first x metres, so Nu(x) * x is the accumulated conductance; at the inlet
+    # it vanishes.
+    at_inlet = positions_m <= 0.0
+    shape = reynolds_numbers.shape
+    position_batch = ConvectionBatchInputs(
+        case=ConvectionCase.INTERNAL_TUBE,
+        velocities_m_per_s=np.zeros(shape),
+        characteristic_lengths_m=diameters_m,
+        flow_lengths_m=np.broadcast_to(np.where(at_inlet, 1.0, positions_m), shape),
+        areas_m2=np.zeros(shape),
+        surface_temperatures_c=np.broadcast_to(wall_temperatures_c, shape),
+        ambient_temperatures_c=bulk_temperatures_c,
+        auto_properties=batch.auto_properties,
+        air_properties=batch.air_properties,
+    )
+    nusselt_numbers, warning_flags = get_correlation(ConvectionCase.INTERNAL_TUBE).nusselt_array(
+        reynolds_numbers, prandtl_numbers, position_batch, get_air_property_provider()
+    )
+    return np.where(at_inlet, 0.0, nusselt_numbers * positions_m), warning_flags
+
+
+def _march_block(
+    batch: ConvectionBatchInputs,
+    tubes: slice,
+    segments: int,
+    tolerance_k: float,
+    max_iterations: int,
+) -> tuple[tuple[FloatArray, ...], WarningMaskArray, int]:
+    diameters_m = batch.characteristic_lengths_m[tubes, np.newaxis]
+    lengths_m = batch.flow_lengths_m[tubes, np.newaxis]
+    wall_temperatures_c = batch.surface_temperatures_c[tubes, np.newaxis]
+    inlet_temperatures_c = batch.ambient_temperatures_c[tubes, np.newaxis]
+    segment_lengths_m = lengths_m / segments
+    segment_ends_m = segment_lengths_m * np.arange(1, segments + 1)
+    segment_starts_m = segment_ends_m - segment_lengths_m
+
+    inlet_density, _, _, _ = _tube_property_arrays(batch, inlet_temperatures_c)
+    flow_area_m2 = 0.25 * np.pi * diameters_m**2
+    mass_flow_rates = inlet_density * batch.velocities_m_per_s[tubes, np.newaxis] * flow_area_m2
+
+    # Segment properties depend on the bulk temperatures they produce, so the
+    # whole profile is solved by fixed-point iteration from an isothermal guess.
+    bulk_temperatures = np.repeat(inlet_temperatures_c, segments + 1, axis=1)
+    for iteration in range(1, max_iterations + 1):
+        mean_temperatures = 0.5 * (bulk_temperatures[:, :-1] + bulk_temperatures[:, 1:])
+        _, mu, k, cp = _tube_property_arrays(batch, mean_temperatures)
+        reynolds_numbers = mass_flow_rates / flow_area_m2 * diameters_m / mu
+        prandtl_numbers = cp * mu / k
+        broadcast_diameters_m = np.broadcast_to(diameters_m, reynolds_numbers.shape)
+        end_conductance, warning_flags = _mean_nusselt_times_length(
+            batch,
+            reynolds_numbers,
+            prandtl_numbers,
+            broadcast_diameters_m,
+            segment_ends_m,
+            mean_temperatures,
+            wall_temperatures_c,
+        )
+        start_conductance, _ = _mean_nusselt_times_length(
+            batch,
+            reynolds_numbers,
+            prandtl_numbers,
+            broadcast_diameters_m,
+            segment_starts_m,
+            mean_temperatures,
+            wall_temperatures_c,
+        )
+        nusselt_numbers = (end_conductance - start_conductance) / segment_lengths_m
+        coefficients = nusselt_numbers * k / diameters_m
+
+        # Uniform wall temperature: each segment decays the wall-to-bulk
+        # difference by exp(-NTU), so the whole profile is one cumulative sum.
+        transfer_units = coefficients * np.pi * diameters_m * segment_lengths_m / (mass_flow_rates * cp)
+        new_bulk_temperatures = np.empty_like(bulk_temperatures)
+        new_bulk_temperatures[:, :1] = inlet_temperatures_c
+        new_bulk_temperatures[:, 1:] = wall_temperatures_c - (wall_temperatures_c - inlet_temperatures_c) * np.exp(
+            -np.cumsum(transfer_units, axis=1)
+        )
+        change = float(np.max(np.abs(new_bulk_temperatures - bulk_temperatures)))
+        bulk_temperatures = new_bulk_temperatures
+        if change <= tolerance_k or not batch.auto_properties:
+            break
+    else:
+        raise RuntimeError(f"tube march did not converge within {max_iterations} iterations")
+
+    # Entry length is a property of the whole tube, not of each segment position.
+    short_tube = (lengths_m / diameters_m < 10.0) & (reynolds_numbers >= 2300.0)
+    warning_flags = (warning_flags & ~np.uint32(ConvectionWarning.SHORT_TUBE)) | (
+        short_tube.astype(np.uint32) * np.uint32(ConvectionWarning.SHORT_TUBE)
+    )
+    if batch.auto_properties:
+        out_of_range = (mean_temperatures < AUTO_PROPERTY_MIN_TEMP_C) | (mean_temperatures > AUTO_PROPERTY_MAX_TEMP_C)
+        warning_flags |= out_of_range.astype(np.uint32) * np.uint32(ConvectionWarning.AUTO_PROPERTIES_OUT_OF_RANGE)
+
+    segment_heat = mass_flow_rates * cp * np.diff(bulk_temperatures, axis=1)
+    return (
+        (
+            segment_lengths_m[:, 0],
+            mass_flow_rates[:, 0],
+            bulk_temperatures,
+            reynolds_numbers,
+            nusselt_numbers,
+            coefficients,
+            segment_heat,
+        ),
+        warning_flags,
+        iteration,
+    )
+
+
+def march_internal_tube(
+    inputs: ConvectionInputs | Sequence[ConvectionInputs],
+    segments: int = TUBE_MARCH_SEGMENTS,
+    *,
+    tolerance_k: float = TUBE_MARCH_TOLERANCE_K,
+    max_iterations: int = TUBE_MARCH_MAX_ITERATIONS,
+    block_cells: int = TUBE_MARCH_BLOCK_CELLS,
+) -> TubeMarchResult:
+    tubes = [inputs] if isinstance(inputs, ConvectionInputs) else list(inputs)
+    batch = ConvectionBatchInputs.from_inputs(tubes)
+    if any(tube.case != ConvectionCase.INTERNAL_TUBE for tube in tubes):
+        raise ValueError("tube marching requires internal_tube cases")
+    if segments <= 0:
+        raise ValueError("segments must be positive")
+    if block_cells <= 0:
+        raise ValueError("block_cells must be positive")
+    if np.any(batch.velocities_m_per_s <= 0.0):
+        raise ValueError("velocity must be positive")
+    if np.any(batch.characteristic_lengths_m <= 0.0):
+        raise ValueError("characteristic length must be positive")
+    if np.any(batch.flow_lengths_m <= 0.0):
+        raise ValueError("flow length must be positive")
+
+    tube_count = len(batch)
+    tubes_per_block = max(1, block_cells // segments)
+    blocks = [
+        _march_block(batch, slice(start, start + tubes_per_block), segments, tolerance_k, max_iterations)
+        for start in range(0, tube_count, tubes_per_block)
+    ]
+    columns = [np.concatenate(parts) for parts in zip(*(block_columns for block_columns, _, _ in blocks))]
+    return TubeMarchResult(
+        segment_lengths_m=columns[0],
+        mass_flow_rates_kg_per_s=columns[1],
+        bulk_temperatures_c=columns[2],
+        reynolds_numbers=columns[3],
+        nusselt_numbers=columns[4],
+        heat_transfer_coefficients_w_per_m2k=columns[5],
+        segment_heat_transfer_rates_w=columns[6],
+        warning_flags=np.concatenate([flags for _, flags, _ in blocks]),
+        iterations=max(iterations for _, _, iterations in blocks),
+    )
+
+
+__all__ = [
+    "TubeMarchResult",
+    "march_internal_tube",
+]
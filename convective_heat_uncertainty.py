@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from convective_heat_model import (
+    ConvectionBatchInputs,
+    ConvectionInputs,
+    FloatArray,
+    compute_cases_batch,
+)
+
+
+UNCERTAINTY_CHUNK_SAMPLES = 65_536
+DEFAULT_PERCENTILES = (2.5, 5.0, 25.0, 50.0, 75.0, 95.0, 97.5)
+DEFAULT_HISTOGRAM_BINS = 50
+
+# Scatter on these names is applied as a multiplicative factor (nominal 1.0)
+# on top of the automatic or manual air properties.
+PROPERTY_SCATTER_FIELDS = ("rho_kg_per_m3", "mu_pa_s", "k_w_per_mk", "cp_j_per_kgk")
+_INPUT_BATCH_FIELDS: dict[str, str] = {
+    "velocity_m_per_s": "velocities_m_per_s",
+    "characteristic_length_m": "characteristic_lengths_m",
+    "flow_length_m": "flow_lengths_m",
+    "area_m2": "areas_m2",
+    "surface_temperature_c": "surface_temperatures_c",
+    "ambient_temperature_c": "ambient_temperatures_c",
+}
+# Draws of these inputs (and of every property factor) must stay positive, so
+# their distributions are truncated at zero by redrawing non-positive samples.
+_POSITIVE_INPUT_FIELDS = ("velocity_m_per_s", "characteristic_length_m", "flow_length_m", "area_m2")
+_MAX_REDRAW_ROUNDS = 64
+
+
+@dataclass(frozen=True, slots=True)
+class NormalScatter:
+    """Gaussian scatter; ``relative`` makes ``sigma`` a fraction of the nominal value."""
+
+    sigma: float
+    relative: bool = False
+
+    def sample(self, nominal: float, rng: np.random.Generator, size: int) -> FloatArray:
+        scale = self.sigma * abs(nominal) if self.relative else self.sigma
+        return rng.normal(nominal, scale, size)
+
+
+@dataclass(frozen=True, slots=True)
+class UniformScatter:
+    """Uniform scatter over ``nominal ± half_width`` (a fraction of nominal when relative)."""
+
+    half_width: float
+    relative: bool = False
+
+    def sample(self, nominal: float, rng: np.random.Generator, size: int) -> FloatArray:
+        half_width = self.half_width * abs(nominal) if self.relative else self.half_width
+        return rng.uniform(nominal - half_width, nominal + half_width, size)
+
+
+InputDistribution = NormalScatter | UniformScatter
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Histogram:
+    counts: npt.NDArray[np.int64]
+    bin_edges: FloatArray
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class OutputDistribution:
+    mean: float
+    std: float
+    percentile_levels: tuple[float, ...]
+    percentiles: FloatArray
+    histogram: Histogram
+
+    def percentile(self, level: float) -> float:
+        return float(self.percentiles[self.percentile_levels.index(level)])
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class UncertaintyResult:
+    n_samples: int
+    heat_transfer_coefficient_w_per_m2k: OutputDistribution
+    heat_transfer_rate_w: OutputDistribution
+    warning_sample_fraction: float
+    redrawn_samples: int = 0
+    heat_transfer_coefficient_samples: FloatArray | None = None
+    heat_transfer_rate_samples: FloatArray | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _UncertaintyChunk:
+    base_inputs: ConvectionInputs
+    distributions: tuple[tuple[str, InputDistribution], ...]
+    sample_count: int
+    seed: np.random.SeedSequence
+
+
+def _validate_distributions(distributions: Mapping[str, InputDistribution]) -> None:
+    unknown_fields = sorted(set(distributions) - set(_INPUT_BATCH_FIELDS) - set(PROPERTY_SCATTER_FIELDS))
+    if unknown_fields:
+        raise ValueError(f"unsupported uncertain inputs: {', '.join(unknown_fields)}")
+    for name, distribution in distributions.items():
+        spread = distribution.sigma if isinstance(distribution, NormalScatter) else distribution.half_width
+        if not math.isfinite(spread) or spread < 0.0:
+            raise ValueError(f"scatter for {name} must be finite and non-negative")
+
+
+def _positive_samples(
+    name: str,
+    distribution: InputDistribution,
+    nominal: float,
+    rng: np.random.Generator,
+    size: int,
+) -> tuple[FloatArray, int]:
+    samples = distribution.sample(nominal, rng, size)
+    redrawn = 0
+    for _ in range(_MAX_REDRAW_ROUNDS):
+        invalid = np.flatnonzero(samples <= 0.0)
+        if invalid.size == 0:
+            return samples, redrawn
+        redrawn += invalid.size
+        samples[invalid] = distribution.sample(nominal, rng, invalid.size)
+    raise ValueError(f"scatter for {name} leaves too few positive samples")
+
+
+def _evaluate_uncertainty_chunk(chunk: _UncertaintyChunk) -> tuple[FloatArray, FloatArray, int, int]:
+    rng = np.random.default_rng(chunk.seed)
+    columns = {"velocities_m_per_s": np.full(chunk.sample_count, chunk.base_inputs.velocity_m_per_s)}
+    scale_factors: FloatArray | None = None
+    redrawn = 0
+    for name, distribution in chunk.distributions:
+        if name in _POSITIVE_INPUT_FIELDS:
+            columns[_INPUT_BATCH_FIELDS[name]], name_redrawn = _positive_samples(
+                name, distribution, getattr(chunk.base_inputs, name), rng, chunk.sample_count
+            )
+            redrawn += name_redrawn
+        elif name in _INPUT_BATCH_FIELDS:
+            columns[_INPUT_BATCH_FIELDS[name]] = distribution.sample(
+                getattr(chunk.base_inputs, name), rng, chunk.sample_count
+            )
+        else:
+            if scale_factors is None:
+                scale_factors = np.ones((len(PROPERTY_SCATTER_FIELDS), chunk.sample_count))
+            scale_factors[PROPERTY_SCATTER_FIELDS.index(name)], name_redrawn = _positive_samples(
+                name, distribution, 1.0, rng, chunk.sample_count
+            )
+            redrawn += name_redrawn
+
+    batch = ConvectionBatchInputs.from_base(chunk.base_inputs, **columns)
+    if scale_factors is not None:
+        batch = replace(batch, air_property_scale_factors=scale_factors)
+    result = compute_cases_batch(batch)
+    return (
+        result.heat_transfer_coefficients_w_per_m2k,
+        result.heat_transfer_rates_w,
+        int(np.count_nonzero(result.warning_flags)),
+        redrawn,
+    )
+
+
+def _output_distribution(
+    samples: FloatArray,
+    percentile_levels: tuple[float, ...],
+    histogram_bins: int,
+) -> OutputDistribution:
+    counts, bin_edges = np.histogram(samples, bins=histogram_bins)
+    return OutputDistribution(
+        mean=float(np.mean(samples)),
+        std=float(np.std(samples)),
+        percentile_levels=percentile_levels,
+        percentiles=np.percentile(samples, percentile_levels),
+        histogram=Histogram(counts=counts, bin_edges=bin_edges),
+    )
+
+
+def propagate_uncertainty(
+    base_inputs: ConvectionInputs,
+    distributions: Mapping[str, InputDistribution],
+    n_samples: int,
+    *,
+    seed: int | np.random.SeedSequence | None = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    histogram_bins: int = DEFAULT_HISTOGRAM_BINS,
+    max_workers: int | None = 1,
+    chunk_samples: int = UNCERTAINTY_CHUNK_SAMPLES,
+    keep_samples: bool = False,
+) -> UncertaintyResult:
+    if n_samples <= 0:
+        raise ValueError("n_samples must be positive")
+    if chunk_samples <= 0:
+        raise ValueError("chunk_samples must be positive")
+    if histogram_bins <= 0:
+        raise ValueError("histogram_bins must be positive")
+    _validate_distributions(distributions)
+
+    # Every chunk draws from its own spawned seed, so a given seed reproduces
+    # the same samples whatever the worker count.
+    root_seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    chunk_sizes = [min(chunk_samples, n_samples - start) for start in range(0, n_samples, chunk_samples)]
+    distribution_items = tuple(distributions.items())
+    chunks = [
+        _UncertaintyChunk(base_inputs, distribution_items, size, child_seed)
+        for size, child_seed in zip(chunk_sizes, root_seed.spawn(len(chunk_sizes)))
+    ]
+
+    if len(chunks) == 1 or max_workers == 1:
+        chunk_results = list(map(_evaluate_uncertainty_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = list(executor.map(_evaluate_uncertainty_chunk, chunks))
+
+    heat_transfer_coefficients = np.concatenate([coefficients for coefficients, _, _, _ in chunk_results])
+    heat_transfer_rates = np.concatenate([rates for _, rates, _, _ in chunk_results])
+    warning_samples = sum(count for _, _, count, _ in chunk_results)
+    percentile_levels = tuple(float(level) for level in percentiles)
+    return UncertaintyResult(
+        n_samples=n_samples,
+        heat_transfer_coefficient_w_per_m2k=_output_distribution(
+            heat_transfer_coefficients, percentile_levels, histogram_bins
+        ),
+        heat_transfer_rate_w=_output_distribution(heat_transfer_rates, percentile_levels, histogram_bins),
+        warning_sample_fraction=warning_samples / n_samples,
+        redrawn_samples=sum(redrawn for _, _, _, redrawn in chunk_results),
+        heat_transfer_coefficient_samples=heat_transfer_coefficients if keep_samples else None,
+        heat_transfer_rate_samples=heat_transfer_rates if keep_samples else None,
+    )
+
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "PROPERTY_SCATTER_FIELDS",
+    "Histogram",
+    "InputDistribution",
+    "NormalScatter",
+    "OutputDistribution",
+    "UncertaintyResult",
+    "UniformScatter",
+    "propagate_uncertainty",
+]
@@ -0,0 +1,89 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.bench_convective_heat_model import (
+    Benchmark,
+    BenchmarkResult,
+    default_benchmarks,
+    find_regressions,
+    format_regressions,
+    load_baseline,
+    main,
+    run_benchmark,
+    save_baseline,
+)
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_run_benchmark_reports_throughput_and_allocations(self) -> None:
+        result = run_benchmark(Benchmark("list", lambda: [0.0] * 10_000), min_time_s=0.001, repeat=1)
+
+        self.assertEqual(result.name, "list")
+        self.assertGreater(result.ops_per_sec, 0.0)
+        self.assertGreaterEqual(result.peak_allocated_bytes, 80_000)
+
+    def test_setup_runs_only_when_the_benchmark_runs(self) -> None:
+        setup_calls: list[int] = []
+
+        def setup() -> list[float]:
+            setup_calls.append(1)
+            return [0.0] * 10_000
+
+        benchmark = Benchmark("sum", sum, setup=setup)
+        self.assertEqual(setup_calls, [])
+        result = run_benchmark(benchmark, min_time_s=0.001, repeat=1)
+
+        self.assertEqual(setup_calls, [1])
+        self.assertGreater(result.ops_per_sec, 0.0)
+
+    def test_default_suite_builds_no_batch_inputs_up_front(self) -> None:
+        with patch("benchmarks.bench_convective_heat_model._mixed_batch") as mixed_batch:
+            benchmarks = default_benchmarks()
+
+        mixed_batch.assert_not_called()
+        self.assertIn("compute_cases_batch[100000]", [benchmark.name for benchmark in benchmarks])
+
+    def test_baseline_round_trip_and_regression_diff(self) -> None:
+        baseline_results = [
+            BenchmarkResult("fast", ops_per_sec=1000.0, peak_allocated_bytes=0, retained_blocks=0),
+            BenchmarkResult("slow", ops_per_sec=1000.0, peak_allocated_bytes=0, retained_blocks=0),
+        ]
+        current_results = [
+            BenchmarkResult("fast", ops_per_sec=900.0, peak_allocated_bytes=0, retained_blocks=0),
+            BenchmarkResult("slow", ops_per_sec=500.0, peak_allocated_bytes=0, retained_blocks=0),
+            BenchmarkResult("new", ops_per_sec=1.0, peak_allocated_bytes=0, retained_blocks=0),
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            save_baseline(path, baseline_results)
+            baseline = load_baseline(path)
+
+        regressions = find_regressions(baseline, current_results, threshold=0.2)
+
+        self.assertEqual([regression.name for regression in regressions], ["slow"])
+        self.assertAlmostEqual(regressions[0].relative_change, -0.5)
+        self.assertIn("slow: 1,000.0 -> 500.0 ops/sec (-50.0%)", format_regressions(regressions, 0.2))
+
+    def test_main_fails_when_throughput_drops_below_baseline(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            save_baseline(
+                path,
+                [BenchmarkResult("compute_air_properties", ops_per_sec=1e12, peak_allocated_bytes=0, retained_blocks=0)],
+            )
+            stderr = io.StringIO()
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+                exit_code = main(
+                    ["--filter", "compute_air_properties", "--compare", str(path), "--min-time", "0.001", "--repeat", "1"]
+                )
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("compute_air_properties", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
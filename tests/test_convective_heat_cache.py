@@ -0,0 +1,124 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from convective_heat_cache import ResultCache, cache_key
+from convective_heat_model import (
+    ConvectionBatchInputs,
+    ConvectionCase,
+    ConvectionInputs,
+    TabulatedAirPropertyProvider,
+    compute_case,
+    compute_cases_batch,
+    generate_grid_sweep,
+    generate_velocity_sweep,
+    set_air_property_provider,
+)
+
+
+BASE_INPUTS = ConvectionInputs(
+    case=ConvectionCase.INTERNAL_TUBE,
+    velocity_m_per_s=5.0,
+    characteristic_length_m=0.025,
+    flow_length_m=1.0,
+    area_m2=0.1,
+    surface_temperature_c=90.0,
+    ambient_temperature_c=20.0,
+)
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "results.sqlite"
+
+    def test_cached_results_round_trip_across_reopen(self) -> None:
+        axes = {"velocity_m_per_s": np.linspace(0.5, 20.0, 30), "surface_temperature_c": [50.0, 90.0]}
+        batch = ConvectionBatchInputs.from_base(BASE_INPUTS, velocities_m_per_s=np.linspace(1.0, 9.0, 12).reshape(3, 4))
+
+        with ResultCache(self.path) as cache:
+            cache.compute_case(BASE_INPUTS)
+            cache.generate_velocity_sweep(BASE_INPUTS, 0.5, 20.0, 50)
+            cache.compute_cases_batch(batch)
+            cache.generate_grid_sweep(BASE_INPUTS, axes, max_workers=1)
+            self.assertEqual((cache.hits, cache.misses), (0, 4))
+            self.assertEqual(len(cache), 4)
+
+        with ResultCache(self.path) as cache:
+            case_result = cache.compute_case(replace(BASE_INPUTS, velocity_m_per_s=5))
+            sweep = cache.generate_velocity_sweep(BASE_INPUTS, 0.5, 20.0, 50)
+            batch_result = cache.compute_cases_batch(batch)
+            grid = cache.generate_grid_sweep(BASE_INPUTS, axes)
+            self.assertEqual((cache.hits, cache.misses), (4, 0))
+
+        self.assertEqual(case_result, compute_case(BASE_INPUTS))
+        np.testing.assert_array_equal(
+            sweep.heat_transfer_rates_w,
+            generate_velocity_sweep(BASE_INPUTS, 0.5, 20.0, 50).heat_transfer_rates_w,
+        )
+        expected_batch = compute_cases_batch(batch)
+        self.assertEqual(batch_result.nusselt_numbers.shape, (3, 4))
+        np.testing.assert_array_equal(batch_result.nusselt_numbers, expected_batch.nusselt_numbers)
+        np.testing.assert_array_equal(batch_result.warning_flags, expected_batch.warning_flags)
+        expected_grid = generate_grid_sweep(BASE_INPUTS, axes, max_workers=1)
+        self.assertEqual(grid.axis_names, expected_grid.axis_names)
+        np.testing.assert_array_equal(grid.heat_transfer_rates_w, expected_grid.heat_transfer_rates_w)
+
+    def test_float32_results_are_cached_apart_from_float64(self) -> None:
+        axes = {"velocity_m_per_s": np.linspace(0.5, 20.0, 30), "flow_length_m": [0.5, 1.0]}
+        with ResultCache(self.path) as cache:
+            exact = cache.generate_grid_sweep(BASE_INPUTS, axes, max_workers=1)
+            cache.generate_grid_sweep(BASE_INPUTS, axes, max_workers=1, dtype=np.float32)
+            compact = cache.generate_grid_sweep(BASE_INPUTS, axes, max_workers=1, dtype=np.float32)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        self.assertEqual(compact.heat_transfer_rates_w.dtype, np.float32)
+        self.assertEqual(compact.heat_transfer_rates_w.shape, (30, 2))
+        np.testing.assert_array_equal(
+            compact.heat_transfer_rates_w,
+            generate_grid_sweep(BASE_INPUTS, axes, max_workers=1, dtype=np.float32).heat_transfer_rates_w,
+        )
+        self.assertEqual(exact.heat_transfer_rates_w.dtype, np.float64)
+
+    def test_keys_track_inputs_and_installed_model(self) -> None:
+        key = cache_key("compute_case", BASE_INPUTS)
+
+        self.assertEqual(key, cache_key("compute_case", replace(BASE_INPUTS, area_m2=0.1)))
+        self.assertNotEqual(key, cache_key("compute_case", replace(BASE_INPUTS, area_m2=0.1 + 1e-15)))
+        self.assertNotEqual(key, cache_key("compute_case", replace(BASE_INPUTS, case=ConvectionCase.FLAT_PLATE)))
+        previous = set_air_property_provider(TabulatedAirPropertyProvider())
+        try:
+            tabulated_key = cache_key("compute_case", BASE_INPUTS)
+            set_air_property_provider(TabulatedAirPropertyProvider())
+            self.assertEqual(cache_key("compute_case", BASE_INPUTS), tabulated_key)
+            set_air_property_provider(TabulatedAirPropertyProvider(step_c=5.0))
+            coarse_key = cache_key("compute_case", BASE_INPUTS)
+        finally:
+            set_air_property_provider(previous)
+        self.assertNotEqual(key, tabulated_key)
+        self.assertNotEqual(coarse_key, tabulated_key)
+        with self.assertRaises(TypeError):
+            cache_key("compute_case", object())
+
+    def test_size_bound_evicts_least_recently_used(self) -> None:
+        sweeps = [(BASE_INPUTS, 0.5, 20.0 + index, 100) for index in range(3)]
+        with ResultCache(self.path, max_bytes=2 * len(generate_velocity_sweep(*sweeps[0]).to_bytes())) as cache:
+            cache.generate_velocity_sweep(*sweeps[0])
+            cache.generate_velocity_sweep(*sweeps[1])
+            cache.generate_velocity_sweep(*sweeps[0])
+            cache.generate_velocity_sweep(*sweeps[2])
+
+            self.assertEqual(len(cache), 2)
+            self.assertLessEqual(cache.size_bytes, cache.max_bytes)
+            cache.generate_velocity_sweep(*sweeps[0])
+            self.assertEqual(cache.hits, 2)
+            cache.generate_velocity_sweep(*sweeps[1])
+            self.assertEqual(cache.misses, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import math
+import unittest
+
+import numpy as np
+
+from convective_heat_design import DesignConstraints, DesignObjective, optimize_design
+from convective_heat_model import ConvectionCase, ConvectionInputs, ConvectionWarning, compute_case
+
+
+TUBE_INPUTS = ConvectionInputs(
+    case=ConvectionCase.INTERNAL_TUBE,
+    velocity_m_per_s=5.0,
+    characteristic_length_m=0.025,
+    flow_length_m=1.0,
+    area_m2=0.1,
+    surface_temperature_c=90.0,
+    ambient_temperature_c=20.0,
+)
+
+
+class OptimizeDesignTests(unittest.TestCase):
+    def test_heat_rate_optimum_beats_brute_force_grid(self) -> None:
+        bounds = {"velocity_m_per_s": (0.5, 30.0), "characteristic_length_m": (0.01, 0.05)}
+        optimum = optimize_design(TUBE_INPUTS, bounds, seed=3)
+
+        grid_best = max(
+            compute_case(
+                ConvectionInputs(
+                    case=ConvectionCase.INTERNAL_TUBE,
+                    velocity_m_per_s=float(velocity),
+                    characteristic_length_m=float(diameter),
+                    flow_length_m=1.0,
+                    area_m2=math.pi * float(diameter),
+                    surface_temperature_c=90.0,
+                    ambient_temperature_c=20.0,
+                )
+            ).heat_transfer_rate_w
+            for velocity in np.linspace(0.5, 30.0, 25)
+            for diameter in np.linspace(0.01, 0.05, 25)
+        )
+        self.assertTrue(optimum.feasible)
+        self.assertGreaterEqual(optimum.objective_value, grid_best * (1.0 - 1e-9))
+        self.assertAlmostEqual(optimum.result.heat_transfer_rate_w, optimum.objective_value, places=6)
+        self.assertAlmostEqual(optimum.inputs.area_m2, math.pi * optimum.inputs.characteristic_length_m)
+        self.assertLessEqual(optimum.inputs.velocity_m_per_s, 30.0)
+        self.assertLess(optimum.evaluations, 25 * 25 * 20)
+
+    def test_constraints_steer_rate_per_fan_power_optimum(self) -> None:
+        constraints = DesignConstraints(required_regime="turbulent", forbidden_warnings=~ConvectionWarning.NONE)
+        optimum = optimize_design(
+            TUBE_INPUTS,
+            {"velocity_m_per_s": (0.5, 30.0), "characteristic_length_m": (0.01, 0.05)},
+            objective=DesignObjective.RATE_PER_FAN_POWER,
+            constraints=constraints,
+            seed=3,
+        )
+
+        self.assertTrue(optimum.feasible)
+        self.assertEqual(optimum.result.regime_name, "turbulent")
+        self.assertEqual(optimum.result.warning_flags, 0)
+        # Fan power grows much faster with velocity than q, so the optimum sits
+        # at the slowest flow that is still turbulent.
+        self.assertAlmostEqual(optimum.result.reynolds_number, 3000.0, delta=30.0)
+        self.assertAlmostEqual(optimum.objective_value, optimum.result.heat_transfer_rate_w / optimum.fan_power_w)
+
+        capped = optimize_design(
+            TUBE_INPUTS,
+            {"velocity_m_per_s": (0.5, 30.0)},
+            constraints=DesignConstraints(max_fan_power_w=1.0),
+            seed=3,
+        )
+        self.assertTrue(capped.feasible)
+        self.assertLessEqual(capped.fan_power_w, 1.0)
+        self.assertGreater(capped.fan_power_w, 0.99)
+
+    def test_velocity_only_search_keeps_the_given_tube_area(self) -> None:
+        optimum = optimize_design(TUBE_INPUTS, {"velocity_m_per_s": (0.5, 30.0)}, seed=3)
+
+        self.assertEqual(optimum.inputs.area_m2, TUBE_INPUTS.area_m2)
+        self.assertAlmostEqual(optimum.result.heat_transfer_rate_w, optimum.objective_value, places=6)
+
+    def test_invalid_arguments_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            optimize_design(TUBE_INPUTS, {})
+        with self.assertRaises(ValueError):
+            optimize_design(TUBE_INPUTS, {"area_m2": (0.1, 1.0)})
+        with self.assertRaises(ValueError):
+            optimize_design(TUBE_INPUTS, {"velocity_m_per_s": (2.0, 1.0)})
+        with self.assertRaises(ValueError):
+            optimize_design(
+                ConvectionInputs(
+                    case=ConvectionCase.FLAT_PLATE,
+                    velocity_m_per_s=5.0,
+                    characteristic_length_m=0.3,
+                    flow_length_m=0.3,
+                    area_m2=0.1,
+                    surface_temperature_c=90.0,
+                    ambient_temperature_c=20.0,
+                ),
+                {"velocity_m_per_s": (0.5, 30.0)},
+                objective="rate_per_fan_power",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
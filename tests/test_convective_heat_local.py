@@ -0,0 +1,91 @@
+import unittest
+from dataclasses import replace
+
+import numpy as np
+
+from convective_heat_local import cylinder_angular_profile, flat_plate_local_profile
+from convective_heat_model import AirProperties, ConvectionCase, ConvectionInputs, ConvectionWarning, compute_case
+
+
+PLATE_INPUTS = ConvectionInputs(
+    case=ConvectionCase.FLAT_PLATE,
+    velocity_m_per_s=40.0,
+    characteristic_length_m=1.0,
+    flow_length_m=1.0,
+    area_m2=1.0,
+    surface_temperature_c=80.0,
+    ambient_temperature_c=20.0,
+)
+CYLINDER_INPUTS = replace(
+    PLATE_INPUTS,
+    case=ConvectionCase.CYLINDER_CROSSFLOW,
+    velocity_m_per_s=5.0,
+    characteristic_length_m=0.05,
+    flow_length_m=0.05,
+)
+
+
+class FlatPlateProfileTests(unittest.TestCase):
+    def test_local_profile_averages_to_plate_correlation(self) -> None:
+        for velocity in (2.0, 40.0):
+            inputs = replace(PLATE_INPUTS, velocity_m_per_s=velocity)
+            profile = flat_plate_local_profile(inputs, 20_000)
+            average = compute_case(inputs)
+
+            mean_h = float(np.mean(profile.local_heat_transfer_coefficients_w_per_m2k))
+            self.assertAlmostEqual(mean_h / average.heat_transfer_coefficient_w_per_m2k, 1.0, delta=5e-3)
+            self.assertAlmostEqual(
+                float(np.mean(profile.local_heat_fluxes_w_per_m2)) * inputs.area_m2,
+                mean_h * 60.0,
+                places=6,
+            )
+
+    def test_transition_location_and_jump(self) -> None:
+        profile = flat_plate_local_profile(PLATE_INPUTS, [0.1, 0.2235, 0.2237, 0.9])
+
+        self.assertAlmostEqual(profile.transition_position_m, 0.2236, delta=5e-4)
+        np.testing.assert_array_equal(profile.turbulent, [False, False, True, True])
+        coefficients = profile.local_heat_transfer_coefficients_w_per_m2k
+        self.assertGreater(coefficients[2], 3.0 * coefficients[1])
+        self.assertGreater(coefficients[0], coefficients[1])
+        with self.assertRaises(ValueError):
+            flat_plate_local_profile(PLATE_INPUTS, [0.0, 0.5])
+        with self.assertRaises(ValueError):
+            flat_plate_local_profile(CYLINDER_INPUTS)
+
+
+class CylinderAngularProfileTests(unittest.TestCase):
+    def test_profile_peaks_at_stagnation_and_keeps_average(self) -> None:
+        profile = cylinder_angular_profile(CYLINDER_INPUTS, 3600)
+        average = compute_case(CYLINDER_INPUTS)
+
+        nusselt = profile.local_nusselt_numbers
+        self.assertAlmostEqual(float(np.mean(nusselt)), average.nusselt_number, delta=1e-4 * average.nusselt_number)
+        self.assertEqual(int(np.argmax(nusselt)), 0)
+        minimum_angle = profile.angles_deg[int(np.argmin(nusselt))]
+        self.assertAlmostEqual(minimum_angle, profile.separation_angle_deg, delta=0.1)
+        self.assertEqual(profile.warning_flags, 0)
+        self.assertFalse(profile.wake_clamped)
+
+        supercritical = cylinder_angular_profile(replace(CYLINDER_INPUTS, velocity_m_per_s=200.0), [0.0, 90.0, 180.0])
+        self.assertTrue(supercritical.warning_flags & ConvectionWarning.CORRELATION_REYNOLDS_RANGE)
+        with self.assertRaises(ValueError):
+            cylinder_angular_profile(CYLINDER_INPUTS, [190.0])
+
+    def test_clamped_wake_is_reported_without_a_reynolds_warning(self) -> None:
+        # At Pr = 70 the front-stagnation series overshoots the
+        # Churchill-Bernstein average so far that matching it would need a
+        # negative rear-stagnation Nusselt number.
+        viscous = AirProperties(1.1, 1.9e-5, 0.027, 1.0e5, 50.0, "manual override")
+        inputs = replace(CYLINDER_INPUTS, velocity_m_per_s=1.0, auto_properties=False, air_properties=viscous)
+        profile = cylinder_angular_profile(inputs, 3600)
+        average = compute_case(inputs)
+
+        self.assertTrue(profile.wake_clamped)
+        self.assertFalse(profile.warning_flags & ConvectionWarning.CORRELATION_REYNOLDS_RANGE)
+        self.assertTrue(np.all(profile.local_nusselt_numbers >= 0.0))
+        self.assertGreater(float(np.mean(profile.local_nusselt_numbers)), average.nusselt_number)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,53 @@
+import contextlib
+import csv
+import io
+import json
 import math
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
 
 from convective_heat_model import (
+    FLOAT32_RELATIVE_ERROR_BOUND,
+    PROPERTY_TABLE_RELATIVE_ERROR_BOUND,
     AirProperties,
+    CachedAirPropertyProvider,
+    ConvectionBatchInputs,
+    ConvectionBatchResult,
     ConvectionCase,
     ConvectionInputs,
+    ConvectionWarning,
+    DittusBoelterCorrelation,
+    DualNumber,
+    IncrementalEvaluator,
+    TabulatedAirPropertyProvider,
+    VelocitySweepResult,
+    ZukauskasCylinderCorrelation,
+    applicability_warning_flags,
     compute_air_properties,
     compute_case,
+    compute_case_with_gradients,
+    compute_cases_batch,
+    generate_adaptive_velocity_sweep,
+    generate_grid_sweep,
     generate_velocity_sweep,
+    get_correlation,
+    iter_velocity_sweep,
+    get_stage_profiler,
+    main,
+    profile_stages,
+    register_correlation,
+    set_air_property_provider,
+    solve_for_characteristic_length,
+    solve_for_velocity,
+    summarize_velocity_sweep,
 )
 
 
@@ -52,6 +92,65 @@ class AirPropertyTests(unittest.TestCase):
         self.assertEqual(result.air_properties, manual)
 
 
+class AirPropertyProviderTests(unittest.TestCase):
+    def test_cached_provider_matches_exact_properties(self) -> None:
+        provider = CachedAirPropertyProvider()
+
+        first = provider.properties_at(42.5)
+
+        self.assertEqual(first, compute_air_properties(surface_temperature_c=60.0, ambient_temperature_c=25.0))
+        self.assertIs(provider.properties_at(42.5), first)
+
+    def test_tabulated_provider_stays_within_documented_error_bound(self) -> None:
+        provider = TabulatedAirPropertyProvider()
+        temperatures = np.linspace(-20.0, 200.0, 1001)
+
+        _, mu_pa_s, k_w_per_mk, _ = provider.property_arrays(temperatures)
+
+        for index, temperature in enumerate(temperatures):
+            exact = compute_air_properties(float(temperature), float(temperature))
+            self.assertLess(abs(mu_pa_s[index] / exact.mu_pa_s - 1.0), PROPERTY_TABLE_RELATIVE_ERROR_BOUND)
+            self.assertLess(abs(k_w_per_mk[index] / exact.k_w_per_mk - 1.0), PROPERTY_TABLE_RELATIVE_ERROR_BOUND)
+
+    def test_tabulated_provider_keeps_the_shape_of_2d_temperatures(self) -> None:
+        provider = TabulatedAirPropertyProvider()
+        exact_provider = CachedAirPropertyProvider()
+
+        for shape in ((2, 3), (2, 2)):
+            with self.subTest(shape=shape):
+                temperatures = np.linspace(-10.0, 190.0, math.prod(shape)).reshape(shape)
+
+                tabulated = provider.property_arrays(temperatures)
+                exact = exact_provider.property_arrays(temperatures)
+
+                for tabulated_values, exact_values in zip(tabulated, exact):
+                    self.assertEqual(tabulated_values.shape, shape)
+                    np.testing.assert_array_less(
+                        np.abs(tabulated_values / exact_values - 1.0), PROPERTY_TABLE_RELATIVE_ERROR_BOUND
+                    )
+
+    def test_installed_provider_feeds_compute_case(self) -> None:
+        inputs = ConvectionInputs(
+            case=ConvectionCase.SPHERE_CROSSFLOW,
+            velocity_m_per_s=3.0,
+            characteristic_length_m=0.1,
+            flow_length_m=0.1,
+            area_m2=0.03,
+            surface_temperature_c=70.0,
+            ambient_temperature_c=20.0,
+        )
+        exact = compute_case(inputs)
+
+        previous = set_air_property_provider(TabulatedAirPropertyProvider())
+        try:
+            tabulated = compute_case(inputs)
+        finally:
+            set_air_property_provider(previous)
+
+        self.assertEqual(tabulated.air_properties.source_label, "tabulated automatic air properties")
+        self.assertAlmostEqual(tabulated.heat_transfer_rate_w, exact.heat_transfer_rate_w, places=6)
+
+
 class CorrelationTests(unittest.TestCase):
     def test_flat_plate_case_returns_reasonable_nominal_values(self) -> None:
         result = compute_case(
@@ -104,6 +203,28 @@ class CorrelationTests(unittest.TestCase):
         )
 
         self.assertTrue(any("transition" in warning.lower() for warning in result.warnings))
+        self.assertTrue(result.warning_flags & ConvectionWarning.INTERNAL_TRANSITION)
+
+    def test_batch_warning_masks_filter_points_without_string_matching(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.INTERNAL_TUBE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.02,
+            flow_length_m=0.1,
+            area_m2=0.05,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=25.0,
+        )
+
+        batch = compute_cases_batch(
+            ConvectionBatchInputs.from_base(base_inputs, velocities_m_per_s=np.array([1.0, 2.4, 10.0]))
+        )
+        short_tube = (batch.warning_flags & ConvectionWarning.SHORT_TUBE) != 0
+        transition = (batch.warning_flags & ConvectionWarning.INTERNAL_TRANSITION) != 0
+
+        self.assertEqual(batch.warning_flags.dtype, np.uint32)
+        self.assertEqual(short_tube.tolist(), [False, True, True])
+        self.assertEqual(transition.tolist(), [False, True, False])
 
     def test_invalid_area_raises_value_error(self) -> None:
         with self.assertRaises(ValueError):
@@ -141,6 +262,830 @@ class SweepTests(unittest.TestCase):
         self.assertAlmostEqual(sweep.velocities_m_per_s[-1], 10.0)
         self.assertTrue(all(math.isfinite(value) for value in sweep.heat_transfer_coefficients_w_per_m2k))
         self.assertTrue(all(math.isfinite(value) for value in sweep.heat_transfer_rates_w))
+        np.testing.assert_array_equal(
+            generate_velocity_sweep(base_inputs.with_velocity(0.0), v_min=0.1, v_max=10.0, points=25).heat_transfer_rates_w,
+            sweep.heat_transfer_rates_w,
+        )
+        with self.assertRaises(ValueError):
+            generate_velocity_sweep(replace(base_inputs, area_m2=0.0), v_min=0.1, v_max=10.0, points=25)
+
+    def test_adaptive_sweep_refines_tube_transitions_with_fewer_points(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.INTERNAL_TUBE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.02,
+            flow_length_m=0.4,
+            area_m2=0.05,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=25.0,
+        )
+
+        adaptive = generate_adaptive_velocity_sweep(base_inputs, v_min=0.1, v_max=20.0, max_points=200)
+        reference = generate_velocity_sweep(base_inputs, v_min=0.1, v_max=20.0, points=4001)
+
+        self.assertLess(len(adaptive.velocities_m_per_s), 100)
+        self.assertTrue(np.all(np.diff(adaptive.velocities_m_per_s) > 0.0))
+        self.assertAlmostEqual(adaptive.velocities_m_per_s[0], 0.1)
+        self.assertAlmostEqual(adaptive.velocities_m_per_s[-1], 20.0)
+        interpolated = np.interp(
+            reference.velocities_m_per_s,
+            adaptive.velocities_m_per_s,
+            adaptive.heat_transfer_coefficients_w_per_m2k,
+        )
+        peak_h = max(reference.heat_transfer_coefficients_w_per_m2k)
+        self.assertLess(
+            float(np.max(np.abs(interpolated - reference.heat_transfer_coefficients_w_per_m2k))) / peak_h,
+            1.0e-3,
+        )
+
+    def test_sweep_round_trips_through_memory_mapped_file(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.SPHERE_CROSSFLOW,
+            velocity_m_per_s=3.0,
+            characteristic_length_m=0.1,
+            flow_length_m=0.1,
+            area_m2=0.03,
+            surface_temperature_c=70.0,
+            ambient_temperature_c=20.0,
+        )
+        sweep = generate_velocity_sweep(base_inputs, v_min=0.5, v_max=5.0, points=40)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "sweep.bin"
+            path.write_bytes(sweep.to_bytes())
+            with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                restored = VelocitySweepResult.from_buffer(mapped)
+                self.assertEqual(restored.heat_transfer_rates_w.nbytes, 40 * 8)
+                np.testing.assert_array_equal(restored.velocities_m_per_s, sweep.velocities_m_per_s)
+                np.testing.assert_array_equal(restored.heat_transfer_rates_w, sweep.heat_transfer_rates_w)
+                del restored
+
+        with self.assertRaises(ValueError):
+            ConvectionBatchResult.from_buffer(sweep.to_bytes())
+
+    def test_streaming_sweep_yields_bounded_blocks_matching_full_sweep(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=1.0,
+            flow_length_m=1.0,
+            area_m2=1.0,
+            surface_temperature_c=60.0,
+            ambient_temperature_c=25.0,
+        )
+
+        blocks = list(iter_velocity_sweep(base_inputs, v_min=0.1, v_max=20.0, points=1001, block_size=256))
+        full = generate_velocity_sweep(base_inputs, v_min=0.1, v_max=20.0, points=1001)
+        summary = summarize_velocity_sweep(iter_velocity_sweep(base_inputs, v_min=0.1, v_max=20.0, points=1001, block_size=256))
+
+        self.assertEqual([block.velocities_m_per_s.size for block in blocks], [256, 256, 256, 233])
+        np.testing.assert_array_equal(
+            np.concatenate([block.heat_transfer_rates_w for block in blocks]),
+            full.heat_transfer_rates_w,
+        )
+        self.assertEqual(summary.points, 1001)
+        self.assertEqual(summary.max_heat_transfer_rate_w, float(np.max(full.heat_transfer_rates_w)))
+        self.assertAlmostEqual(summary.velocity_at_max_heat_transfer_rate_m_per_s, 20.0)
+        self.assertEqual(summary.min_heat_transfer_coefficient_w_per_m2k, float(np.min(full.heat_transfer_coefficients_w_per_m2k)))
+
+
+class BatchTests(unittest.TestCase):
+    def test_batch_matches_scalar_results_across_cases_and_regimes(self) -> None:
+        inputs = [
+            ConvectionInputs(
+                case=case,
+                velocity_m_per_s=velocity,
+                characteristic_length_m=0.02 if case == ConvectionCase.INTERNAL_TUBE else 0.5,
+                flow_length_m=0.4,
+                area_m2=0.5,
+                surface_temperature_c=80.0,
+                ambient_temperature_c=25.0,
+            )
+            for case in ConvectionCase
+            for velocity in (0.05, 1.0, 2.0, 2.4, 3.0, 20.0, 40.0)
+        ]
+
+        batch = compute_cases_batch(ConvectionBatchInputs.from_inputs(inputs))
+
+        for index, case_inputs in enumerate(inputs):
+            scalar = compute_case(case_inputs)
+            self.assertAlmostEqual(batch.reynolds_numbers[index], scalar.reynolds_number, delta=1e-9 * scalar.reynolds_number)
+            self.assertAlmostEqual(batch.nusselt_numbers[index], scalar.nusselt_number, delta=1e-12 * scalar.nusselt_number)
+            self.assertAlmostEqual(
+                batch.heat_transfer_rates_w[index],
+                scalar.heat_transfer_rate_w,
+                delta=1e-12 * scalar.heat_transfer_rate_w,
+            )
+            self.assertEqual(int(batch.warning_flags[index]), int(scalar.warning_flags))
+            self.assertEqual(batch.warnings_at(index), scalar.warnings)
+
+    def test_batch_from_base_broadcasts_and_validates(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.CYLINDER_CROSSFLOW,
+            velocity_m_per_s=5.0,
+            characteristic_length_m=0.05,
+            flow_length_m=0.05,
+            area_m2=0.2,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=25.0,
+        )
+
+        batch = compute_cases_batch(
+            ConvectionBatchInputs.from_base(base_inputs, velocities_m_per_s=np.linspace(1.0, 10.0, 10))
+        )
+
+        self.assertEqual(len(batch), 10)
+        self.assertTrue(np.all(np.diff(batch.heat_transfer_coefficients_w_per_m2k) > 0.0))
+        restored = ConvectionBatchResult.from_buffer(batch.to_bytes())
+        np.testing.assert_array_equal(restored.nusselt_numbers, batch.nusselt_numbers)
+        np.testing.assert_array_equal(restored.warning_flags, batch.warning_flags)
+        with self.assertRaises(ValueError):
+            compute_cases_batch(ConvectionBatchInputs.from_base(base_inputs, areas_m2=[1.0, 0.0]))
+
+    def test_air_property_scale_factors_scale_properties_per_row(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.5,
+            flow_length_m=0.5,
+            area_m2=1.0,
+            surface_temperature_c=60.0,
+            ambient_temperature_c=25.0,
+        )
+        batch = ConvectionBatchInputs.from_base(base_inputs, velocities_m_per_s=[2.0, 2.0])
+        scale_factors = np.ones((4, 2))
+        scale_factors[2, 1] = 2.0
+
+        result = compute_cases_batch(replace(batch, air_property_scale_factors=scale_factors))
+
+        self.assertAlmostEqual(
+            result.heat_transfer_coefficients_w_per_m2k[1] / result.heat_transfer_coefficients_w_per_m2k[0],
+            2.0 ** (2.0 / 3.0),
+        )
+        with self.assertRaises(ValueError):
+            compute_cases_batch(replace(batch, air_property_scale_factors=np.zeros((4, 2))))
+
+    def test_float32_mode_stays_within_documented_error_bound(self) -> None:
+        rng = np.random.default_rng(11)
+        size = 20_000
+        cases = list(ConvectionCase)
+        batch = ConvectionBatchInputs(
+            case=[cases[index % len(cases)] for index in range(size)],
+            velocities_m_per_s=np.exp(rng.uniform(math.log(0.01), math.log(80.0), size)),
+            characteristic_lengths_m=np.exp(rng.uniform(math.log(0.002), math.log(3.0), size)),
+            flow_lengths_m=rng.uniform(0.01, 5.0, size),
+            areas_m2=rng.uniform(0.01, 2.0, size),
+            surface_temperatures_c=rng.uniform(-10.0, 200.0, size),
+            ambient_temperatures_c=rng.uniform(-10.0, 60.0, size),
+        )
+
+        exact = compute_cases_batch(batch)
+        compact = compute_cases_batch(batch, dtype=np.float32)
+
+        for name in (
+            "reynolds_numbers",
+            "prandtl_numbers",
+            "nusselt_numbers",
+            "heat_transfer_coefficients_w_per_m2k",
+            "heat_transfer_rates_w",
+        ):
+            values = getattr(compact, name)
+            self.assertEqual(values.dtype, np.float32)
+            relative_error = np.abs(values / getattr(exact, name) - 1.0)
+            self.assertLess(float(np.max(relative_error)), FLOAT32_RELATIVE_ERROR_BOUND, name)
+        with self.assertRaises(ValueError):
+            compute_cases_batch(batch, dtype=np.float16)
+
+    def test_float32_results_round_trip_through_serialized_buffers(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.SPHERE_CROSSFLOW,
+            velocity_m_per_s=4.0,
+            characteristic_length_m=0.03,
+            flow_length_m=0.03,
+            area_m2=0.003,
+            surface_temperature_c=90.0,
+            ambient_temperature_c=20.0,
+        )
+        batch = ConvectionBatchInputs.from_base(base_inputs, velocities_m_per_s=np.geomspace(0.05, 60.0, 25))
+        compact = compute_cases_batch(batch, dtype=np.float32)
+        exact = compute_cases_batch(batch)
+
+        payload = compact.to_bytes()
+        restored = ConvectionBatchResult.from_buffer(payload)
+
+        self.assertLess(len(payload), len(exact.to_bytes()))
+        self.assertEqual(restored.heat_transfer_rates_w.dtype, np.float32)
+        np.testing.assert_array_equal(restored.heat_transfer_rates_w, compact.heat_transfer_rates_w)
+        np.testing.assert_array_equal(restored.warning_flags, compact.warning_flags)
+        self.assertEqual(ConvectionBatchResult.from_buffer(exact.to_bytes()).nusselt_numbers.dtype, np.float64)
+
+
+class BatchCliTests(unittest.TestCase):
+    def test_csv_batch_preserves_order_and_matches_scalar_results(self) -> None:
+        rows = [
+            {
+                "id": str(index),
+                "case": case.value,
+                "velocity_m_per_s": str(velocity),
+                "characteristic_length_m": "0.02" if case == ConvectionCase.INTERNAL_TUBE else "0.3",
+                "flow_length_m": "0.5",
+                "area_m2": "0.4",
+                "surface_temperature_c": "70",
+                "ambient_temperature_c": "20",
+                "auto_properties": "false" if index % 3 == 0 else "true",
+                "rho_kg_per_m3": "1.1",
+                "mu_pa_s": "1.9e-5",
+                "k_w_per_mk": "0.027",
+                "cp_j_per_kgk": "1007",
+            }
+            for index, (case, velocity) in enumerate(
+                (case, velocity) for velocity in (0.5, 3.0, 25.0) for case in ConvectionCase
+            )
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = Path(directory) / "cases.csv"
+            output_path = Path(directory) / "results.csv"
+            with input_path.open("w", encoding="utf-8", newline="") as handle:
+                writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                exit_code = main(["batch", str(input_path), str(output_path), "--workers", "1", "--chunk-rows", "5"])
+
+            with output_path.open(encoding="utf-8", newline="") as handle:
+                output_rows = list(csv.DictReader(handle))
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([row["id"] for row in output_rows], [row["id"] for row in rows])
+        for row in output_rows:
+            auto_properties = row["auto_properties"] == "true"
+            scalar = compute_case(
+                ConvectionInputs(
+                    case=ConvectionCase(row["case"]),
+                    velocity_m_per_s=float(row["velocity_m_per_s"]),
+                    characteristic_length_m=float(row["characteristic_length_m"]),
+                    flow_length_m=float(row["flow_length_m"]),
+                    area_m2=float(row["area_m2"]),
+                    surface_temperature_c=70.0,
+                    ambient_temperature_c=20.0,
+                    auto_properties=auto_properties,
+                    air_properties=None
+                    if auto_properties
+                    else AirProperties(1.1, 1.9e-5, 0.027, 1007.0, 45.0, "manual override"),
+                )
+            )
+            self.assertAlmostEqual(
+                float(row["heat_transfer_rate_w"]),
+                scalar.heat_transfer_rate_w,
+                delta=1e-9 * scalar.heat_transfer_rate_w,
+            )
+            self.assertEqual(row["regime"], scalar.regime_name)
+            self.assertEqual(int(row["warning_flags"]), int(scalar.warning_flags))
+
+    def test_jsonl_batch_and_invalid_rows(self) -> None:
+        record = {
+            "case": "flat_plate",
+            "velocity_m_per_s": 4.0,
+            "characteristic_length_m": 0.5,
+            "area_m2": 1.0,
+            "surface_temperature_c": 60.0,
+            "ambient_temperature_c": 25.0,
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = Path(directory) / "cases.jsonl"
+            output_path = Path(directory) / "results.jsonl"
+            input_path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                exit_code = main(["batch", str(input_path), str(output_path), "--workers", "1"])
+            output = json.loads(output_path.read_text(encoding="utf-8"))
+
+            input_path.write_text(json.dumps(record) + "\n" + json.dumps({**record, "area_m2": 0.0}) + "\n", encoding="utf-8")
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                failed_exit_code = main(["batch", str(input_path), str(output_path), "--workers", "1"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output["regime"], "laminar")
+        self.assertEqual(output["warnings"], "")
+        self.assertEqual(failed_exit_code, 1)
+        self.assertIn("row 2", stderr.getvalue())
+
+
+class GridSweepTests(unittest.TestCase):
+    def test_grid_sweep_matches_scalar_points_and_keeps_axis_order(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.INTERNAL_TUBE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.02,
+            flow_length_m=0.4,
+            area_m2=0.05,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=25.0,
+        )
+        velocities = [0.5, 2.4, 6.0]
+        diameters = [0.01, 0.02]
+        surface_temperatures = [40.0, 60.0, 90.0, 120.0]
+
+        grid = generate_grid_sweep(
+            base_inputs,
+            {
+                "velocity_m_per_s": velocities,
+                "characteristic_length_m": diameters,
+                "surface_temperature_c": surface_temperatures,
+            },
+            max_workers=2,
+            shard_points=5,
+        )
+
+        self.assertEqual(grid.shape, (3, 2, 4))
+        self.assertEqual(grid.heat_transfer_rates_w.shape, (3, 2, 4))
+        scalar = compute_case(
+            ConvectionInputs(
+                case=ConvectionCase.INTERNAL_TUBE,
+                velocity_m_per_s=velocities[1],
+                characteristic_length_m=diameters[0],
+                flow_length_m=0.4,
+                area_m2=0.05,
+                surface_temperature_c=surface_temperatures[2],
+                ambient_temperature_c=25.0,
+            )
+        )
+        self.assertAlmostEqual(grid.heat_transfer_rates_w[1, 0, 2], scalar.heat_transfer_rate_w)
+
+    def test_float32_grid_sweep_halves_result_storage(self) -> None:
+        base = ConvectionInputs(
+            case=ConvectionCase.INTERNAL_TUBE,
+            velocity_m_per_s=5.0,
+            characteristic_length_m=0.025,
+            flow_length_m=1.0,
+            area_m2=0.1,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=20.0,
+        )
+        axes = {"velocity_m_per_s": np.linspace(0.1, 40.0, 60), "characteristic_length_m": [0.01, 0.025, 0.05]}
+
+        exact = generate_grid_sweep(base, axes, max_workers=1)
+        compact = generate_grid_sweep(base, axes, max_workers=1, shard_points=50, dtype="float32")
+
+        self.assertEqual(compact.heat_transfer_rates_w.dtype, np.float32)
+        self.assertEqual(compact.heat_transfer_rates_w.nbytes * 2, exact.heat_transfer_rates_w.nbytes)
+        np.testing.assert_allclose(
+            compact.heat_transfer_rates_w,
+            exact.heat_transfer_rates_w,
+            rtol=FLOAT32_RELATIVE_ERROR_BOUND,
+        )
+
+    def test_parallel_grid_sweep_matches_serial_sweep(self) -> None:
+        base = ConvectionInputs(
+            case=ConvectionCase.CYLINDER_CROSSFLOW,
+            velocity_m_per_s=5.0,
+            characteristic_length_m=0.05,
+            flow_length_m=0.05,
+            area_m2=0.2,
+            surface_temperature_c=70.0,
+            ambient_temperature_c=20.0,
+        )
+        axes = {"velocity_m_per_s": np.geomspace(0.01, 40.0, 45), "surface_temperature_c": [21.0, 70.0, 150.0, 250.0]}
+
+        for dtype in ("float64", "float32"):
+            with self.subTest(dtype=dtype):
+                serial = generate_grid_sweep(base, axes, max_workers=1, dtype=dtype)
+                parallel = generate_grid_sweep(base, axes, max_workers=2, shard_points=37, dtype=dtype)
+
+                self.assertTrue(parallel.heat_transfer_rates_w.flags.writeable)
+                self.assertEqual(parallel.warning_flags.dtype, np.uint32)
+                for name in (
+                    "reynolds_numbers",
+                    "prandtl_numbers",
+                    "nusselt_numbers",
+                    "heat_transfer_coefficients_w_per_m2k",
+                    "heat_transfer_rates_w",
+                    "warning_flags",
+                ):
+                    np.testing.assert_array_equal(getattr(parallel, name), getattr(serial, name))
+
+    def test_grid_sweep_rejects_unknown_axes(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.5,
+            flow_length_m=0.5,
+            area_m2=1.0,
+            surface_temperature_c=60.0,
+            ambient_temperature_c=25.0,
+        )
+
+        with self.assertRaises(ValueError):
+            generate_grid_sweep(base_inputs, {"pressure_pa": [1.0e5]})
+
+
+class GradientTests(unittest.TestCase):
+    def test_gradients_match_central_differences_in_every_case(self) -> None:
+        for case in ConvectionCase:
+            for velocity in (0.3, 3.0, 30.0):
+                inputs = ConvectionInputs(
+                    case=case,
+                    velocity_m_per_s=velocity,
+                    characteristic_length_m=0.02 if case == ConvectionCase.INTERNAL_TUBE else 0.3,
+                    flow_length_m=0.5,
+                    area_m2=0.4,
+                    surface_temperature_c=70.0,
+                    ambient_temperature_c=20.0,
+                )
+                gradients = compute_case_with_gradients(inputs)
+                scalar = compute_case(inputs)
+
+                self.assertEqual(gradients.result.heat_transfer_rate_w, scalar.heat_transfer_rate_w)
+                self.assertEqual(gradients.result.regime_name, scalar.regime_name)
+                for variable in gradients.variables:
+                    value = getattr(inputs, variable)
+                    step = 1e-6 * abs(value)
+                    upper = compute_case(replace(inputs, **{variable: value + step}))
+                    lower = compute_case(replace(inputs, **{variable: value - step}))
+                    for derivative, upper_value, lower_value in (
+                        (
+                            gradients.heat_transfer_coefficient_derivative(variable),
+                            upper.heat_transfer_coefficient_w_per_m2k,
+                            lower.heat_transfer_coefficient_w_per_m2k,
+                        ),
+                        (
+                            gradients.heat_transfer_rate_derivative(variable),
+                            upper.heat_transfer_rate_w,
+                            lower.heat_transfer_rate_w,
+                        ),
+                    ):
+                        finite_difference = (upper_value - lower_value) / (2.0 * step)
+                        self.assertAlmostEqual(
+                            derivative,
+                            finite_difference,
+                            delta=1e-6 * (abs(finite_difference) + 1e-3),
+                            msg=f"{case.value} V={velocity} d/d{variable}",
+                        )
+
+    def test_selected_variables_and_manual_properties(self) -> None:
+        inputs = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.5,
+            flow_length_m=0.5,
+            area_m2=1.0,
+            surface_temperature_c=60.0,
+            ambient_temperature_c=25.0,
+            auto_properties=False,
+            air_properties=AirProperties(1.1, 1.9e-5, 0.027, 1007.0, 42.5, "manual override"),
+        )
+
+        gradients = compute_case_with_gradients(inputs, ("velocity_m_per_s", "area_m2"))
+
+        self.assertEqual(gradients.jacobian.shape, (2, 2))
+        h = gradients.result.heat_transfer_coefficient_w_per_m2k
+        self.assertAlmostEqual(gradients.heat_transfer_coefficient_derivative("velocity_m_per_s"), 0.5 * h / 2.0)
+        self.assertAlmostEqual(gradients.heat_transfer_rate_derivative("area_m2"), h * 35.0)
+        self.assertEqual(gradients.heat_transfer_coefficient_derivative("area_m2"), 0.0)
+        with self.assertRaises(ValueError):
+            compute_case_with_gradients(inputs, ("pressure_pa",))
+
+    def test_dual_number_arithmetic(self) -> None:
+        x = DualNumber.variable(2.0, 0, 2)
+        y = DualNumber.variable(3.0, 1, 2)
+
+        z = (x * y + 1.0) / x - 2.0**x + x**y
+
+        self.assertAlmostEqual(z.value, 7.0 / 2.0 - 4.0 + 8.0)
+        self.assertAlmostEqual(z.gradient[0], -1.0 / 4.0 - 4.0 * math.log(2.0) + 3.0 * 4.0)
+        self.assertAlmostEqual(z.gradient[1], 1.0 + 8.0 * math.log(2.0))
+        self.assertTrue(x < y <= 3.0)
+
+
+class _ShiftedAirPropertyProvider(CachedAirPropertyProvider):
+    # Evaluates the exact laws 40 °C warmer, so results tell it apart from the default provider.
+    def properties_at(self, film_temperature_c: float) -> AirProperties:
+        return super().properties_at(film_temperature_c + 40.0)
+
+    def dynamic_viscosity_pa_s(self, temperature_c: float) -> float:
+        return super().dynamic_viscosity_pa_s(temperature_c + 40.0)
+
+    def property_arrays(self, film_temperature_c: np.ndarray) -> tuple[np.ndarray, ...]:
+        return super().property_arrays(film_temperature_c + 40.0)
+
+    def dynamic_viscosity_array(self, temperature_c: np.ndarray) -> np.ndarray:
+        return super().dynamic_viscosity_array(temperature_c + 40.0)
+
+
+class CorrelationRegistryTests(unittest.TestCase):
+    def test_vectorized_correlations_use_the_provider_they_are_given(self) -> None:
+        provider = _ShiftedAirPropertyProvider()
+        for case, correlation in (
+            (ConvectionCase.SPHERE_CROSSFLOW, get_correlation(ConvectionCase.SPHERE_CROSSFLOW)),
+            (ConvectionCase.CYLINDER_CROSSFLOW, ZukauskasCylinderCorrelation()),
+        ):
+            with self.subTest(case=case):
+                cases = [
+                    ConvectionInputs(
+                        case=case,
+                        velocity_m_per_s=velocity,
+                        characteristic_length_m=0.04,
+                        flow_length_m=0.04,
+                        area_m2=0.005,
+                        surface_temperature_c=surface_temperature,
+                        ambient_temperature_c=15.0,
+                    )
+                    for velocity, surface_temperature in ((0.5, 60.0), (4.0, 120.0), (12.0, 180.0))
+                ]
+                reynolds_numbers = np.array([200.0, 3000.0, 20000.0])
+                prandtl_numbers = np.array([0.71, 0.70, 0.69])
+                batch = ConvectionBatchInputs.from_inputs(cases)
+
+                nusselt_numbers, _ = correlation.nusselt_array(reynolds_numbers, prandtl_numbers, batch, provider)
+                default_nusselt, _ = correlation.nusselt_array(
+                    reynolds_numbers, prandtl_numbers, batch, CachedAirPropertyProvider()
+                )
+
+                for index, inputs in enumerate(cases):
+                    expected = correlation.outcome(reynolds_numbers[index], prandtl_numbers[index], inputs, provider)
+                    self.assertAlmostEqual(nusselt_numbers[index] / expected.nusselt_number, 1.0, places=12)
+                self.assertFalse(np.allclose(nusselt_numbers, default_nusselt, rtol=1e-6))
+
+    def test_registered_correlation_drives_scalar_and_batch_paths(self) -> None:
+        tubes = [
+            ConvectionInputs(
+                case=ConvectionCase.INTERNAL_TUBE,
+                velocity_m_per_s=velocity,
+                characteristic_length_m=0.025,
+                flow_length_m=length,
+                area_m2=0.1,
+                surface_temperature_c=surface_temperature,
+                ambient_temperature_c=25.0,
+            )
+            for velocity, length, surface_temperature in ((10.0, 2.0, 90.0), (20.0, 0.1, 90.0), (15.0, 2.0, 5.0))
+        ]
+        built_in = get_correlation(ConvectionCase.INTERNAL_TUBE)
+
+        previous = register_correlation(ConvectionCase.INTERNAL_TUBE, DittusBoelterCorrelation())
+        try:
+            scalar_results = [compute_case(tube) for tube in tubes]
+            batch_result = compute_cases_batch(ConvectionBatchInputs.from_inputs(tubes))
+        finally:
+            register_correlation(ConvectionCase.INTERNAL_TUBE, previous)
+
+        self.assertIs(previous, built_in)
+        self.assertIs(get_correlation(ConvectionCase.INTERNAL_TUBE), built_in)
+        for index, (tube, result) in enumerate(zip(tubes, scalar_results)):
+            exponent = 0.4 if tube.surface_temperature_c > tube.ambient_temperature_c else 0.3
+            expected = 0.023 * result.reynolds_number**0.8 * result.prandtl_number**exponent
+            self.assertAlmostEqual(result.nusselt_number, expected, places=9)
+            self.assertAlmostEqual(batch_result.nusselt_numbers[index], expected, places=9)
+            self.assertEqual(batch_result.warning_flags[index], result.warning_flags)
+            self.assertEqual(result.correlation_name, DittusBoelterCorrelation.name)
+        self.assertTrue(scalar_results[1].warning_flags & ConvectionWarning.SHORT_TUBE)
+        self.assertFalse(scalar_results[0].warning_flags & ConvectionWarning.SHORT_TUBE)
+        self.assertEqual(compute_case(tubes[0]).correlation_name, "Gnielinski turbulent internal-flow correlation")
+
+    def test_declared_ranges_flag_out_of_range_inputs(self) -> None:
+        correlation = ZukauskasCylinderCorrelation()
+        inputs = ConvectionInputs(
+            case=ConvectionCase.CYLINDER_CROSSFLOW,
+            velocity_m_per_s=5.0,
+            characteristic_length_m=0.05,
+            flow_length_m=0.05,
+            area_m2=0.1,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=25.0,
+        )
+        churchill_bernstein = compute_case(inputs)
+
+        previous = register_correlation(ConvectionCase.CYLINDER_CROSSFLOW, correlation)
+        try:
+            zukauskas = compute_case(inputs)
+            batch_result = compute_cases_batch(ConvectionBatchInputs.from_inputs([inputs]))
+        finally:
+            register_correlation(ConvectionCase.CYLINDER_CROSSFLOW, previous)
+
+        self.assertAlmostEqual(batch_result.nusselt_numbers[0], zukauskas.nusselt_number, places=9)
+        self.assertLess(abs(zukauskas.nusselt_number / churchill_bernstein.nusselt_number - 1.0), 0.2)
+        self.assertEqual(zukauskas.warning_flags, 0)
+        self.assertEqual(
+            applicability_warning_flags(correlation, 2.0e6, 0.1),
+            ConvectionWarning.CORRELATION_REYNOLDS_RANGE | ConvectionWarning.CORRELATION_PRANDTL_RANGE,
+        )
+
+
+class IncrementalEvaluatorTests(unittest.TestCase):
+    def test_scalar_changes_recompute_only_dependent_stages(self) -> None:
+        base = ConvectionInputs(
+            case=ConvectionCase.SPHERE_CROSSFLOW,
+            velocity_m_per_s=3.0,
+            characteristic_length_m=0.05,
+            flow_length_m=0.05,
+            area_m2=0.01,
+            surface_temperature_c=120.0,
+            ambient_temperature_c=20.0,
+        )
+        steps = [
+            (base, 1, 1),
+            (replace(base, area_m2=0.02), 1, 1),
+            (replace(base, area_m2=0.02, velocity_m_per_s=6.0), 1, 2),
+            (replace(base, area_m2=0.02, velocity_m_per_s=6.0, surface_temperature_c=80.0), 2, 3),
+            (replace(base, case=ConvectionCase.CYLINDER_CROSSFLOW, surface_temperature_c=80.0), 2, 4),
+            (replace(base, case=ConvectionCase.CYLINDER_CROSSFLOW, surface_temperature_c=80.0), 2, 4),
+        ]
+        evaluator = IncrementalEvaluator()
+
+        for inputs, property_evaluations, correlation_evaluations in steps:
+            self.assertEqual(evaluator.evaluate(inputs), compute_case(inputs))
+            self.assertEqual(evaluator.property_evaluations, property_evaluations)
+            self.assertEqual(evaluator.correlation_evaluations, correlation_evaluations)
+
+        previous = set_air_property_provider(TabulatedAirPropertyProvider())
+        try:
+            self.assertEqual(evaluator.evaluate(steps[-1][0]), compute_case(steps[-1][0]))
+        finally:
+            set_air_property_provider(previous)
+        self.assertEqual(evaluator.property_evaluations, 3)
+
+    def test_batch_reuses_stages_and_detects_in_place_edits(self) -> None:
+        base = ConvectionInputs(
+            case=ConvectionCase.INTERNAL_TUBE,
+            velocity_m_per_s=5.0,
+            characteristic_length_m=0.025,
+            flow_length_m=1.0,
+            area_m2=0.1,
+            surface_temperature_c=90.0,
+            ambient_temperature_c=20.0,
+        )
+        batch = ConvectionBatchInputs.from_base(base, velocities_m_per_s=np.linspace(0.5, 20.0, 64))
+        evaluator = IncrementalEvaluator()
+        evaluator.evaluate_batch(batch)
+
+        resized = replace(batch, areas_m2=np.linspace(0.1, 1.0, 64))
+        result = evaluator.evaluate_batch(resized)
+        np.testing.assert_array_equal(result.heat_transfer_rates_w, compute_cases_batch(resized).heat_transfer_rates_w)
+        self.assertEqual((evaluator.property_evaluations, evaluator.correlation_evaluations), (1, 1))
+
+        resized.velocities_m_per_s[:] *= 2.0
+        result = evaluator.evaluate_batch(resized)
+        expected = compute_cases_batch(resized)
+        np.testing.assert_array_equal(result.nusselt_numbers, expected.nusselt_numbers)
+        np.testing.assert_array_equal(result.warning_flags, expected.warning_flags)
+        self.assertEqual((evaluator.property_evaluations, evaluator.correlation_evaluations), (1, 2))
+
+    def test_batch_results_cannot_corrupt_reused_stages(self) -> None:
+        base = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=3.0,
+            characteristic_length_m=0.5,
+            flow_length_m=0.5,
+            area_m2=1.0,
+            surface_temperature_c=60.0,
+            ambient_temperature_c=25.0,
+        )
+        batch = ConvectionBatchInputs.from_base(base, velocities_m_per_s=np.linspace(0.5, 20.0, 16))
+        evaluator = IncrementalEvaluator()
+        first = evaluator.evaluate_batch(batch)
+
+        for name in (
+            "reynolds_numbers",
+            "prandtl_numbers",
+            "nusselt_numbers",
+            "heat_transfer_coefficients_w_per_m2k",
+            "warning_flags",
+        ):
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                getattr(first, name)[0] = 0
+        first.heat_transfer_rates_w[:] = 0.0
+
+        resized = replace(batch, areas_m2=np.full(16, 2.0))
+        result = evaluator.evaluate_batch(resized)
+        expected = compute_cases_batch(resized)
+        self.assertEqual(evaluator.correlation_evaluations, 1)
+        np.testing.assert_array_equal(result.nusselt_numbers, expected.nusselt_numbers)
+        np.testing.assert_array_equal(result.heat_transfer_rates_w, expected.heat_transfer_rates_w)
+
+
+class StageProfilingTests(unittest.TestCase):
+    def test_context_manager_records_stages_per_case(self) -> None:
+        inputs = ConvectionInputs(
+            case=ConvectionCase.CYLINDER_CROSSFLOW,
+            velocity_m_per_s=5.0,
+            characteristic_length_m=0.05,
+            flow_length_m=0.05,
+            area_m2=0.1,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=20.0,
+        )
+        expected = compute_case(inputs)
+
+        with profile_stages() as profiler:
+            for _ in range(3):
+                self.assertEqual(compute_case(inputs), expected)
+            compute_case(replace(inputs, case=ConvectionCase.SPHERE_CROSSFLOW))
+
+        self.assertIsNone(get_stage_profiler())
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["validate_inputs"].calls, 4)
+        self.assertEqual(snapshot["result_construction"].calls, 4)
+        self.assertEqual(snapshot["correlation_outcome[cylinder_crossflow]"].calls, 3)
+        self.assertEqual(snapshot["correlation_outcome[sphere_crossflow]"].calls, 1)
+        self.assertTrue(all(timing.total_ns >= 0 for timing in snapshot.values()))
+        report = profiler.report()
+        self.assertIn("resolve_air_properties", report)
+        self.assertIn("share", report.splitlines()[0])
+        compute_case(inputs)
+        self.assertEqual(profiler.snapshot()["validate_inputs"].calls, 4)
+
+    def test_environment_variable_reports_at_exit(self) -> None:
+        script = (
+            "from convective_heat_model import *\n"
+            "compute_case(ConvectionInputs(ConvectionCase.FLAT_PLATE, 5.0, 0.3, 0.3, 0.1, 80.0, 20.0))\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[1],
+            env={**os.environ, "CONVECTIVE_HEAT_PROFILE": "1"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertIn("correlation_outcome[flat_plate]", completed.stderr)
+
+
+class InverseSolverTests(unittest.TestCase):
+    def test_velocity_solver_hits_target_rate_across_tube_regimes(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.INTERNAL_TUBE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.02,
+            flow_length_m=0.4,
+            area_m2=0.05,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=25.0,
+        )
+
+        for target_q, expected_regime in ((20.0, "laminar"), (30.0, "transition"), (60.0, "turbulent")):
+            solution = solve_for_velocity(base_inputs, target_q=target_q)
+
+            self.assertAlmostEqual(solution.result.heat_transfer_rate_w, target_q, places=6)
+            self.assertEqual(solution.result.regime_name, expected_regime)
+            self.assertLessEqual(solution.evaluations, 20)
+            self.assertFalse(solution.inside_discontinuity)
+
+    def test_length_solver_hits_target_coefficient(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.CYLINDER_CROSSFLOW,
+            velocity_m_per_s=5.0,
+            characteristic_length_m=0.05,
+            flow_length_m=0.05,
+            area_m2=0.2,
+            surface_temperature_c=80.0,
+            ambient_temperature_c=25.0,
+        )
+
+        solution = solve_for_characteristic_length(base_inputs, target_h=30.0)
+
+        self.assertAlmostEqual(solution.result.heat_transfer_coefficient_w_per_m2k, 30.0, places=6)
+
+    def test_target_inside_flat_plate_jump_is_reported(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.5,
+            flow_length_m=0.5,
+            area_m2=1.0,
+            surface_temperature_c=60.0,
+            ambient_temperature_c=25.0,
+        )
+        transition_velocity = 5.0e5 / (compute_case(base_inputs).reynolds_number / 2.0)
+        laminar_h = compute_case(base_inputs.with_velocity(transition_velocity * 0.999999))
+        turbulent_h = compute_case(base_inputs.with_velocity(transition_velocity * 1.000001))
+
+        solution = solve_for_velocity(
+            base_inputs,
+            target_h=0.5
+            * (
+                laminar_h.heat_transfer_coefficient_w_per_m2k
+                + turbulent_h.heat_transfer_coefficient_w_per_m2k
+            ),
+        )
+
+        self.assertTrue(solution.inside_discontinuity)
+        self.assertAlmostEqual(solution.value, transition_velocity, places=6)
+
+    def test_unreachable_target_raises_value_error(self) -> None:
+        base_inputs = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=2.0,
+            characteristic_length_m=0.5,
+            flow_length_m=0.5,
+            area_m2=1.0,
+            surface_temperature_c=60.0,
+            ambient_temperature_c=25.0,
+        )
+
+        with self.assertRaises(ValueError):
+            solve_for_velocity(base_inputs, target_q=-10.0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,120 @@
+import asyncio
+import contextlib
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from convective_heat_model import ConvectionCase, ConvectionInputs, compute_case, generate_velocity_sweep
+from convective_heat_service import ConvectionService, inputs_from_json
+
+
+CASE_PAYLOAD = {
+    "case": "internal_tube",
+    "velocity_m_per_s": 5.0,
+    "characteristic_length_m": 0.025,
+    "flow_length_m": 1.0,
+    "area_m2": 0.1,
+    "surface_temperature_c": 90.0,
+    "ambient_temperature_c": 20.0,
+}
+
+
+async def _request(port: int, method: str, path: str, payload: object = None) -> tuple[int, object]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    headers = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+    response = await reader.readexactly(int(headers["content-length"]))
+    writer.close()
+    await writer.wait_closed()
+    return int(status_line.split()[1]), json.loads(response)
+
+
+class ConvectionServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.service = ConvectionService(batch_window_s=0.05)
+        self.server = await self.service.start(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_concurrent_cases_share_a_batch_and_hit_the_cache(self) -> None:
+        payloads = [
+            dict(CASE_PAYLOAD, case=case.value, velocity_m_per_s=1.0 + index)
+            for index in range(12)
+            for case in ConvectionCase
+        ]
+
+        responses = await asyncio.gather(*(_request(self.port, "POST", "/case", payload) for payload in payloads))
+
+        self.assertEqual(self.service.stats.batches, 1)
+        for payload, (status, response) in zip(payloads, responses):
+            expected = compute_case(inputs_from_json(payload))
+            self.assertEqual(status, 200)
+            self.assertAlmostEqual(response["heat_transfer_rate_w"], expected.heat_transfer_rate_w, places=9)
+            self.assertEqual(response["regime"], expected.regime_name)
+            self.assertEqual(response["warning_flags"], expected.warning_flags)
+            self.assertEqual(response["warnings"], expected.warnings)
+
+        status, _ = await _request(self.port, "POST", "/case", payloads[0])
+        self.assertEqual(status, 200)
+        self.assertEqual(self.service.stats.cache_hits, 1)
+        self.assertEqual(self.service.stats.batches, 1)
+
+    async def test_batch_sweep_and_error_endpoints(self) -> None:
+        status, batch = await _request(self.port, "POST", "/case", [CASE_PAYLOAD, dict(CASE_PAYLOAD, area_m2=0.2)])
+        self.assertEqual(status, 200)
+        self.assertAlmostEqual(batch[1]["heat_transfer_rate_w"], 2.0 * batch[0]["heat_transfer_rate_w"])
+
+        status, sweep = await _request(
+            self.port, "POST", "/sweep", {"inputs": CASE_PAYLOAD, "v_min": 0.5, "v_max": 20.0, "points": 40}
+        )
+        expected = generate_velocity_sweep(inputs_from_json(CASE_PAYLOAD), 0.5, 20.0, 40)
+        self.assertEqual(status, 200)
+        np.testing.assert_allclose(sweep["heat_transfer_rates_w"], expected.heat_transfer_rates_w, rtol=1e-12)
+
+        status, error = await _request(self.port, "POST", "/case", dict(CASE_PAYLOAD, velocity_m_per_s=-1.0))
+        self.assertEqual(status, 400)
+        self.assertIn("positive", error["error"])
+        self.assertEqual((await _request(self.port, "GET", "/health"))[0], 200)
+        self.assertEqual((await _request(self.port, "GET", "/case"))[0], 405)
+        self.assertEqual((await _request(self.port, "GET", "/missing"))[0], 404)
+
+    async def test_unexpected_failures_answer_with_a_server_error(self) -> None:
+        stderr = io.StringIO()
+        with (
+            patch("convective_heat_service.compute_cases_batch", side_effect=RuntimeError("boom")),
+            contextlib.redirect_stderr(stderr),
+        ):
+            status, error = await _request(self.port, "POST", "/case", CASE_PAYLOAD)
+
+        self.assertEqual(status, 500)
+        self.assertEqual(error, {"error": "internal server error"})
+        self.assertIn("RuntimeError: boom", stderr.getvalue())
+        self.assertEqual((await _request(self.port, "POST", "/case", CASE_PAYLOAD))[0], 200)
+
+    def test_refuses_non_local_hosts(self) -> None:
+        with self.assertRaises(ValueError):
+            asyncio.run(ConvectionService().start("0.0.0.0", 0))
+        inputs = inputs_from_json(dict(CASE_PAYLOAD, auto_properties=False, rho_kg_per_m3=1.1, mu_pa_s=1.9e-5,
+                                       k_w_per_mk=0.027, cp_j_per_kgk=1007.0))
+        self.assertIsInstance(inputs, ConvectionInputs)
+        self.assertEqual(inputs.air_properties.film_temperature_c, 55.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import math
+import unittest
+from dataclasses import replace
+
+import numpy as np
+
+from convective_heat_model import AirProperties, ConvectionCase, ConvectionInputs, compute_case
+from convective_heat_transient import simulate_cooling
+
+
+SPHERE_INPUTS = ConvectionInputs(
+    case=ConvectionCase.SPHERE_CROSSFLOW,
+    velocity_m_per_s=3.0,
+    characteristic_length_m=0.05,
+    flow_length_m=0.05,
+    area_m2=math.pi * 0.05**2,
+    surface_temperature_c=180.0,
+    ambient_temperature_c=25.0,
+)
+
+
+class SimulateCoolingTests(unittest.TestCase):
+    def test_constant_coefficient_matches_exponential_decay(self) -> None:
+        inputs = ConvectionInputs(
+            case=ConvectionCase.FLAT_PLATE,
+            velocity_m_per_s=4.0,
+            characteristic_length_m=0.2,
+            flow_length_m=0.2,
+            area_m2=0.04,
+            surface_temperature_c=120.0,
+            ambient_temperature_c=20.0,
+            auto_properties=False,
+            air_properties=AirProperties(1.1, 1.9e-5, 0.027, 1007.0, 70.0, "manual override"),
+        )
+        h = compute_case(inputs).heat_transfer_coefficient_w_per_m2k
+        time_constant_s = 0.3 * 900.0 / (h * inputs.area_m2)
+
+        result = simulate_cooling(inputs, 0.3, 900.0, 2.0 * time_constant_s)
+
+        expected = 20.0 + 100.0 * np.exp(-result.times_s / time_constant_s)
+        np.testing.assert_allclose(result.surface_temperatures_c[:, 0], expected, rtol=1e-5)
+        self.assertEqual(result.times_s[-1], 2.0 * time_constant_s)
+
+    def test_coefficient_reuse_tracks_exact_reevaluation(self) -> None:
+        reused = simulate_cooling(SPHERE_INPUTS, 0.5, 900.0, 3600.0)
+        exact = simulate_cooling(
+            SPHERE_INPUTS, 0.5, 900.0, 3600.0, film_temperature_tolerance_c=0.0, rtol=1e-10, atol_k=1e-10
+        )
+
+        self.assertAlmostEqual(reused.final_temperatures_c[0], exact.final_temperatures_c[0], delta=1e-3)
+        self.assertLess(reused.correlation_evaluations, reused.derivative_evaluations)
+        self.assertTrue(np.all(np.diff(reused.surface_temperatures_c[:, 0]) < 0.0))
+        final_q = compute_case(replace(SPHERE_INPUTS, surface_temperature_c=reused.final_temperatures_c[0]))
+        self.assertAlmostEqual(reused.heat_transfer_rates_w[-1, 0], final_q.heat_transfer_rate_w, delta=1e-3)
+
+    def test_batched_parts_match_individual_runs(self) -> None:
+        parts = [
+            SPHERE_INPUTS,
+            replace(SPHERE_INPUTS, case=ConvectionCase.CYLINDER_CROSSFLOW, velocity_m_per_s=10.0),
+            replace(SPHERE_INPUTS, surface_temperature_c=10.0),
+        ]
+        masses = [0.5, 1.0, 0.2]
+
+        batched = simulate_cooling(parts, masses, 900.0, 600.0)
+
+        for index, (part, mass) in enumerate(zip(parts, masses)):
+            single = simulate_cooling(part, mass, 900.0, 600.0)
+            self.assertAlmostEqual(batched.final_temperatures_c[index], single.final_temperatures_c[0], delta=1e-3)
+        self.assertGreater(batched.final_temperatures_c[2], 10.0)
+
+    def test_invalid_arguments_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            simulate_cooling(SPHERE_INPUTS, 0.0, 900.0, 10.0)
+        with self.assertRaises(ValueError):
+            simulate_cooling(SPHERE_INPUTS, 0.5, 900.0, 0.0)
+        with self.assertRaises(ValueError):
+            simulate_cooling([], 0.5, 900.0, 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
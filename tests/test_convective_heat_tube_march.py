@@ -0,0 +1,99 @@
+import math
+import unittest
+from dataclasses import replace
+
+import numpy as np
+
+from convective_heat_model import (
+    AirProperties,
+    ConvectionCase,
+    ConvectionInputs,
+    ConvectionWarning,
+    TabulatedAirPropertyProvider,
+    compute_case,
+    set_air_property_provider,
+)
+from convective_heat_tube_march import march_internal_tube
+
+
+TUBE_INPUTS = ConvectionInputs(
+    case=ConvectionCase.INTERNAL_TUBE,
+    velocity_m_per_s=5.0,
+    characteristic_length_m=0.02,
+    flow_length_m=3.0,
+    area_m2=1.0,
+    surface_temperature_c=150.0,
+    ambient_temperature_c=20.0,
+)
+
+
+class MarchInternalTubeTests(unittest.TestCase):
+    def test_constant_properties_reproduce_whole_tube_correlation(self) -> None:
+        properties = AirProperties(1.1, 1.9e-5, 0.027, 1007.0, 60.0, "manual override")
+        for velocity in (0.5, 1.4, 10.0):
+            inputs = replace(
+                TUBE_INPUTS,
+                velocity_m_per_s=velocity,
+                flow_length_m=2.0,
+                auto_properties=False,
+                air_properties=properties,
+            )
+            whole_tube = compute_case(inputs)
+            mass_flow_rate = 1.1 * velocity * math.pi * 0.01**2
+            transfer_units = whole_tube.heat_transfer_coefficient_w_per_m2k * math.pi * 0.02 * 2.0 / (
+                mass_flow_rate * 1007.0
+            )
+            expected_outlet = 150.0 - 130.0 * math.exp(-transfer_units)
+
+            for segments in (1, 37, 1000):
+                result = march_internal_tube(inputs, segments)
+                self.assertAlmostEqual(result.outlet_temperatures_c[0], expected_outlet, places=9)
+
+    def test_marching_converges_with_segment_count_and_balances_energy(self) -> None:
+        coarse = march_internal_tube(TUBE_INPUTS, 50)
+        fine = march_internal_tube(TUBE_INPUTS, 2000)
+
+        self.assertAlmostEqual(coarse.heat_transfer_rates_w[0], fine.heat_transfer_rates_w[0], delta=1e-3)
+        self.assertTrue(np.all(np.diff(fine.bulk_temperatures_c[0]) > 0.0))
+        self.assertLess(fine.outlet_temperatures_c[0], 150.0)
+        self.assertEqual(fine.bulk_temperatures_c.shape, (1, 2001))
+        self.assertEqual(fine.segment_heat_transfer_rates_w.shape, (1, 2000))
+        laminar = march_internal_tube(replace(TUBE_INPUTS, velocity_m_per_s=0.5), 200)
+        entry_coefficients = laminar.heat_transfer_coefficients_w_per_m2k[0]
+        self.assertTrue(np.all(np.diff(entry_coefficients[:5]) < 0.0))
+        self.assertGreater(entry_coefficients[0], 2.0 * entry_coefficients[-1])
+
+    def test_many_tubes_match_single_runs_across_blocks(self) -> None:
+        tubes = [replace(TUBE_INPUTS, velocity_m_per_s=velocity) for velocity in (0.3, 2.5, 20.0)]
+        tubes.append(replace(TUBE_INPUTS, velocity_m_per_s=5.0, flow_length_m=0.1))
+
+        batched = march_internal_tube(tubes, 100, block_cells=150)
+
+        for index, tube in enumerate(tubes):
+            single = march_internal_tube(tube, 100)
+            np.testing.assert_allclose(batched.bulk_temperatures_c[index], single.bulk_temperatures_c[0], rtol=1e-12)
+        self.assertTrue(np.all(batched.warning_flags[3] & ConvectionWarning.SHORT_TUBE))
+        self.assertFalse(np.any(batched.warning_flags[2] & ConvectionWarning.SHORT_TUBE))
+
+    def test_tabulated_provider_matches_exact_properties(self) -> None:
+        tubes = [TUBE_INPUTS, replace(TUBE_INPUTS, velocity_m_per_s=6.0)]
+        for segments in (2, 50):
+            with self.subTest(segments=segments):
+                exact = march_internal_tube(tubes, segments)
+                previous = set_air_property_provider(TabulatedAirPropertyProvider())
+                try:
+                    tabulated = march_internal_tube(tubes, segments)
+                finally:
+                    set_air_property_provider(previous)
+
+                np.testing.assert_allclose(tabulated.bulk_temperatures_c, exact.bulk_temperatures_c, rtol=1e-9)
+
+    def test_invalid_inputs_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            march_internal_tube(replace(TUBE_INPUTS, case=ConvectionCase.FLAT_PLATE))
+        with self.assertRaises(ValueError):
+            march_internal_tube(TUBE_INPUTS, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()